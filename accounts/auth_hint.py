@@ -0,0 +1,86 @@
+# accounts/auth_hint.py
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.core import signing
+from django.http import HttpRequest, HttpResponse
+from django.utils.crypto import salted_hmac
+from django.utils.http import quote_etag
+
+SALT = "accounts.auth_hint"
+
+
+@dataclass(frozen=True)
+class AuthStatus:
+    is_authenticated: bool
+    username: str
+
+    @classmethod
+    def from_user(cls, user) -> "AuthStatus":
+        return cls(is_authenticated=user.is_authenticated, username=user.username or "anonymous")
+
+    def as_dict(self) -> dict:
+        return {"is_authenticated": self.is_authenticated, "username": self.username}
+
+    def get_etag(self) -> str:
+        payload = json.dumps(self.as_dict(), sort_keys=True).encode("utf-8")
+        return quote_etag(hashlib.sha256(payload).hexdigest()[:16])
+
+
+ANONYMOUS = AuthStatus(is_authenticated=False, username="anonymous")
+
+
+def get_session_fingerprint(session_key: str) -> str:
+    # 쿠키에 세션키가 드러나지 않도록, 세션키 대신 HMAC 값을 저장합니다.
+    return salted_hmac(SALT, session_key).hexdigest()[:16]
+
+
+def read_auth_hint(request: HttpRequest) -> Optional[AuthStatus]:
+    """DB 조회 없이 쿠키만으로 인증 상태를 반환합니다. 확인할 수 없으면 None.
+
+    - 세션 쿠키가 없으면 익명 사용자입니다.
+    - 인증 힌트 쿠키는 서명과 만료 시각, 그리고 발급 당시의 세션키를 검증합니다.
+      로그인/로그아웃 시에 세션키가 바뀌므로, 이전 세션에서 발급된 힌트는 사용되지 않습니다.
+    """
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not session_key:
+        return ANONYMOUS
+
+    value = request.COOKIES.get(settings.AUTH_HINT_COOKIE_NAME)
+    if not value:
+        return None
+
+    try:
+        data = signing.loads(value, salt=SALT, max_age=settings.AUTH_HINT_MAX_AGE)
+    except signing.BadSignature:  # 만료(SignatureExpired) 포함
+        return None
+
+    if not isinstance(data, dict) or data.get("s") != get_session_fingerprint(session_key):
+        return None
+    return AuthStatus(is_authenticated=bool(data.get("a")), username=str(data.get("u", "")))
+
+
+def set_auth_hint(response: HttpResponse, request: HttpRequest, status: AuthStatus) -> None:
+    """세션에서 확인한 인증 상태를 힌트 쿠키로 발급합니다. 유효한 세션 쿠키가 있을 때만 발급합니다."""
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not session_key or request.session.session_key != session_key:
+        # 세션이 만료되어 세션 쿠키가 삭제될 예정이라면, 다음 요청은 세션 쿠키 없이 익명으로 처리됩니다.
+        response.delete_cookie(settings.AUTH_HINT_COOKIE_NAME, samesite=settings.SESSION_COOKIE_SAMESITE)
+        return
+
+    value = signing.dumps(
+        {"s": get_session_fingerprint(session_key), "a": status.is_authenticated, "u": status.username},
+        salt=SALT,
+    )
+    response.set_cookie(
+        settings.AUTH_HINT_COOKIE_NAME,
+        value,
+        max_age=settings.AUTH_HINT_MAX_AGE,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite=settings.SESSION_COOKIE_SAMESITE,
+    )
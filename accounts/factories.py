@@ -1,4 +1,7 @@
+import functools
+
 import factory
+from django.contrib.auth.hashers import make_password
 from faker import Faker
 
 from .models import User
@@ -37,3 +40,20 @@ class UserFactory(factory.django.DjangoModelFactory):
         if extracted:
             for permission in extracted:
                 self.user_permissions.add(permission)
+
+
+@functools.cache
+def get_prehashed_password(raw_password: str = '12345678') -> str:
+    # PBKDF2 해싱은 의도적으로 느리므로, 대량 생성 시에는 한 번만 해싱하여 재사용합니다.
+    return make_password(raw_password)
+
+
+class BulkUserFactory(UserFactory):
+    """대량 생성(build + bulk_create)용 팩토리
+
+    - 모든 사용자가 미리 해싱된 하나의 비밀번호를 공유합니다.
+    - username에 순번을 붙여 유일성을 보장합니다.
+    """
+
+    username = factory.Sequence(lambda n: f'{fake.user_name()}{n}')
+    password = factory.LazyFunction(get_prehashed_password)
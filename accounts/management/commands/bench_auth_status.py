@@ -0,0 +1,52 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import User
+from mysite.benchmarks import warn_if_debug
+
+
+class Command(BaseCommand):
+    help = "Compare the auth status endpoint against profile_json (requests per second and queries per request)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        warn_if_debug(self)
+
+        # 벤치마크용 사용자/세션은 마지막에 롤백합니다.
+        with transaction.atomic():
+            user = User.objects.create_user(username="bench-auth-status", password=None)
+            client = Client(HTTP_HOST=(settings.ALLOWED_HOSTS or ["localhost"])[0].lstrip("."))
+            client.force_login(user)
+
+            count = options["requests"]
+            profile_url = reverse("accounts:profile_json")
+            auth_status_url = reverse("accounts:auth_status")
+
+            # 첫 요청에서 인증 힌트 쿠키를 발급받습니다.
+            etag = client.get(auth_status_url)["ETag"]
+
+            self.run(client, "profile_json", profile_url, count)
+            self.run(client, "auth_status", auth_status_url, count)
+            self.run(client, "auth_status (304)", auth_status_url, count, HTTP_IF_NONE_MATCH=etag)
+
+            transaction.set_rollback(True)
+
+    def run(self, client: Client, label: str, url: str, count: int, **headers) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(count):
+                response = client.get(url, **headers)
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{label:<20} {count / elapsed:>10,.0f} req/s  {len(queries) / count:>5.1f} queries/request"
+            f"  (status {response.status_code})"
+        )
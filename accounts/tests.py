@@ -1,3 +1,83 @@
+from django.conf import settings
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .models import User
+
+
+class AuthStatusTest(TestCase):
+    url = reverse("accounts:auth_status")
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="tester", password="12345678")
+
+    def test_anonymous_without_session_does_not_query(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.json(), {"is_authenticated": False, "username": "anonymous"})
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("Cookie", response["Vary"])
+        self.assertTrue(response.has_header("ETag"))
+
+    def test_hint_cookie_skips_session_and_user_lookup(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.json(), {"is_authenticated": True, "username": "tester"})
+        self.assertIn(settings.AUTH_HINT_COOKIE_NAME, response.cookies)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.json(), {"is_authenticated": True, "username": "tester"})
+
+    def test_revalidation_returns_not_modified(self):
+        self.client.force_login(self.user)
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_hint_from_previous_session_is_ignored(self):
+        self.client.force_login(self.user)
+        self.client.get(self.url)
+        hint = self.client.cookies[settings.AUTH_HINT_COOKIE_NAME].value
+
+        # 로그아웃 후 새 세션에서는 이전 세션의 힌트를 사용하지 않습니다.
+        self.client.logout()
+        self.client.session.save()  # 새 익명 세션
+        self.assertIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
+        self.client.cookies[settings.AUTH_HINT_COOKIE_NAME] = hint
+        response = self.client.get(self.url)
+        self.assertEqual(response.json(), {"is_authenticated": False, "username": "anonymous"})
+
+    def test_tampered_hint_is_ignored(self):
+        self.client.force_login(self.user)
+        self.client.cookies[settings.AUTH_HINT_COOKIE_NAME] = "tampered"
+        response = self.client.get(self.url)
+        self.assertEqual(response.json(), {"is_authenticated": True, "username": "tester"})
+
+
+class AsyncFormViewTest(TestCase):
+    def test_login_form_and_submit(self):
+        User.objects.create_user(username="tester", password="12345678")
+        url = reverse("accounts:login")
+
+        response = self.client.get(url, {"next": "/melon/"})
+        self.assertContains(response, "csrfmiddlewaretoken")
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        # 폼은 같은 주소(next 쿼리 포함)로 제출됩니다.
+        response = self.client.post(f"{url}?next=/melon/", {"username": "tester", "password": "12345678"})
+        self.assertRedirects(response, "/melon/", fetch_redirect_response=False)
+
+        # 로그인된 사용자도 폼 페이지를 렌더링할 수 있습니다. (레이아웃의 user)
+        response = self.client.get(reverse("accounts:signup"))
+        self.assertContains(response, reverse("accounts:profile"))
+
+    def test_signup_submit(self):
+        response = self.client.post(
+            reverse("accounts:signup"),
+            {"username": "new-user", "password1": "pw-Complex-1234", "password2": "pw-Complex-1234"},
+        )
+        self.assertRedirects(response, reverse("accounts:login"), fetch_redirect_response=False)
+        self.assertTrue(User.objects.filter(username="new-user").exists())
@@ -9,4 +9,5 @@ urlpatterns = [
     path('logout/', views.logout, name='logout'),
     path('profile/', views.profile, name='profile'),
     path('profile.json', views.profile_json, name='profile_json'),
+    path('auth-status.json', views.auth_status, name='auth_status'),
 ]
@@ -1,11 +1,17 @@
 from django.contrib.auth.views import LoginView as DjangoLoginView
 from django.contrib.auth.views import LogoutView as DjangoLogoutView
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.shortcuts import render
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.views.decorators.http import require_safe
 from django.views.generic import CreateView
 
+from mysite.async_views import async_form_view
+
+from .auth_hint import AuthStatus, read_auth_hint, set_auth_hint
 from .forms import LoginForm, SignupForm
 
 
@@ -15,7 +21,7 @@ class SignupView(CreateView):
     success_url = reverse_lazy("accounts:login")
 
 
-signup = SignupView.as_view()
+signup = async_form_view(SignupView)
 
 
 class LoginView(DjangoLoginView):
@@ -29,7 +35,7 @@ class LoginView(DjangoLoginView):
     # success_url_allowed_hosts = settings.FRONT_HOST
 
 
-login = LoginView.as_view()
+login = async_form_view(LoginView)
 
 
 class LogoutView(DjangoLogoutView):
@@ -46,8 +52,35 @@ def profile(request):
     return render(request, 'accounts/profile.html')
 
 
-def profile_json(request):
+async def profile_json(request):
+    user = await request.auser()
     return JsonResponse({
-        'is_authenticated': request.user.is_authenticated,
-        'username': request.user.username or 'anonymous',
+        'is_authenticated': user.is_authenticated,
+        'username': user.username or 'anonymous',
     })
+
+
+@require_safe
+async def auth_status(request):
+    """프론트엔드에서 페이지마다 호출하는 인증 상태 조회. (profile_json과 같은 응답)
+
+    서명된 인증 힌트 쿠키가 유효하면 세션/사용자를 DB에서 조회하지 않고, 스레드 전환 없이 이벤트 루프에서 응답합니다.
+    힌트가 없거나 만료되었을 때에만 세션에서 확인하여 힌트를 새로 발급합니다.
+    """
+    status = read_auth_hint(request)
+    is_hint_valid = status is not None
+    if not is_hint_valid:
+        status = AuthStatus.from_user(await request.auser())
+
+    etag = status.get_etag()
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = JsonResponse(status.as_dict())
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, max_age=settings.AUTH_STATUS_MAX_AGE)
+    # 로그인/로그아웃으로 쿠키가 바뀌면 브라우저 캐시를 사용하지 않도록 합니다.
+    patch_vary_headers(response, ["Cookie"])
+
+    if not is_hint_valid:
+        set_auth_hint(response, request, status)
+    return response
@@ -0,0 +1,332 @@
+# app/frontend.py
+
+import base64
+import functools
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.template.utils import get_app_template_dirs
+
+
+# 버전을 고정한 프론트엔드 의존성. 버전을 올릴 때에는 주소를 변경하고, 받은 파일을 검토한 후
+# vendor_frontend --update-pins 명령으로 PINS_PATH의 SRI 해시를 갱신합니다.
+VENDOR_ASSETS = {
+    "htmx": "https://unpkg.com/htmx.org@2.0.2/dist/htmx.min.js",
+    "htmx-ext-ws": "https://unpkg.com/htmx-ext-ws@2.0.1/ws.js",
+    "alpinejs": "https://unpkg.com/alpinejs@3.14.1/dist/cdn.min.js",
+}
+
+TAILWIND_VERSION = "3.4.10"
+TAILWIND_CLI_URL = "https://github.com/tailwindlabs/tailwindcss/releases/download/v{version}/tailwindcss-{platform}"
+TAILWIND_CDN_URL = "https://cdn.tailwindcss.com"
+
+
+# 내려받은 파일의 SRI 해시 (주소 -> "sha384-...")
+PINS_PATH = Path(__file__).resolve().parent / "frontend_pins.json"
+
+
+@dataclass(frozen=True)
+class Layout:
+    template_name: str
+    # <head>에서 바로 실행하는 스크립트. 순서대로 이어 붙입니다. (htmx 확장은 htmx 다음에 위치해야 합니다)
+    # 본문의 인라인 스크립트와 hx-on 속성에서 htmx 객체를 사용하므로, defer 하지 않습니다.
+    scripts: tuple
+    # 문서를 파싱한 후에 실행하는 스크립트 (alpine.js는 defer로 불러오도록 안내하고 있습니다)
+    deferred_scripts: tuple = ()
+
+
+# 기본 레이아웃(base 템플릿)별로 스크립트 번들(js, deferred_js)을 생성합니다.
+LAYOUTS = {
+    "base": Layout("base.html", ("htmx",), ("alpinejs",)),
+    "chat": Layout("chat/base.html", ("htmx", "htmx-ext-ws"), ("alpinejs",)),
+}
+
+BUNDLE_DIR_NAME = "vendor"
+MANIFEST_NAME = "bundles.json"
+
+
+def get_bundle_dir() -> Path:
+    return Path(settings.STATICFILES_DIRS[0]) / BUNDLE_DIR_NAME
+
+
+def get_cache_dir() -> Path:
+    return Path(settings.FRONTEND_VENDOR_CACHE_DIR)
+
+
+class OfflineError(Exception):
+    pass
+
+
+class ChecksumError(Exception):
+    pass
+
+
+class MissingPinError(ChecksumError):
+    """PINS_PATH에 SRI 해시가 기록되지 않은 파일"""
+
+
+def get_integrity(content: bytes) -> str:
+    """<script integrity> 속성과 같은 형식의 SRI 해시를 반환합니다."""
+    return "sha384-" + base64.b64encode(hashlib.sha384(content).digest()).decode("ascii")
+
+
+@functools.cache
+def load_pins() -> Dict[str, str]:
+    try:
+        return json.loads(PINS_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def write_pins(pins: Dict[str, str]) -> Path:
+    PINS_PATH.write_text(json.dumps(pins, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    load_pins.cache_clear()
+    return PINS_PATH
+
+
+def verify_integrity(url: str, content: bytes, pins: Dict[str, str]) -> None:
+    expected = pins.get(url)
+    if expected is None:
+        raise MissingPinError(f"{url} 의 SRI 해시가 없습니다. 파일을 검토한 후 --update-pins 옵션으로 기록해주세요.")
+    actual = get_integrity(content)
+    if actual != expected:
+        raise ChecksumError(f"{url} 의 SRI 해시가 일치하지 않습니다. (기록 : {expected}, 실제 : {actual})")
+
+
+def fetch(url: str, offline: bool = False, verify: bool = True) -> bytes:
+    """주소의 내용을 반환합니다. 한 번 받은 파일은 캐시 디렉토리에 보관하여, 이후에는 네트워크 없이 사용합니다.
+
+    verify=True이면 PINS_PATH에 기록된 SRI 해시와 비교하여, 다르거나 기록이 없으면 ChecksumError를 발생시킵니다.
+    """
+    cache_path = get_cache_dir() / "downloads" / hashlib.sha256(url.encode("utf-8")).hexdigest()
+    if cache_path.exists():
+        content = cache_path.read_bytes()
+    elif offline:
+        raise OfflineError(f"{url} 의 캐싱된 파일이 없습니다. 네트워크에 연결된 상태에서 먼저 실행해주세요.")
+    else:
+        request = Request(url, headers={"User-Agent": "pyhub-htmx-examples"})
+        with urlopen(request, timeout=30) as response:
+            content = response.read()
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, cache_path)
+
+    if verify:
+        verify_integrity(url, content, load_pins())
+    return content
+
+
+#
+# Tailwind 클래스 추출
+#
+
+# Tailwind 기본 추출기와 같이, 따옴표 안의 문자열을 공백으로 나눈 토큰을 클래스 후보로 사용합니다.
+# (class="...", :class="{ '...': ... }", Python 코드의 css_class="..." 등을 모두 포함)
+QUOTED_RE = re.compile(r""""([^"]*)"|'([^']*)'|`([^`]*)`""", re.S)
+CANDIDATE_RE = re.compile(r"^!?-?[a-z@\[][a-zA-Z0-9_:/.%#\[\]()\-!]*$")
+EXTENDS_RE = re.compile(r"""\{%\s*extends\s+["']([^"']+)["']\s*%\}""")
+
+
+def get_template_dirs() -> List[Path]:
+    dirs = []
+    for engine in settings.TEMPLATES:
+        dirs.extend(Path(d) for d in engine.get("DIRS", []))
+    dirs.extend(Path(d) for d in get_app_template_dirs("templates"))
+    return dirs
+
+
+def iter_template_files() -> Iterable[tuple]:
+    """(템플릿 이름, 경로)를 반환합니다."""
+    for template_dir in get_template_dirs():
+        for path in sorted(template_dir.rglob("*.html")):
+            yield path.relative_to(template_dir).as_posix(), path
+
+
+def iter_python_files() -> Iterable[Path]:
+    # 폼 헬퍼(crispy) 등 파이썬 코드에서 지정한 클래스도 포함합니다. (프로젝트 소스만)
+    base_dir = Path(settings.BASE_DIR)
+    for path in sorted(base_dir.rglob("*.py")):
+        parts = path.relative_to(base_dir).parts
+        if parts[0] in ("var", "node_modules") or "migrations" in parts or parts[0].startswith("."):
+            continue
+        yield path
+
+
+def extract_candidates(text: str) -> Set[str]:
+    candidates = set()
+    for groups in QUOTED_RE.findall(text):
+        quoted = "".join(groups)
+        for token in quoted.split():
+            if CANDIDATE_RE.match(token):
+                candidates.add(token)
+        # :class="{ 'text-red-500': error }" 처럼 다른 따옴표로 감싼 문자열이 안에 있는 경우
+        if any(quote in quoted for quote in "\"'`"):
+            candidates |= extract_candidates(quoted)
+    return candidates
+
+
+def get_root_layout(template_name: str, parents: Dict[str, str]) -> Optional[str]:
+    """extends 관계를 따라 올라가 레이아웃 이름을 찾습니다. extends 하지 않는 조각 템플릿은 None."""
+    layout_names = {layout.template_name: name for name, layout in LAYOUTS.items()}
+    seen = set()
+    while template_name not in layout_names:
+        if template_name in seen or template_name not in parents:
+            return None
+        seen.add(template_name)
+        template_name = parents[template_name]
+    return layout_names[template_name]
+
+
+def collect_layout_candidates() -> Dict[str, Set[str]]:
+    """레이아웃별 클래스 후보를 수집합니다.
+
+    레이아웃을 extends 하는 템플릿은 해당 레이아웃에만, include 되는 조각 템플릿/컴포넌트와
+    파이썬 코드의 후보는 모든 레이아웃에 포함합니다.
+    """
+    texts: Dict[str, str] = {}
+    parents: Dict[str, str] = {}
+    for template_name, path in iter_template_files():
+        # 같은 이름이 여러 디렉토리에 있으면, 템플릿 로더처럼 먼저 찾은 파일을 사용합니다.
+        if template_name in texts:
+            continue
+        text = path.read_text(encoding="utf-8")
+        texts[template_name] = text
+        match = EXTENDS_RE.search(text)
+        if match:
+            parents[template_name] = match.group(1)
+
+    shared: Set[str] = set()
+    for path in iter_python_files():
+        shared |= extract_candidates(path.read_text(encoding="utf-8"))
+
+    candidates = {name: set() for name in LAYOUTS}
+    for template_name, text in texts.items():
+        layout_name = get_root_layout(template_name, parents)
+        if layout_name is None:
+            shared |= extract_candidates(text)
+        else:
+            candidates[layout_name] |= extract_candidates(text)
+
+    return {name: layout_candidates | shared for name, layout_candidates in candidates.items()}
+
+
+#
+# Tailwind CSS 빌드
+#
+
+def get_tailwind_platform() -> str:
+    system = platform.system().lower()
+    machine = platform.machine().lower()
+    arch = "arm64" if machine in ("arm64", "aarch64") else "x64"
+    if system == "darwin":
+        return f"macos-{arch}"
+    if system == "windows":
+        return f"windows-{arch}.exe"
+    return f"linux-{arch}"
+
+
+def get_tailwind_cli_url() -> str:
+    return TAILWIND_CLI_URL.format(version=TAILWIND_VERSION, platform=get_tailwind_platform())
+
+
+def get_tailwind_cli(offline: bool = False, verify: bool = True) -> str:
+    """Tailwind standalone CLI 경로. 설정/PATH에 없으면 고정 버전을 받아 캐시 디렉토리에 보관합니다."""
+    cli = settings.TAILWIND_CLI or shutil.which("tailwindcss")
+    if cli:
+        return cli
+
+    url = get_tailwind_cli_url()
+    cli_path = get_cache_dir() / f"tailwindcss-{TAILWIND_VERSION}-{get_tailwind_platform()}"
+    if not cli_path.exists():
+        content = fetch(url, offline=offline, verify=verify)
+        cli_path.write_bytes(content)
+        cli_path.chmod(0o755)
+    return str(cli_path)
+
+
+def build_css(cli: str, candidates: Set[str]) -> bytes:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        # 추출한 후보만 content로 지정하여, 사용하는 클래스만 포함된 CSS를 생성합니다.
+        content_path = tmp_dir / "candidates.html"
+        content_path.write_text(" ".join(sorted(candidates)), encoding="utf-8")
+        input_path = tmp_dir / "input.css"
+        input_path.write_text("@tailwind base;\n@tailwind components;\n@tailwind utilities;\n", encoding="utf-8")
+        output_path = tmp_dir / "output.css"
+
+        subprocess.run(
+            [cli, "--input", str(input_path), "--output", str(output_path), "--content", str(content_path), "--minify"],
+            check=True,
+            capture_output=True,
+        )
+        return output_path.read_bytes()
+
+
+#
+# 번들
+#
+
+def write_fingerprinted(layout_name: str, extension: str, content: bytes) -> str:
+    """내용 해시가 붙은 파일명으로 저장하고, static 기준 경로를 반환합니다."""
+    bundle_dir = get_bundle_dir()
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    name = f"{layout_name}.{digest}.{extension}"
+
+    # 같은 레이아웃의 이전 번들은 삭제합니다.
+    for old_path in bundle_dir.glob(f"{layout_name}.*.{extension}"):
+        if old_path.name != name:
+            old_path.unlink()
+    (bundle_dir / name).write_bytes(content)
+    return f"{BUNDLE_DIR_NAME}/{name}"
+
+
+def bundle_scripts(asset_names: Iterable[str], offline: bool = False, verify: bool = True) -> bytes:
+    parts = []
+    for asset_name in asset_names:
+        url = VENDOR_ASSETS[asset_name]
+        content = fetch(url, offline=offline, verify=verify)
+        parts.append(f"/* {asset_name} : {url} */\n".encode("utf-8") + content.rstrip())
+    # 각 파일이 세미콜론 없이 끝나더라도 안전하게 이어지도록 구분합니다.
+    return b"\n;\n".join(parts) + b"\n"
+
+
+def write_manifest(bundles: Dict[str, Dict[str, str]]) -> Path:
+    path = get_bundle_dir() / MANIFEST_NAME
+    path.write_text(json.dumps(bundles, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+_manifest_cache: Dict[str, object] = {"mtime": None, "bundles": {}}
+
+
+def load_manifest() -> Dict[str, Dict[str, str]]:
+    """번들 목록을 반환합니다. 운영 환경에서는 한 번만 읽고, DEBUG에서는 파일이 바뀌면 다시 읽습니다."""
+    path = get_bundle_dir() / MANIFEST_NAME
+    if _manifest_cache["mtime"] is not None and not settings.DEBUG:
+        return _manifest_cache["bundles"]
+
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime, bundles = 0, {}
+    else:
+        if mtime == _manifest_cache["mtime"]:
+            return _manifest_cache["bundles"]
+        bundles = json.loads(path.read_text(encoding="utf-8"))
+
+    _manifest_cache.update(mtime=mtime, bundles=bundles)
+    return bundles
@@ -0,0 +1,109 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple
+
+from asgiref.sync import SyncToAsync, async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+
+from accounts.models import User
+from mysite.benchmarks import warn_if_debug
+
+
+class Scenario(NamedTuple):
+    label: str
+    method: str
+    url: str
+    authenticated: bool = False
+    headers: Dict[str, str] = {}
+    data: Dict[str, str] = {}
+
+
+def get_scenarios() -> List[Scenario]:
+    htmx = {"HX-Request": "true"}
+    return [
+        Scenario("profile.json (anonymous)", "get", reverse("accounts:profile_json")),
+        Scenario("profile.json", "get", reverse("accounts:profile_json"), authenticated=True),
+        Scenario("auth-status.json", "get", reverse("accounts:auth_status"), authenticated=True),
+        Scenario("login form", "get", reverse("accounts:login")),
+        Scenario("signup form", "get", reverse("accounts:signup")),
+        Scenario("song list", "get", reverse("melon:song_list")),
+        Scenario("song list (htmx, cached)", "get", reverse("melon:song_list"), headers=htmx),
+        Scenario(
+            "multi chat post", "post", reverse("chat:chat-multi"), authenticated=True, data={"user_text": "hello"}
+        ),
+    ]
+
+
+@contextmanager
+def count_thread_hops(counter: Counter):
+    """sync_to_async 호출(이벤트 루프 → 스레드 전환)을 호출 대상 이름별로 셉니다."""
+    original_call = SyncToAsync.__call__
+
+    async def counting_call(self, *args, **kwargs):
+        counter[getattr(self.func, "__qualname__", None) or type(self.func).__qualname__] += 1
+        return await original_call(self, *args, **kwargs)
+
+    SyncToAsync.__call__ = counting_call
+    try:
+        yield counter
+    finally:
+        SyncToAsync.__call__ = original_call
+
+
+class Command(BaseCommand):
+    help = (
+        "Request hot views through the ASGI request handler (AsyncClient) and report requests per second "
+        "and sync_to_async thread hops per request"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--details", action="store_true", help="Show hop counts per called function")
+
+    def handle(self, *args, **options):
+        warn_if_debug(self)
+
+        # AsyncClient의 기본 호스트(testserver)를 허용하고, 벤치마크용 사용자는 마지막에 롤백합니다.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]), transaction.atomic():
+            user = User.objects.create_user(username="bench-async-views", password=None)
+            async_to_sync(self.run)(user, options["requests"], options["details"])
+            transaction.set_rollback(True)
+
+    async def run(self, user: User, count: int, details: bool) -> None:
+        anonymous_client = AsyncClient()
+        user_client = AsyncClient()
+        await user_client.aforce_login(user)
+
+        self.stdout.write(f"{'':<28} {'req/s':>9} {'hops/request':>13} {'(other)':>8} {'(middleware)':>13}")
+        for scenario in get_scenarios():
+            client = user_client if scenario.authenticated else anonymous_client
+            request = getattr(client, scenario.method)
+
+            async def send():
+                return await request(scenario.url, data=scenario.data, headers=scenario.headers)
+
+            # 캐시/쿠키를 준비하는 첫 요청은 측정에서 제외합니다.
+            response = await send()
+
+            hops = Counter()
+            with count_thread_hops(hops):
+                started = time.perf_counter()
+                for _ in range(count):
+                    response = await send()
+                elapsed = time.perf_counter() - started
+
+            total_hops = sum(hops.values())
+            middleware_hops = sum(n for name, n in hops.items() if "Middleware" in name)
+            self.stdout.write(
+                f"{scenario.label:<28} {count / elapsed:>9,.0f} {total_hops / count:>13.1f}"
+                f" {(total_hops - middleware_hops) / count:>8.1f} {middleware_hops / count:>13.1f}"
+                f"  (status {response.status_code})"
+            )
+            if details:
+                for name, n in hops.most_common():
+                    self.stdout.write(f"    {n / count:>5.1f}  {name}")
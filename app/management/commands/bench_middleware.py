@@ -0,0 +1,145 @@
+import asyncio
+import time
+from collections import Counter, defaultdict
+from http.cookies import SimpleCookie
+from typing import Dict, List, NamedTuple, Tuple
+from urllib.parse import urlencode
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections, transaction
+from django.test import Client
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from accounts.models import User
+from app.management.commands.bench_async_views import count_thread_hops
+from mysite.benchmarks import warn_if_debug
+from mysite.handlers import MiddlewarePipelineHandler
+
+
+class Scenario(NamedTuple):
+    label: str
+    method: str
+    url: str
+    data: Dict[str, str] = {}
+
+
+def get_scenarios() -> List[Scenario]:
+    return [
+        Scenario("profile.json", "GET", reverse("accounts:profile_json")),
+        Scenario("chat llm history", "GET", reverse("chat:chat-llm")),
+        Scenario("multi chat post", "POST", reverse("chat:chat-multi"), {"user_text": "hello"}),
+    ]
+
+
+def parse_server_timing(value: str) -> Dict[str, float]:
+    durations = {}
+    for metric in value.split(","):
+        name, _, duration = metric.strip().partition(";dur=")
+        durations[name] = float(duration)
+    return durations
+
+
+async def send_request(app, method: str, path: str, headers: List[Tuple[bytes, bytes]], body: bytes) -> Dict:
+    """ASGI 앱을 직접 호출하여 (status, headers)를 반환합니다. 응답 본문은 끝까지 읽고 버립니다."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"localhost"), *headers], "client": ("127.0.0.1", 50000), "server": ("localhost", 80),
+    }
+    received = False
+    # Django는 응답 중에도 receive로 연결 끊김을 확인하므로, 응답이 끝날 때까지 기다렸다가 disconnect를 전달합니다.
+    completed = asyncio.Event()
+    response = {}
+
+    async def receive():
+        nonlocal received
+        if received:
+            await completed.wait()
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in message["headers"]}
+        elif not message.get("more_body", False):
+            completed.set()
+
+    await app(scope, receive, send)
+    return response
+
+
+class Command(BaseCommand):
+    help = (
+        "Report per-request time spent in each middleware (Server-Timing) for the default middleware stack "
+        "and the lean streaming stack (STREAMING_MIDDLEWARE)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300)
+
+    def handle(self, *args, **options):
+        warn_if_debug(self, "debug toolbar middleware is included in the default stack")
+
+        pipelines = {
+            "default": MiddlewarePipelineHandler(timing=True),
+            "streaming": MiddlewarePipelineHandler(settings.STREAMING_MIDDLEWARE, timing=True),
+        }
+
+        with transaction.atomic():
+            user = User.objects.create_user(username="bench-middleware", password=None)
+            client = Client()
+            client.force_login(user)
+            # CSRF 미들웨어는 쿠키의 secret과 같은 값의 X-CSRFToken 헤더를 허용합니다.
+            csrf_token = get_random_string(32)
+            cookie = SimpleCookie()
+            cookie[settings.SESSION_COOKIE_NAME] = client.cookies[settings.SESSION_COOKIE_NAME].value
+            cookie[settings.CSRF_COOKIE_NAME] = csrf_token
+            headers = [
+                (b"cookie", cookie.output(header="", sep=";").strip().encode()),
+                (b"x-csrftoken", csrf_token.encode()),
+            ]
+            # 테스트 클라이언트처럼, 요청마다 DB 연결을 닫지 않도록 하여 벤치마크 트랜잭션을 유지합니다.
+            request_started.disconnect(close_old_connections)
+            request_finished.disconnect(close_old_connections)
+            try:
+                async_to_sync(self.run)(pipelines, headers, options["requests"])
+            finally:
+                request_started.connect(close_old_connections)
+                request_finished.connect(close_old_connections)
+            transaction.set_rollback(True)
+
+    async def run(self, pipelines: Dict[str, MiddlewarePipelineHandler], headers, count: int) -> None:
+        for scenario in get_scenarios():
+            request_headers = list(headers)
+            body = b""
+            if scenario.method == "POST":
+                body = urlencode(scenario.data).encode()
+                request_headers.append((b"content-type", b"application/x-www-form-urlencoded"))
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{scenario.method} {scenario.url} ({scenario.label})"))
+            for pipeline_name, app in pipelines.items():
+                # 첫 요청은 측정에서 제외합니다.
+                response = await send_request(app, scenario.method, scenario.url, request_headers, body)
+
+                totals = defaultdict(float)
+                hops = Counter()
+                with count_thread_hops(hops):
+                    started = time.perf_counter()
+                    for _ in range(count):
+                        response = await send_request(app, scenario.method, scenario.url, request_headers, body)
+                        for name, duration in parse_server_timing(response["headers"]["server-timing"]).items():
+                            totals[name] += duration
+                    elapsed = time.perf_counter() - started
+
+                self.stdout.write(
+                    f"  [{pipeline_name}] status {response['status']}, {count / elapsed:,.0f} req/s,"
+                    f" {sum(hops.values()) / count:.1f} thread hops/request"
+                )
+                for name, total in totals.items():
+                    self.stdout.write(f"    {name:<28} {total / count * 1000:>8.1f} µs")
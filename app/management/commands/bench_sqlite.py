@@ -0,0 +1,139 @@
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+
+from mysite.db_writer import get_executor, submit_write
+
+TABLE = "bench_item"
+
+# 프로필 이름 -> (DATABASES OPTIONS, 쓰기 스레드 사용 여부)
+PROFILES = {
+    "default": ({}, False),
+    "tuned": (settings.SQLITE_TUNED_OPTIONS, False),
+    "tuned+write-queue": (settings.SQLITE_TUNED_OPTIONS, True),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run mixed read/write traffic against a temporary SQLite database with the default and the tuned "
+        "settings, and report throughput and error counts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("profiles", nargs="*", help=f"Profiles to run (default: {', '.join(PROFILES)})")
+        parser.add_argument("--threads", type=int, default=16, help="Concurrent clients (default: 16)")
+        parser.add_argument("--operations", type=int, default=300, help="Operations per client (default: 300)")
+        parser.add_argument("--write-ratio", type=float, default=0.2, help="Ratio of write operations (default: 0.2)")
+        parser.add_argument("--rows", type=int, default=10_000, help="Rows in the benchmark table (default: 10,000)")
+
+    def handle(self, *args, **options):
+        profile_names = options["profiles"] or list(PROFILES)
+        unknown = set(profile_names) - set(PROFILES)
+        if unknown:
+            raise CommandError(f"Unknown profiles : {', '.join(sorted(unknown))}")
+
+        for profile_name in profile_names:
+            db_options, use_write_queue = PROFILES[profile_name]
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                alias = f"bench_sqlite_{profile_name}"
+                self.add_database(alias, Path(tmp_dir) / "bench.sqlite3", db_options)
+                try:
+                    self.create_table(alias, options["rows"])
+                    result = self.run_profile(alias, use_write_queue, options)
+                finally:
+                    self.remove_database(alias)
+
+            self.stdout.write(
+                f"{profile_name:<20} {result['ops_per_second']:>9,.0f} ops/s"
+                f"  errors {result['errors']:>5,} ({result['error_rate']:.1%})"
+                f"  write p99 {result['write_p99_ms']:>8,.1f} ms"
+            )
+
+    def add_database(self, alias: str, path: Path, db_options: Dict) -> None:
+        # 설정과 같은 백엔드(init_command, transaction_mode 포함)로 임시 데이터베이스를 사용합니다.
+        db_settings = {"ENGINE": "django.db.backends.sqlite3", "NAME": str(path), "OPTIONS": dict(db_options)}
+        connections.settings[alias] = connections.configure_settings({DEFAULT_DB_ALIAS: db_settings})[DEFAULT_DB_ALIAS]
+
+    def remove_database(self, alias: str) -> None:
+        connections.close_all()
+        del connections.settings[alias]
+
+    def create_table(self, alias: str, rows: int) -> None:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(f"CREATE TABLE {TABLE} (id INTEGER PRIMARY KEY, value TEXT NOT NULL, hits INTEGER NOT NULL)")
+            cursor.executemany(
+                f"INSERT INTO {TABLE} (id, value, hits) VALUES (%s, %s, 0)",
+                [(i, f"value {i}") for i in range(1, rows + 1)],
+            )
+
+    def run_profile(self, alias: str, use_write_queue: bool, options) -> Dict[str, float]:
+        rows = options["rows"]
+        errors = 0
+        write_latencies: List[float] = []
+        lock = threading.Lock()
+
+        def write(item_id: int) -> None:
+            # 세션 저장처럼 읽은 뒤에 쓰는 트랜잭션
+            with connections[alias].cursor() as cursor:
+                cursor.execute(f"SELECT hits FROM {TABLE} WHERE id = %s", [item_id])
+                (hits,) = cursor.fetchone()
+                cursor.execute(f"UPDATE {TABLE} SET hits = %s WHERE id = %s", [hits + 1, item_id])
+
+        def read(item_id: int) -> None:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(f"SELECT value FROM {TABLE} WHERE id = %s", [item_id])
+                cursor.fetchone()
+                cursor.execute(f"SELECT COUNT(*) FROM {TABLE} WHERE id BETWEEN %s AND %s", [item_id, item_id + 100])
+                cursor.fetchone()
+
+        def client(seed: int) -> None:
+            nonlocal errors
+            rng = random.Random(seed)
+            try:
+                for _ in range(options["operations"]):
+                    item_id = rng.randint(1, rows)
+                    try:
+                        if rng.random() < options["write_ratio"]:
+                            started = time.perf_counter()
+                            if use_write_queue:
+                                submit_write(write, item_id, using=alias).result()
+                            else:
+                                with transaction.atomic(using=alias):
+                                    write(item_id)
+                            with lock:
+                                write_latencies.append(time.perf_counter() - started)
+                        else:
+                            read(item_id)
+                    except OperationalError:  # database is locked
+                        with lock:
+                            errors += 1
+            finally:
+                connections[alias].close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+            list(executor.map(client, range(options["threads"])))
+        elapsed = time.perf_counter() - started
+
+        if use_write_queue:
+            # 쓰기 스레드의 연결도 닫습니다.
+            get_executor(alias).submit(lambda: connections[alias].close()).result()
+
+        total = options["threads"] * options["operations"]
+        write_latencies.sort()
+        write_p99 = write_latencies[int(len(write_latencies) * 0.99)] if write_latencies else 0
+        return {
+            "ops_per_second": (total - errors) / elapsed,
+            "errors": errors,
+            "error_rate": errors / total,
+            "write_p99_ms": write_p99 * 1000,
+        }
@@ -0,0 +1,146 @@
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import Paginator
+from django.template.loader import get_template
+from django.test import RequestFactory
+
+from melon.models import Song
+from mysite.benchmarks import warn_if_debug
+
+
+def get_song_list_context() -> Dict:
+    # DB 없이 렌더링하도록, 저장하지 않은 인스턴스로 목록 페이지를 구성합니다.
+    songs = [
+        Song(
+            pk=i,
+            rank=i,
+            album_name=f"앨범 {i}",
+            title=f"노래 {i}",
+            artist_name=f"가수 {i}",
+            album_cover_url=f"https://cdnimg.melon.co.kr/cm2/album/images/{i}.jpg",
+        )
+        for i in range(1, 101)
+    ]
+    page_obj = Paginator(songs, 10).page(1)
+    return {"song_list": page_obj.object_list, "page_obj": page_obj}
+
+
+# 템플릿 이름 -> 렌더링 context
+BENCHMARKS: Dict[str, Callable[[], Dict]] = {
+    "root.html": lambda: {"ncp_map_client_id": "benchmark"},
+    "chat/index.html": lambda: {},
+    "melon/_song_list.html": get_song_list_context,
+}
+
+
+class Command(BaseCommand):
+    help = "Render benchmark templates N times and report renders per second and memory allocated per render (peak traced memory)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("templates", nargs="*", help=f"Templates to render (default: {', '.join(BENCHMARKS)})")
+        parser.add_argument("--iterations", type=int, default=500)
+        parser.add_argument("--save", type=Path, help="Save the results as JSON (e.g. as a baseline)")
+        parser.add_argument("--baseline", type=Path, help="Compare with saved results and fail on regressions")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=20.0,
+            help="Allowed slowdown / allocation increase against the baseline in percent (default: 20)",
+        )
+
+    def handle(self, *args, **options):
+        template_names = options["templates"] or list(BENCHMARKS)
+        unknown = set(template_names) - set(BENCHMARKS)
+        if unknown:
+            raise CommandError(f"Unknown templates : {', '.join(sorted(unknown))}")
+
+        warn_if_debug(self)
+
+        iterations = options["iterations"]
+        request = RequestFactory().get("/", HTTP_HOST=(settings.ALLOWED_HOSTS or ["localhost"])[0].lstrip("."))
+        request.user = AnonymousUser()
+
+        results = {}
+        for template_name in template_names:
+            result = self.run_benchmark(template_name, BENCHMARKS[template_name](), request, iterations)
+            results[template_name] = result
+            self.stdout.write(
+                f"{template_name:<24} {result['renders_per_second']:>10,.0f} renders/s"
+                f"  {result['peak_kib_per_render']:>8,.1f} KiB peak/render"
+                f"  {result['retained_blocks_per_render']:>8,.0f} blocks retained/render"
+            )
+
+        if options["save"]:
+            options["save"].write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            self.stdout.write(f"Saved results to {options['save']}")
+
+        if options["baseline"]:
+            self.compare(results, json.loads(options["baseline"].read_text(encoding="utf-8")), options["tolerance"])
+
+    def run_benchmark(self, template_name: str, context: Dict, request, iterations: int) -> Dict[str, float]:
+        # 첫 렌더링은 템플릿 로딩/컴파일을 포함하므로 측정에서 제외합니다.
+        template = get_template(template_name)
+        template.render(context, request)
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            template.render(context, request)
+        elapsed = time.perf_counter() - started
+
+        # 메모리는 tracemalloc 오버헤드가 속도 측정에 섞이지 않도록 별도로 측정합니다.
+        # - peak : 렌더링 중 최대 할당량 (렌더링 한 번에 필요한 메모리)
+        # - retained : 렌더링이 끝난 뒤에도 해제되지 않고 남은 메모리 블록 수 (캐시 증가, 누수 확인용)
+        allocation_iterations = max(1, iterations // 10)
+        tracemalloc.start()
+        try:
+            peak_bytes = 0
+            blocks = 0
+            for _ in range(allocation_iterations):
+                before = tracemalloc.take_snapshot()
+                current_bytes = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                template.render(context, request)
+                peak_bytes += tracemalloc.get_traced_memory()[1] - current_bytes
+                # 순환 참조로 남아있는 임시 객체는 보유된 것으로 보지 않습니다.
+                gc.collect()
+                after = tracemalloc.take_snapshot()
+                # tracemalloc 자체(스냅샷)의 할당은 제외합니다.
+                exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+                stats = after.filter_traces(exclude).compare_to(before.filter_traces(exclude), "lineno")
+                blocks += sum(max(stat.count_diff, 0) for stat in stats)
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "renders_per_second": iterations / elapsed,
+            "peak_kib_per_render": peak_bytes / allocation_iterations / 1024,
+            "retained_blocks_per_render": blocks / allocation_iterations,
+        }
+
+    def compare(self, results: Dict, baseline: Dict, tolerance: float) -> None:
+        regressions = []
+        for template_name, result in results.items():
+            base = baseline.get(template_name)
+            if base is None:
+                continue
+            slowdown = (base["renders_per_second"] / result["renders_per_second"] - 1) * 100
+            allocation_increase = (result["peak_kib_per_render"] / base["peak_kib_per_render"] - 1) * 100
+            self.stdout.write(
+                f"{template_name:<24} speed {-slowdown:+.1f}%, peak memory {allocation_increase:+.1f}% (vs baseline)"
+            )
+            if slowdown > tolerance:
+                regressions.append(f"{template_name} : {slowdown:.1f}% slower")
+            if allocation_increase > tolerance:
+                regressions.append(f"{template_name} : {allocation_increase:.1f}% more memory per render")
+
+        if regressions:
+            raise CommandError("Template render regressions :\n" + "\n".join(regressions))
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
@@ -0,0 +1,125 @@
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+DEFAULT_BUDGET_PATH = Path(settings.BASE_DIR) / "mysite" / "startup_budget.json"
+
+# 측정 대상 : 새 인터프리터에서 실행할 코드
+TARGETS = {
+    # 모든 관리 명령과 테스트 실행이 부담하는 비용
+    "setup": "import django; django.setup()",
+    # 워커가 첫 요청을 처리하기 전에 부담하는 비용 (모든 URLConf와 뷰 모듈)
+    "urls": "import django; django.setup(); from django.urls import get_resolver; get_resolver().url_patterns",
+    # ASGI 서버(daphne) 워커 시작 비용
+    "asgi": "import mysite.asgi",
+}
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# --update-budget 시에 측정값에 더하는 여유분
+BUDGET_HEADROOM = 1.5
+
+
+@dataclass
+class ImportProfile:
+    total_us: int = 0
+    # 최상위 패키지 -> 패키지 모듈들의 자체 임포트 시간 합계(us)
+    packages: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    modules: List[str] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+
+def parse_importtime(output: str) -> ImportProfile:
+    profile = ImportProfile()
+    for line in output.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if match is None:
+            continue
+        self_us, _, _, module = match.groups()
+        profile.total_us += int(self_us)
+        profile.packages[module.split(".")[0]] += int(self_us)
+        profile.modules.append(module)
+    return profile
+
+
+def profile_imports(target: str) -> ImportProfile:
+    """새 인터프리터에서 대상 코드를 -X importtime 으로 실행하여, 모듈별 임포트 시간을 수집합니다."""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TARGETS[target]],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise CommandError(f"{target} 실행 중 오류가 발생했습니다.\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def get_deferred_imports(profile: ImportProfile, deferred: List[str]) -> List[str]:
+    return sorted({module.split(".")[0] for module in profile.modules} & set(deferred))
+
+
+class Command(BaseCommand):
+    help = (
+        "Report import time per top-level package for process startup (django.setup, URLConf, ASGI app) "
+        "and check it against the tracked startup budget"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("targets", nargs="*", metavar="target", help=f"One or more of {', '.join(TARGETS)} (default: all)")
+        parser.add_argument("--budget", default=str(DEFAULT_BUDGET_PATH), help="Budget JSON file")
+        parser.add_argument("--top", type=int, default=15, help="Number of packages to show")
+        parser.add_argument("--repeat", type=int, default=3, help="Use the fastest of N runs")
+        parser.add_argument("--update-budget", action="store_true", help="Write measured times (with headroom) to the budget file")
+
+    def handle(self, *args, **options):
+        budget_path = Path(options["budget"])
+        budget = json.loads(budget_path.read_text()) if budget_path.exists() else {}
+        targets = options["targets"] or list(TARGETS)
+        unknown_targets = set(targets) - set(TARGETS)
+        if unknown_targets:
+            raise CommandError(f"Unknown target: {', '.join(sorted(unknown_targets))}")
+
+        failures = []
+        for target in targets:
+            # 첫 실행은 .pyc 생성 등으로 느릴 수 있으므로, 여러 번 실행하여 가장 빠른 결과를 사용합니다.
+            profile = min((profile_imports(target) for _ in range(max(1, options["repeat"]))), key=lambda p: p.total_us)
+            target_budget = budget.setdefault(target, {})
+            budget_ms = target_budget.get("budget_ms")
+
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{target}: {profile.total_ms:,.0f} ms, {len(profile.modules):,} modules"
+                + (f" (budget {budget_ms:,} ms)" if budget_ms else "")
+            ))
+            packages = sorted(profile.packages.items(), key=lambda item: item[1], reverse=True)
+            for package, self_us in packages[:options["top"]]:
+                self.stdout.write(f"  {package:<28} {self_us / 1000:>8.1f} ms")
+
+            if budget_ms and profile.total_ms > budget_ms:
+                failures.append(f"{target}: {profile.total_ms:,.0f} ms > budget {budget_ms:,} ms")
+            deferred_imports = get_deferred_imports(profile, target_budget.get("deferred", []))
+            if deferred_imports:
+                failures.append(f"{target}: imports deferred packages at startup: {', '.join(deferred_imports)}")
+
+            if options["update_budget"]:
+                target_budget["budget_ms"] = int(profile.total_ms * BUDGET_HEADROOM)
+
+        if options["update_budget"]:
+            budget_path.write_text(json.dumps(budget, indent=2) + "\n")
+            self.stdout.write(f"Updated {budget_path}")
+        elif failures:
+            raise CommandError("Startup budget exceeded.\n" + "\n".join(failures))
+        else:
+            self.stdout.write(self.style.SUCCESS("Within startup budget."))
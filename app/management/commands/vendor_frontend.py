@@ -0,0 +1,110 @@
+import shutil
+import subprocess
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.frontend import (
+    LAYOUTS,
+    VENDOR_ASSETS,
+    ChecksumError,
+    MissingPinError,
+    OfflineError,
+    build_css,
+    bundle_scripts,
+    collect_layout_candidates,
+    fetch,
+    get_integrity,
+    get_tailwind_cli,
+    get_tailwind_cli_url,
+    load_pins,
+    write_fingerprinted,
+    write_manifest,
+    write_pins,
+)
+
+
+class Command(BaseCommand):
+    help = "Vendor pinned frontend dependencies into static/vendor as one fingerprinted bundle per base layout"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--offline", action="store_true",
+            help="Use only previously downloaded copies (fails if a file has never been downloaded)",
+        )
+        parser.add_argument(
+            "--skip-css", action="store_true",
+            help="Do not build Tailwind CSS; pages keep using the Tailwind CDN for styles",
+        )
+        parser.add_argument(
+            "--update-pins", action="store_true",
+            help="Record the SRI hashes of the downloaded files (after reviewing them) instead of verifying them",
+        )
+
+    def handle(self, *args, **options):
+        offline = options["offline"]
+
+        if options["update_pins"]:
+            self.update_pins(offline, with_cli=not options["skip_css"])
+
+        cli = None
+        if not options["skip_css"]:
+            try:
+                cli = get_tailwind_cli(offline=offline)
+            except MissingPinError as e:
+                # CLI는 플랫폼마다 파일이 달라 기본으로 기록하지 않습니다. 릴리스의 sha256sums.txt로 확인한 후 --update-pins로 기록합니다.
+                self.stdout.write(self.style.WARNING(f"Tailwind CLI is not pinned, skipping CSS : {e}"))
+            except ChecksumError as e:
+                raise CommandError(str(e))
+            except (OfflineError, OSError) as e:
+                self.stdout.write(self.style.WARNING(f"Tailwind CLI is not available, skipping CSS : {e}"))
+
+        candidates = collect_layout_candidates() if cli else {}
+
+        bundles = {}
+        for layout_name, layout in LAYOUTS.items():
+            bundle = {}
+            for key, asset_names in (("js", layout.scripts), ("deferred_js", layout.deferred_scripts)):
+                if not asset_names:
+                    continue
+                try:
+                    script = bundle_scripts(asset_names, offline=offline)
+                except (OfflineError, ChecksumError, OSError) as e:
+                    raise CommandError(str(e))
+                bundle_name = layout_name if key == "js" else f"{layout_name}-deferred"
+                bundle[key] = write_fingerprinted(bundle_name, "js", script)
+                self.stdout.write(f"{layout_name}: {bundle[key]} ({len(script):,} bytes)")
+
+            if cli:
+                try:
+                    css = build_css(cli, candidates[layout_name])
+                except subprocess.CalledProcessError as e:
+                    raise CommandError(f"Tailwind CSS build failed : {e.stderr.decode(errors='replace')}")
+                bundle["css"] = write_fingerprinted(layout_name, "css", css)
+                self.stdout.write(
+                    f"{layout_name}: {bundle['css']} ({len(css):,} bytes, {len(candidates[layout_name]):,} class candidates)"
+                )
+
+            bundles[layout_name] = bundle
+
+        manifest_path = write_manifest(bundles)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {manifest_path}"))
+
+    def update_pins(self, offline: bool, with_cli: bool) -> None:
+        pins = dict(load_pins())
+        urls = list(VENDOR_ASSETS.values())
+        if with_cli and not (settings.TAILWIND_CLI or shutil.which("tailwindcss")):
+            urls.append(get_tailwind_cli_url())
+
+        for url in urls:
+            try:
+                content = fetch(url, offline=offline, verify=False)
+            except (OfflineError, OSError) as e:
+                raise CommandError(str(e))
+            integrity = get_integrity(content)
+            if pins.get(url) != integrity:
+                self.stdout.write(self.style.WARNING(f"{url}: {pins.get(url)} -> {integrity}"))
+            pins[url] = integrity
+
+        pins_path = write_pins(pins)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {pins_path}"))
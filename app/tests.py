@@ -1,3 +1,601 @@
-from django.test import TestCase
+import gzip
+import hashlib
+import io
+import json
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import brotli
+from asgiref.testing import ApplicationCommunicator
+from django.apps import apps
+from django.conf import LazySettings, settings
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.http import StreamingHttpResponse
+from django.template import Context, Engine, Template, engines
+from django.template.loader import render_to_string
+from django.template.utils import get_app_template_dirs
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import path
+
+from app import frontend
+from app.frontend import (
+    ChecksumError,
+    collect_layout_candidates,
+    extract_candidates,
+    fetch,
+    get_integrity,
+    get_root_layout,
+)
+from app.management.commands.startup_profile import DEFAULT_BUDGET_PATH, get_deferred_imports, profile_imports
+from mysite import db_sessions
+from mysite.benchmarks import warn_if_debug
+from mysite.db_writer import arun_write, get_executor, is_writer_thread, run_write
+from mysite.handlers import MiddlewarePipelineHandler, StreamingPathRouter
+from mysite.sessions import SessionStore, write_behind
+from mysite.staticfiles import ImmutableStaticFilesApp
+from mysite.template_loaders import CottonLoader, warm_template_cache
+
+
+class ComponentAssetsTest(SimpleTestCase):
+    def test_component_scripts_are_rendered_once(self):
+        # root.html : 이미지 미리보기 컴포넌트 1개, 네이버 지도 컴포넌트 2개
+        html = render_to_string("root.html", {"ncp_map_client_id": "client-id"})
+
+        self.assertEqual(html.count("data-image-preview-file"), 1)
+        self.assertEqual(html.count("data-naver-map"), 2)
+        self.assertEqual(html.count("cotton/widgets/image_preview_file.js"), 1)
+        self.assertEqual(html.count("cotton/maps/naver.js"), 1)
+        self.assertNotIn("oapi.map.naver.com", html)
+
+        # 본문 이후, </body> 직전에 선언된 순서대로 출력합니다.
+        script_index = html.index("image_preview_file.js")
+        self.assertGreater(script_index, html.index("data-naver-map"))
+        self.assertLess(script_index, html.index("naver.js"))
+        self.assertLess(html.index("naver.js"), html.index("</body>"))
+
+    def test_component_assets_are_not_shared_between_renders(self):
+        render_to_string("root.html", {"ncp_map_client_id": "client-id"})
+        html = render_to_string("root.html", {"ncp_map_client_id": "client-id"})
+        self.assertEqual(html.count("cotton/maps/naver.js"), 1)
+
+
+class FrontendClassExtractorTest(SimpleTestCase):
+    def test_extract_candidates(self):
+        text = """
+            <div class="px-4 hover:bg-blue-600 md:w-1/2 {{ extra }}" :class="{ 'text-red-500': error, '!mt-0': x }">
+            css_class="mb-4 -mt-2 w-[300px]"
+            <p>Hello 안녕하세요</p>
+        """
+        candidates = extract_candidates(text)
+        for name in ("px-4", "hover:bg-blue-600", "md:w-1/2", "text-red-500", "!mt-0", "mb-4", "-mt-2", "w-[300px]"):
+            self.assertIn(name, candidates)
+        for name in ("{{", "Hello", "안녕하세요", "'text-red-500':"):
+            self.assertNotIn(name, candidates)
+
+    def test_get_root_layout(self):
+        parents = {"page.html": "base.html", "detail.html": "page.html", "loop-a.html": "loop-b.html", "loop-b.html": "loop-a.html"}
+        self.assertEqual(get_root_layout("detail.html", parents), "base")
+        self.assertEqual(get_root_layout("chat/base.html", parents), "chat")
+        self.assertIsNone(get_root_layout("_partial.html", parents))
+        self.assertIsNone(get_root_layout("loop-a.html", parents))
+
+    def test_candidates_are_grouped_by_layout(self):
+        with tempfile.TemporaryDirectory() as template_dir:
+            template_dir = Path(template_dir)
+            (template_dir / "chat").mkdir()
+            files = {
+                "base.html": '<body class="base-only">',
+                "page.html": '{% extends "base.html" %}<p class="page-only">',
+                "chat/base.html": '<body class="chat-only">',
+                "chat/index.html": "{% extends 'chat/base.html' %}<p class='chat-page'>",
+                "_partial.html": '<span class="shared-partial">',
+            }
+            for name, text in files.items():
+                (template_dir / name).write_text(text, encoding="utf-8")
+
+            with mock.patch.object(frontend, "get_template_dirs", return_value=[template_dir]), \
+                    mock.patch.object(frontend, "iter_python_files", return_value=[]):
+                candidates = collect_layout_candidates()
+
+        self.assertLessEqual({"base-only", "page-only", "shared-partial"}, candidates["base"])
+        self.assertLessEqual({"chat-only", "chat-page", "shared-partial"}, candidates["chat"])
+        self.assertFalse({"chat-only", "chat-page"} & candidates["base"])
+        self.assertFalse({"base-only", "page-only"} & candidates["chat"])
+
+
+class FrontendVendorIntegrityTest(SimpleTestCase):
+    url = "https://example.com/lib.js"
+    content = b"console.log('lib');"
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+        settings_override = self.settings(FRONTEND_VENDOR_CACHE_DIR=self.tmp_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        # 내려받은 파일이 캐시에 있는 상태
+        cache_path = self.tmp_dir / "downloads" / hashlib.sha256(self.url.encode()).hexdigest()
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(self.content)
+
+        patcher = mock.patch.object(frontend, "PINS_PATH", self.tmp_dir / "pins.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        frontend.load_pins.cache_clear()
+        self.addCleanup(frontend.load_pins.cache_clear)
+
+    def test_unpinned_asset_is_rejected(self):
+        with self.assertRaisesMessage(ChecksumError, "SRI 해시가 없습니다"):
+            fetch(self.url, offline=True)
+        self.assertEqual(fetch(self.url, offline=True, verify=False), self.content)
+
+    def test_pinned_asset(self):
+        frontend.write_pins({self.url: get_integrity(self.content)})
+        self.assertEqual(fetch(self.url, offline=True), self.content)
+
+        frontend.write_pins({self.url: get_integrity(b"tampered")})
+        with self.assertRaisesMessage(ChecksumError, "일치하지 않습니다"):
+            fetch(self.url, offline=True)
+
+
+class FrontendPinsTest(SimpleTestCase):
+    def test_every_vendor_asset_is_pinned(self):
+        pins = json.loads(frontend.PINS_PATH.read_text(encoding="utf-8"))
+        for asset_name, url in frontend.VENDOR_ASSETS.items():
+            with self.subTest(asset_name):
+                self.assertRegex(pins.get(url, ""), r"^sha384-[A-Za-z0-9+/]{64}$")
+
+    @override_settings(STORAGES={"staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"}})
+    def test_cdn_fallback_has_integrity(self):
+        with mock.patch("templatetags.frontend.load_manifest", return_value={}):
+            html = Template("{% load frontend %}{% frontend_assets 'chat' %}").render(Context())
+        scripts = [line for line in html.splitlines() if "unpkg.com" in line]
+        self.assertEqual(len(scripts), 3)
+        for line in scripts:
+            self.assertIn('integrity="sha384-', line)
+
+
+@override_settings(STORAGES={"staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"}})
+class FrontendAssetsTagTest(SimpleTestCase):
+    def render(self, layout_name, manifest, pins=None):
+        with mock.patch("templatetags.frontend.load_manifest", return_value=manifest), \
+                mock.patch("templatetags.frontend.load_pins", return_value=pins or {}):
+            return Template("{% load frontend %}{% frontend_assets layout_name %}").render(Context({"layout_name": layout_name}))
+
+    def test_cdn_fallback_keeps_htmx_blocking(self):
+        htmx_url = frontend.VENDOR_ASSETS["htmx"]
+        html = self.render("chat", {}, pins={htmx_url: "sha384-abc"})
+
+        self.assertIn(frontend.TAILWIND_CDN_URL, html)
+        self.assertIn(f'<script src="{htmx_url}" integrity="sha384-abc" crossorigin="anonymous"></script>', html)
+        self.assertIn(f'<script src="{frontend.VENDOR_ASSETS["htmx-ext-ws"]}"></script>', html)
+        self.assertIn(f'<script src="{frontend.VENDOR_ASSETS["alpinejs"]}" defer></script>', html)
+        self.assertLess(html.index("htmx.org"), html.index("htmx-ext-ws"))
+
+    def test_bundles(self):
+        html = self.render("base", {"base": {
+            "css": "vendor/base.111.css", "js": "vendor/base.222.js", "deferred_js": "vendor/base-deferred.333.js",
+        }})
+        self.assertEqual(html.splitlines(), [
+            f'<link rel="stylesheet" href="{settings.STATIC_URL}vendor/base.111.css" />',
+            f'<script src="{settings.STATIC_URL}vendor/base.222.js"></script>',
+            f'<script src="{settings.STATIC_URL}vendor/base-deferred.333.js" defer></script>',
+        ])
+        self.assertNotIn("unpkg.com", html)
+
+
+# 테스트 중에는 백그라운드 스레드가 저장하지 않도록 주기를 길게 지정하고, flush()를 직접 호출합니다.
+# (테스트 트랜잭션 밖의 다른 스레드 연결에서는 테스트 DB에 쓸 수 없으므로 쓰기 스레드도 사용하지 않습니다.)
+@override_settings(SESSION_WRITE_BEHIND_DELAY=3600, SQLITE_WRITE_QUEUE=False)
+class WriteBehindSessionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        write_behind.pending.clear()
+
+    def test_saves_are_coalesced(self):
+        session = SessionStore()
+        for i in range(3):
+            session["count"] = i
+            session.save()
+
+        self.assertFalse(Session.objects.filter(pk=session.session_key).exists())
+        self.assertEqual(SessionStore(session.session_key)["count"], 2)
+
+        self.assertEqual(write_behind.flush(), 1)
+        self.assertEqual(Session.objects.get(pk=session.session_key).get_decoded(), {"count": 2})
+
+    def test_load_falls_back_to_pending_and_database(self):
+        session = SessionStore()
+        session["key"] = "value"
+        session.save()
+
+        cache.clear()
+        self.assertEqual(SessionStore(session.session_key)["key"], "value")
+
+        write_behind.flush()
+        cache.clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(SessionStore(session.session_key)["key"], "value")
+        with self.assertNumQueries(0):
+            self.assertEqual(SessionStore(session.session_key)["key"], "value")
+
+    def test_delete_cancels_pending_write(self):
+        session = SessionStore()
+        session["key"] = "value"
+        session.save()
+        session.flush()
+
+        write_behind.flush()
+        self.assertFalse(Session.objects.exists())
+
+    async def test_async_api(self):
+        session = SessionStore()
+        await session.aset("key", "value")
+        await session.asave()
+
+        loaded = SessionStore(session.session_key)
+        self.assertEqual(await loaded.aget("key"), "value")
+        self.assertTrue(await loaded.aexists(session.session_key))
+
+        await loaded.aflush()
+        self.assertIsNone(await SessionStore(session.session_key).aget("key"))
+
+
+def current_thread_info(*args, **kwargs):
+    return threading.current_thread().name, is_writer_thread(), transaction.get_connection().in_atomic_block, args, kwargs
+
+
+def fail_write():
+    raise ValueError("write failed")
+
+
+@override_settings(SQLITE_WRITE_QUEUE=True)
+class DBWriterQueueTest(TransactionTestCase):
+    """쓰기 스레드로 전달되는지 확인합니다. (쓰기 스레드의 연결로는 테스트 DB에 쓰지 않습니다.)"""
+
+    def tearDown(self):
+        get_executor().submit(connections.close_all).result()
+
+    def test_run_write_runs_in_writer_thread(self):
+        thread_name, in_writer, in_atomic, args, kwargs = run_write(current_thread_info, 1, key="value")
+        self.assertTrue(thread_name.startswith("db-writer-default"))
+        self.assertTrue(in_writer)
+        self.assertTrue(in_atomic)
+        self.assertEqual((args, kwargs), ((1,), {"key": "value"}))
+        self.assertFalse(is_writer_thread())
+
+    def test_nested_run_write_runs_inline(self):
+        # 쓰기 스레드 안에서 다시 run_write를 호출해도 교착되지 않고 그 자리에서 실행합니다.
+        thread_name, *_ = run_write(run_write, current_thread_info)
+        self.assertTrue(thread_name.startswith("db-writer-default"))
+
+    async def test_arun_write_runs_in_writer_thread(self):
+        _, in_writer, in_atomic, args, _ = await arun_write(current_thread_info, 2)
+        self.assertTrue(in_writer)
+        self.assertTrue(in_atomic)
+        self.assertEqual(args, (2,))
+
+    async def test_exceptions_are_propagated(self):
+        with self.assertRaisesMessage(ValueError, "write failed"):
+            run_write(fail_write)
+        with self.assertRaisesMessage(ValueError, "write failed"):
+            await arun_write(fail_write)
+
+
+@override_settings(SQLITE_WRITE_QUEUE=False)
+class DBWriterDisabledTest(TestCase):
+    def test_run_write_runs_in_current_thread(self):
+        thread_name, in_writer, in_atomic, *_ = run_write(current_thread_info)
+        self.assertEqual(thread_name, threading.current_thread().name)
+        self.assertFalse(in_writer)
+        self.assertTrue(in_atomic)
+
+    def test_failed_write_is_rolled_back(self):
+        def write_and_fail():
+            Session.objects.create(session_key="rollback", session_data="", expire_date="2100-01-01T00:00Z")
+            fail_write()
+
+        with self.assertRaises(ValueError):
+            run_write(write_and_fail)
+        self.assertFalse(Session.objects.filter(pk="rollback").exists())
+
+    async def test_arun_write_runs_outside_event_loop_thread(self):
+        thread_name, in_writer, in_atomic, *_ = await arun_write(current_thread_info)
+        self.assertNotEqual(thread_name, threading.current_thread().name)
+        self.assertFalse(in_writer)
+        self.assertTrue(in_atomic)
+
+
+@override_settings(SQLITE_WRITE_QUEUE=False)
+class DBSessionStoreTest(TestCase):
+    async def test_async_writes_use_arun_write(self):
+        with mock.patch.object(db_sessions, "arun_write", wraps=arun_write) as mock_arun_write:
+            session = db_sessions.SessionStore()
+            await session.aset("key", "value")
+            await session.asave()
+            self.assertEqual(mock_arun_write.call_count, 1)
+            self.assertEqual(await db_sessions.SessionStore(session.session_key).aget("key"), "value")
+
+            await session.aset("key", "new value")
+            await session.asave()
+            self.assertEqual(await db_sessions.SessionStore(session.session_key).aget("key"), "new value")
+
+            await session.adelete()
+            self.assertEqual(mock_arun_write.call_count, 3)
+        self.assertFalse(await Session.objects.filter(pk=session.session_key).aexists())
+
+
+async def stream_view(request):
+    async def stream():
+        yield "data: first\n\n"
+        yield "data: second\n\n"
+    return StreamingHttpResponse(stream(), content_type="text/event-stream")
+
+
+urlpatterns = [
+    path("stream/", stream_view),
+]
+
+
+def make_scope(path: str) -> dict:
+    return {
+        "type": "http", "method": "GET", "path": path, "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"localhost")], "client": ("127.0.0.1", 50000), "server": ("localhost", 80),
+    }
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class MiddlewarePipelineTest(SimpleTestCase):
+    async def request(self, app, path: str) -> list:
+        communicator = ApplicationCommunicator(app, make_scope(path))
+        await communicator.send_input({"type": "http.request", "body": b""})
+        messages = [await communicator.receive_output()]
+        while messages[-1].get("more_body", messages[-1]["type"] == "http.response.start"):
+            messages.append(await communicator.receive_output())
+        await communicator.wait()
+        return messages
+
+    async def test_server_timing_reports_each_middleware(self):
+        app = MiddlewarePipelineHandler(settings.STREAMING_MIDDLEWARE, timing=True)
+        start, *_ = await self.request(app, "/stream/")
+
+        server_timing = {name.lower(): value for name, value in start["headers"]}[b"server-timing"].decode()
+        names = [metric.split(";")[0] for metric in server_timing.split(", ")]
+        self.assertEqual(names, [*(path.rsplit(".", 1)[-1] for path in settings.STREAMING_MIDDLEWARE), "view"])
+
+    async def test_server_timing_when_middleware_returns_early(self):
+        with override_settings(SECURE_SSL_REDIRECT=True):
+            app = MiddlewarePipelineHandler(settings.STREAMING_MIDDLEWARE, timing=True)
+        # SecurityMiddleware가 https로 리다이렉트하므로, 안쪽 단계는 실행되지 않습니다.
+        start, *_ = await self.request(app, "/stream/")
+        self.assertEqual(start["status"], 301)
+        server_timing = {name.lower(): value for name, value in start["headers"]}[b"server-timing"].decode()
+        durations = dict(metric.split(";dur=") for metric in server_timing.split(", "))
+        self.assertGreater(float(durations["SecurityMiddleware"]), 0)
+        self.assertEqual({float(duration) for name, duration in durations.items() if name != "SecurityMiddleware"}, {0})
+
+    def test_builds_chain_without_reading_settings(self):
+        # 체인은 settings.MIDDLEWARE가 아니라 지정한 목록으로만 구성합니다.
+        with override_settings(MIDDLEWARE=["missing.module.Middleware"]):
+            # 전역 설정을 바꾸면 동시에 초기화되는 다른 핸들러에 영향을 주므로, 설정을 쓰지 않아야 합니다.
+            with mock.patch.object(LazySettings, "__setattr__", side_effect=AssertionError("settings changed")):
+                app = MiddlewarePipelineHandler(settings.STREAMING_MIDDLEWARE)
+                app.load_middleware(is_async=True)
+        self.assertIsNotNone(app._middleware_chain)
+        self.assertIsNone(app.timer)
+        self.assertEqual(app.get_middleware_setting(), settings.STREAMING_MIDDLEWARE)
+
+    async def test_streaming_response_is_not_buffered(self):
+        app = MiddlewarePipelineHandler(settings.STREAMING_MIDDLEWARE)
+        start, *bodies = await self.request(app, "/stream/")
+
+        self.assertEqual(start["status"], 200)
+        chunks = [body["body"] for body in bodies if body.get("body")]
+        self.assertEqual(chunks, [b"data: first\n\n", b"data: second\n\n"])
+
+    async def test_router_sends_streaming_paths_to_streaming_app(self):
+        called = []
+
+        def make_app(name):
+            async def app(scope, receive, send):
+                called.append(name)
+            return app
+
+        router = StreamingPathRouter(make_app("default"), make_app("streaming"), paths=["/stream/"])
+        await router(make_scope("/stream/"), None, None)
+        await router(make_scope("/other/"), None, None)
+        await router({**make_scope("/prefix/stream/"), "root_path": "/prefix"}, None, None)
+        self.assertEqual(called, ["streaming", "default", "streaming"])
+
+
+class CompressedStaticFilesTest(SimpleTestCase):
+    css = b"body { color: red; }\n" * 200
+    png = bytes(range(256)) * 4
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        tmp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp_dir.cleanup)
+        source_dir = Path(tmp_dir.name) / "source"
+        (source_dir / "css").mkdir(parents=True)
+        (source_dir / "css" / "app.css").write_bytes(cls.css)
+        (source_dir / "css" / "tiny.css").write_bytes(b"a{}")
+        (source_dir / "logo.png").write_bytes(cls.png)
+        cls.static_root = Path(tmp_dir.name) / "static"
+
+        with override_settings(
+            STATIC_ROOT=cls.static_root,
+            STATICFILES_DIRS=[source_dir],
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+            STORAGES={**settings.STORAGES, "staticfiles": {"BACKEND": "mysite.staticfiles.CompressedManifestStaticFilesStorage"}},
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+        cls.paths = json.loads((cls.static_root / "staticfiles.json").read_text())["paths"]
+
+    def setUp(self):
+        self.passthrough = []
+        self.app = ImmutableStaticFilesApp(self.fallback_app, static_root=self.static_root, static_url="/static/")
+
+    async def fallback_app(self, scope, receive, send):
+        self.passthrough.append(scope["path"])
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def request(self, path: str, headers=(), method="GET"):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await self.app({**make_scope(path), "method": method, "headers": [(b"host", b"localhost"), *headers]}, None, send)
+        start, body = messages
+        return start["status"], dict(start["headers"]), body["body"]
+
+    def static_path(self, name: str) -> str:
+        return "/static/" + self.paths[name]
+
+    def test_storage_writes_compressed_variants(self):
+        hashed_path = self.static_root / self.paths["css/app.css"]
+        self.assertEqual(gzip.decompress(hashed_path.with_name(hashed_path.name + ".gz").read_bytes()), self.css)
+        self.assertEqual(brotli.decompress(hashed_path.with_name(hashed_path.name + ".br").read_bytes()), self.css)
+
+        # 압축해도 작아지지 않는 파일과 압축 대상이 아닌 파일은 원본만 있습니다.
+        for name in ("css/tiny.css", "logo.png"):
+            hashed_path = self.static_root / self.paths[name]
+            self.assertTrue(hashed_path.exists())
+            self.assertFalse(hashed_path.with_name(hashed_path.name + ".gz").exists())
+            self.assertFalse(hashed_path.with_name(hashed_path.name + ".br").exists())
+
+    async def test_encoding_negotiation(self):
+        path = self.static_path("css/app.css")
+        etags = set()
+        for accept_encoding, expected_encoding in (
+            (b"gzip, deflate, br", b"br"),
+            (b"gzip", b"gzip"),
+            (b"gzip, br;q=0", b"gzip"),
+            (b"", None),
+        ):
+            with self.subTest(accept_encoding=accept_encoding):
+                status, headers, body = await self.request(path, [(b"accept-encoding", accept_encoding)])
+                self.assertEqual(status, 200)
+                self.assertEqual(headers.get(b"content-encoding"), expected_encoding)
+                self.assertEqual(headers[b"vary"], b"Accept-Encoding")
+                self.assertEqual(headers[b"cache-control"], b"public, max-age=31536000, immutable")
+                self.assertEqual(headers[b"content-type"], b"text/css")
+                self.assertEqual(int(headers[b"content-length"]), len(body))
+                decompress = {b"br": brotli.decompress, b"gzip": gzip.decompress, None: bytes}[expected_encoding]
+                self.assertEqual(decompress(body), self.css)
+                etags.add(headers[b"etag"])
+        # 압축 방식마다 ETag가 다릅니다.
+        self.assertEqual(len(etags), 3)
+
+    async def test_not_modified(self):
+        path = self.static_path("css/app.css")
+        _, headers, _ = await self.request(path, [(b"accept-encoding", b"br")])
+        br_etag = headers[b"etag"]
+
+        status, headers, body = await self.request(path, [(b"accept-encoding", b"br"), (b"if-none-match", br_etag)])
+        self.assertEqual((status, body), (304, b""))
+        self.assertEqual(headers[b"etag"], br_etag)
+        status, _, _ = await self.request(path, [(b"accept-encoding", b"br"), (b"if-none-match", b"W/" + br_etag)])
+        self.assertEqual(status, 304)
+
+        # 다른 압축 방식의 ETag로는 304 응답하지 않습니다.
+        status, _, body = await self.request(path, [(b"accept-encoding", b"gzip"), (b"if-none-match", br_etag)])
+        self.assertEqual(status, 200)
+        self.assertEqual(gzip.decompress(body), self.css)
+
+    async def test_head(self):
+        status, headers, body = await self.request(self.static_path("logo.png"), method="HEAD")
+        self.assertEqual((status, body), (200, b""))
+        self.assertEqual(int(headers[b"content-length"]), len(self.png))
+
+    async def test_other_requests_are_passed_through(self):
+        for path, method in (
+            ("/static/css/app.css", "GET"),  # 해시가 붙지 않은 파일명
+            ("/static/missing.js", "GET"),
+            (self.static_path("css/app.css"), "POST"),
+            ("/blog/", "GET"),
+        ):
+            with self.subTest(path=path, method=method):
+                status, _, _ = await self.request(path, method=method)
+                self.assertEqual(status, 404)
+        self.assertEqual(len(self.passthrough), 4)
+
+    def test_missing_manifest(self):
+        with tempfile.TemporaryDirectory() as static_root, self.assertLogs("mysite.staticfiles", "WARNING"):
+            self.assertEqual(ImmutableStaticFilesApp(self.fallback_app, static_root=static_root).files, {})
+
+
+class TemplateLoaderTest(SimpleTestCase):
+    def test_cotton_loader_resolves_dirs_once(self):
+        engine = Engine(dirs=[settings.BASE_DIR / "templates"])
+        loader = CottonLoader(engine)
+        get_app_template_dirs.cache_clear()
+        self.addCleanup(get_app_template_dirs.cache_clear)
+
+        with mock.patch.object(apps, "get_app_configs", wraps=apps.get_app_configs) as get_app_configs:
+            for name in ["base.html", "cotton/button.html", "missing.html"]:
+                list(loader.get_template_sources(name))
+        self.assertEqual(get_app_configs.call_count, 1)
+
+        dirs = loader.get_dirs()
+        # 원본 로더와 달리 engine.dirs를 늘리지 않으며, DIRS가 먼저 나옵니다.
+        self.assertEqual(engine.dirs, [settings.BASE_DIR / "templates"])
+        self.assertEqual(dirs[0], str(settings.BASE_DIR / "templates"))
+        self.assertEqual(len(dirs), len(set(dirs)))
+        self.assertIn(str(Path(apps.get_app_config("chat").path) / "templates"), dirs)
+
+        loader.reset()
+        self.assertIsNot(loader.get_dirs(), dirs)
+
+    def test_warm_template_cache_fills_cached_loader(self):
+        engine = engines["django"].engine
+        cached_loader = engine.template_loaders[0]
+        cached_loader.reset()
+
+        compiled_count, failed = warm_template_cache()
+        self.assertEqual(failed, [])
+        self.assertGreater(compiled_count, 0)
+        self.assertIn("base.html", cached_loader.get_template_cache)
+        self.assertIn("cotton/button.html", cached_loader.get_template_cache)
+
+        # 미리 컴파일된 템플릿은 다시 읽거나 컴파일하지 않습니다.
+        with mock.patch.object(CottonLoader, "get_contents") as get_contents:
+            engine.get_template("cotton/button.html")
+            render_to_string("base.html")
+        get_contents.assert_not_called()
+
+
+class StartupImportTest(SimpleTestCase):
+    def test_heavy_packages_are_not_imported_at_startup(self):
+        # 타이밍은 환경마다 다르므로, 시작 시에 임포트하지 않아야 하는 패키지만 확인합니다.
+        budget = json.loads(DEFAULT_BUDGET_PATH.read_text())
+        profile = profile_imports("urls")
+        self.assertEqual(get_deferred_imports(profile, budget["urls"]["deferred"]), [])
+        self.assertIn("django", profile.packages)
+
+
+class BenchmarkWarningTest(SimpleTestCase):
+    def warn(self, *args):
+        command = BaseCommand(stdout=io.StringIO())
+        warn_if_debug(command, *args)
+        return command.stdout.getvalue()
+
+    def test_warns_only_when_debug(self):
+        with override_settings(DEBUG=True):
+            self.assertIn("DEBUG is on : results include debug instrumentation.", self.warn())
+            self.assertIn("DEBUG is on : toolbar is on.", self.warn("toolbar is on"))
+        with override_settings(DEBUG=False):
+            self.assertEqual(self.warn(), "")
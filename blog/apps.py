@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BlogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "blog"
+
+    def ready(self):
+        # 댓글 카운터, slug 캐시, sitemap/feed 무효화 시그널 등록
+        from . import counters, lookups, sitemaps  # noqa: F401
@@ -0,0 +1,94 @@
+# blog/counters.py
+
+import threading
+from typing import Callable, Optional
+
+from django.db import transaction
+from django.db.models import Count, F, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Comment, Post
+
+
+# Post.comment_count / Post.last_commented_at 을 관리합니다.
+#  - 댓글 1개 생성/삭제 : 아래 시그널에서 F() 표현식으로 갱신 (동시 요청에도 값이 유실되지 않습니다)
+#  - Comment.objects.bulk_create : CommentQuerySet에서 게시물별로 모아 갱신
+#  - QuerySet.delete() 및 cascade 삭제 : 삭제되는 댓글마다 post_delete 시그널이 전송됩니다.
+#    (시그널 수신자가 있으므로 Django의 fast-delete 대신 댓글들을 조회한 후 삭제합니다.)
+#    게시물 삭제로 함께 삭제되는 댓글은, 곧 삭제될 게시물의 카운터를 갱신하지 않습니다.
+#  - 그 외 (raw SQL, 대량 생성 명령 등) : reconcile_post_counters 명령으로 재계산
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_counter(sender, instance: Comment, created: bool, raw: bool = False, **kwargs):
+    if not created or raw:
+        return
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=F("comment_count") + 1,
+        last_commented_at=Greatest(Coalesce("last_commented_at", instance.created_at), instance.created_at),
+    )
+
+
+# 현재 스레드에서 삭제 중인 게시물 pk 집합.
+# Collector는 모든 pre_delete 시그널을 보낸 후, 참조하는 쪽(댓글)부터 삭제하고 모델별로 post_delete 시그널을 보냅니다.
+_deleting = threading.local()
+
+
+def get_deleting_post_ids() -> set:
+    if not hasattr(_deleting, "post_ids"):
+        _deleting.post_ids = set()
+    return _deleting.post_ids
+
+
+@receiver(pre_delete, sender=Post)
+def track_deleting_post(sender, instance: Post, **kwargs):
+    get_deleting_post_ids().add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def untrack_deleted_post(sender, instance: Post, **kwargs):
+    get_deleting_post_ids().discard(instance.pk)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_counter(sender, instance: Comment, **kwargs):
+    if instance.post_id in get_deleting_post_ids():
+        return
+    # 삭제된 댓글이 마지막 댓글이었을 수 있으므로, 남은 댓글에서 다시 계산합니다.
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=Greatest(F("comment_count") - 1, 0),
+        last_commented_at=Subquery(
+            Comment.objects.filter(post=OuterRef("pk"))
+            .order_by()
+            .values("post")
+            .annotate(last=Max("created_at"))
+            .values("last")
+        ),
+    )
+
+
+def reconcile_post_counters(
+    batch_size: int = 1000,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """모든 게시물의 댓글 카운터를 댓글 테이블로부터 재계산합니다. 갱신한 게시물 수를 반환합니다.
+
+    id 범위 단위로 나누어 UPDATE 하므로, 긴 트랜잭션이나 테이블 전체 잠금 없이 실행됩니다.
+    """
+    comments = Comment.objects.filter(post=OuterRef("pk")).order_by().values("post")
+    comment_count = Subquery(comments.annotate(count=Count("pk")).values("count"))
+    last_commented_at = Subquery(comments.annotate(last=Max("created_at")).values("last"))
+
+    max_id = Post.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+    updated = 0
+    for start in range(0, max_id, batch_size):
+        with transaction.atomic():
+            updated += Post.objects.filter(pk__gt=start, pk__lte=start + batch_size).update(
+                comment_count=Coalesce(comment_count, 0),
+                last_commented_at=last_commented_at,
+            )
+        if progress is not None:
+            progress(updated, min(start + batch_size, max_id))
+    return updated
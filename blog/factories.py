@@ -1,6 +1,6 @@
 import random
 
-from factory import Iterator, LazyAttribute, LazyFunction, SubFactory, post_generation
+from factory import Iterator, LazyAttribute, LazyFunction, Sequence, SubFactory, post_generation
 from factory.django import DjangoModelFactory
 from faker import Faker
 
@@ -62,3 +62,20 @@ class CommentFactory(DjangoModelFactory):
     content = LazyFunction(fake.paragraph)
     author = Iterator(User.objects.all())
     post = Iterator(Post.objects.all())
+
+
+# 대량 생성(build + bulk_create)용 팩토리
+#  - fake.unique는 생성한 값을 모두 기억하므로, 대신 순번을 붙여 유일성을 보장합니다.
+#  - 관계 필드(author, category, post)는 호출하는 쪽에서 지정합니다.
+
+class BulkCategoryFactory(CategoryFactory):
+    name = Sequence(lambda n: f"{fake.word()}-{n}")
+
+
+class BulkTagFactory(TagFactory):
+    name = Sequence(lambda n: f"{fake.word()}-{n}")
+
+
+class BulkPostFactory(PostFactory):
+    title = Sequence(lambda n: f"{fake.sentence()} {n}")
+    category = None
@@ -0,0 +1,259 @@
+# blog/generators.py
+
+import csv
+import hashlib
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import django
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection, connections, models, transaction
+
+from accounts import factories as account_factories
+from accounts.factories import BulkUserFactory
+from blog import factories as blog_factories
+from blog.factories import BulkCategoryFactory, BulkPostFactory, BulkTagFactory, CommentFactory
+
+
+Row = Tuple[Any, ...]
+# 샤드 하나의 생성 결과 : 테이블(모델 레이블) -> 행 목록
+ShardRows = Dict[str, List[Row]]
+
+
+def derive_seed(seed: int, kind: str, index: int) -> int:
+    """전역 seed로부터 샤드별 seed를 유도합니다. 워커 수와 무관하게 같은 샤드는 같은 데이터를 생성합니다."""
+    digest = hashlib.sha256(f"{seed}:{kind}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+@dataclass(frozen=True)
+class Shard:
+    kind: str
+    index: int
+    start: int  # 전체 행 중에서 이 샤드의 시작 순번
+    count: int
+    seed: int
+
+
+# id 컬럼 없이 (post_id, tag_id) 처럼 관계 컬럼만 생성하는 M2M through 모델
+THROUGH_MODEL_LABELS = {"blog.PostTag"}
+
+
+def get_columns(model: type[models.Model]) -> List[str]:
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if not (field.primary_key and model._meta.label in THROUGH_MODEL_LABELS)
+    ]
+
+
+def to_row(obj: models.Model) -> Row:
+    # DB 어댑팅까지 워커에서 처리하여, 메인 프로세스는 쓰기만 담당합니다.
+    return tuple(
+        field.get_db_prep_save(getattr(obj, field.attname), connection)
+        for field in obj._meta.concrete_fields
+    )
+
+
+class RowBuilders:
+    """종류별로 샤드의 행을 생성합니다. 워커 프로세스에서 실행됩니다.
+
+    - 유일성은 fake.unique 대신, 팩토리 sequence를 할당할 pk에 맞춰 결정적 접미사로 보장합니다.
+      (블로그 데이터를 지우고 다시 생성해도 사용자는 유지되므로, 이전 실행과 이름이 겹치지 않도록 id_base를 포함합니다.)
+    - pk는 context의 id_base + 전체 순번으로 미리 지정하여, 관계 행을 INSERT 결과 없이 생성합니다.
+    """
+
+    @staticmethod
+    def user(shard: Shard, rng: random.Random, context: Dict) -> ShardRows:
+        BulkUserFactory.reset_sequence(context["id_base"] + shard.start, force=True)
+        rows = []
+        for i in range(shard.count):
+            user = BulkUserFactory.build(password=context["password"])
+            user.pk = context["id_base"] + shard.start + i + 1
+            user.date_joined = context["now"]
+            rows.append(to_row(user))
+        return {"accounts.User": rows}
+
+    @staticmethod
+    def category(shard: Shard, rng: random.Random, context: Dict) -> ShardRows:
+        BulkCategoryFactory.reset_sequence(context["id_base"] + shard.start, force=True)
+        rows = []
+        for i in range(shard.count):
+            category = BulkCategoryFactory.build()
+            category.pk = context["id_base"] + shard.start + i + 1
+            rows.append(to_row(category))
+        return {"blog.Category": rows}
+
+    @staticmethod
+    def tag(shard: Shard, rng: random.Random, context: Dict) -> ShardRows:
+        BulkTagFactory.reset_sequence(context["id_base"] + shard.start, force=True)
+        rows = []
+        for i in range(shard.count):
+            tag = BulkTagFactory.build()
+            tag.pk = context["id_base"] + shard.start + i + 1
+            rows.append(to_row(tag))
+        return {"blog.Tag": rows}
+
+    @staticmethod
+    def post(shard: Shard, rng: random.Random, context: Dict) -> ShardRows:
+        User = apps.get_model("accounts", "User")
+        Category = apps.get_model("blog", "Category")
+
+        BulkPostFactory.reset_sequence(context["id_base"] + shard.start, force=True)
+        author_ids: Sequence[int] = context["author_ids"]
+        category_ids: Sequence[int] = context["category_ids"]
+        tag_ids: Sequence[int] = context["tag_ids"]
+        max_tags_per_post = min(context["max_tags_per_post"], len(tag_ids))
+
+        post_rows, post_tag_rows = [], []
+        for i in range(shard.count):
+            index = shard.start + i
+            post = BulkPostFactory.build(
+                author=User(pk=author_ids[index % len(author_ids)]),
+                category=Category(pk=rng.choice(category_ids)),
+            )
+            post.pk = context["id_base"] + index + 1
+            post.created_at = post.updated_at = context["now"]
+            post_rows.append(to_row(post))
+
+            if max_tags_per_post > 0:
+                for tag_id in rng.sample(tag_ids, rng.randint(1, max_tags_per_post)):
+                    post_tag_rows.append((post.pk, tag_id))
+
+        return {"blog.Post": post_rows, "blog.PostTag": post_tag_rows}
+
+    @staticmethod
+    def comment(shard: Shard, rng: random.Random, context: Dict) -> ShardRows:
+        User = apps.get_model("accounts", "User")
+        Post = apps.get_model("blog", "Post")
+
+        author_ids: Sequence[int] = context["author_ids"]
+        post_ids: Sequence[int] = context["post_ids"]
+
+        rows = []
+        for i in range(shard.count):
+            index = shard.start + i
+            comment = CommentFactory.build(
+                author=User(pk=author_ids[index % len(author_ids)]),
+                post=Post(pk=rng.choice(post_ids)),
+            )
+            comment.pk = context["id_base"] + index + 1
+            comment.created_at = comment.updated_at = context["now"]
+            rows.append(to_row(comment))
+        return {"blog.Comment": rows}
+
+
+def generate_shard(shard: Shard, context: Dict) -> ShardRows:
+    if not apps.ready:  # spawn 방식의 워커 프로세스
+        django.setup()
+
+    rng = random.Random(shard.seed)
+    # 팩토리가 사용하는 모듈 수준 Faker의 난수 생성기를 샤드 seed로 고정
+    account_factories.fake.seed_instance(shard.seed)
+    blog_factories.fake.seed_instance(shard.seed)
+    return getattr(RowBuilders, shard.kind)(shard, rng, context)
+
+
+class RowPipeline:
+    """행 생성을 샤드 단위로 프로세스 풀에 분산하고, 샤드 순서대로 결과를 스트리밍합니다.
+
+    동시에 처리 중인 샤드 수를 제한하여, 쓰기가 생성보다 느려도 메모리가 계속 늘지 않습니다.
+    """
+
+    def __init__(self, seed: int = 0, workers: int = 1, shard_size: int = 10_000):
+        self.seed = seed
+        self.workers = max(1, workers)
+        self.shard_size = shard_size
+
+    def make_shards(self, kind: str, total: int) -> Iterator[Shard]:
+        for index, start in enumerate(range(0, total, self.shard_size)):
+            count = min(self.shard_size, total - start)
+            yield Shard(kind, index, start, count, derive_seed(self.seed, kind, index))
+
+    def iter_shards(self, kind: str, total: int, context: Dict) -> Iterator[ShardRows]:
+        shards = self.make_shards(kind, total)
+
+        if self.workers == 1:
+            for shard in shards:
+                yield generate_shard(shard, context)
+            return
+
+        # fork 전에 DB 연결을 닫아, 자식 프로세스가 연결을 공유하지 않도록 합니다.
+        connections.close_all()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for shard in shards:
+                pending.append(executor.submit(generate_shard, shard, context))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+class DatabaseWriter:
+    """생성된 행을 배치 단위 INSERT로 저장합니다."""
+
+    def __init__(self, batch_size: int = 5000):
+        self.batch_size = batch_size
+        self.written_models = set()
+
+    def write(self, label: str, rows: List[Row]) -> None:
+        model = get_model(label)
+        columns = get_columns(model)
+        table = connection.ops.quote_name(model._meta.db_table)
+        column_sql = ", ".join(connection.ops.quote_name(column) for column in columns)
+        placeholders = ", ".join(["%s"] * len(columns))
+        sql = f"INSERT INTO {table} ({column_sql}) VALUES ({placeholders})"
+        self.written_models.add(model)
+
+        for i in range(0, len(rows), self.batch_size):
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(sql, rows[i:i + self.batch_size])
+
+    def close(self) -> None:
+        # pk를 직접 지정하여 INSERT 했으므로, PostgreSQL 등의 시퀀스를 최댓값으로 맞춥니다.
+        sql_list = connection.ops.sequence_reset_sql(no_style(), list(self.written_models))
+        if sql_list:
+            with connection.cursor() as cursor:
+                for sql in sql_list:
+                    cursor.execute(sql)
+
+
+class CsvWriter:
+    """생성된 행을 테이블별 CSV 파일로 저장합니다. (PostgreSQL COPY, sqlite3 .import 용)"""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.paths: Dict[str, Path] = {}
+
+    def write(self, label: str, rows: List[Row]) -> None:
+        model = get_model(label)
+        path = self.output_dir / f"{model._meta.db_table}.csv"
+        is_new = label not in self.paths
+        self.paths[label] = path
+
+        with open(path, "w" if is_new else "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if is_new:
+                writer.writerow(get_columns(model))
+            writer.writerows(rows)
+
+    def close(self) -> None:
+        pass
+
+
+def get_model(label: str) -> type[models.Model]:
+    app_label, model_name = label.split(".")
+    return apps.get_model(app_label, model_name)
+
+
+def get_default_workers() -> int:
+    return os.cpu_count() or 1
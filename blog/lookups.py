@@ -0,0 +1,136 @@
+# blog/lookups.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from django.core.cache import cache
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Category, Post, Tag
+
+
+# 모델별 세대(generation) 번호. 모델이 저장/삭제될 때마다 증가하며,
+# 프로세스 내 캐시는 세대 번호가 바뀌면 다시 생성됩니다. (여러 프로세스 간에는 Django 캐시로 공유)
+GENERATION_KEY_PREFIX = "blog:generation"
+
+# 프로세스 간에 공유되지 않는 캐시(locmem 등)를 지정한 경우에도, 다른 프로세스(관리 명령)의 변경이
+# 이 시간(초) 안에는 반영되도록 프로세스 내 캐시를 다시 생성합니다.
+LOOKUP_MAX_AGE = 300
+
+
+def get_generation_key(model: type[models.Model]) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def get_generation(model: type[models.Model]) -> int:
+    key = get_generation_key(model)
+    generation = cache.get(key)
+    if generation is None:
+        # 캐시가 비워진 뒤에도 이전 세대 번호와 겹치지 않도록 현재 시각으로 시작합니다.
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(model: type[models.Model]) -> int:
+    key = get_generation_key(model)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+        return cache.incr(key)
+
+
+class SlugListCache:
+    """카테고리/태그처럼 개수가 적은 모델의 전체 목록과 slug 맵을 프로세스 내에 보관합니다."""
+
+    def __init__(self, model: type[models.Model]):
+        self.model = model
+        self.lock = threading.Lock()
+        self.generation: Optional[int] = None
+        self.loaded_at = 0.0
+        self.object_list: List[models.Model] = []
+        self.by_slug: Dict[str, models.Model] = {}
+
+    def get_list(self) -> List[models.Model]:
+        self._refresh()
+        return self.object_list
+
+    def get(self, slug: str) -> Optional[models.Model]:
+        self._refresh()
+        return self.by_slug.get(slug)
+
+    def is_fresh(self, generation: int) -> bool:
+        return self.generation == generation and time.monotonic() - self.loaded_at < LOOKUP_MAX_AGE
+
+    def _refresh(self) -> None:
+        generation = get_generation(self.model)
+        if self.is_fresh(generation):
+            return
+        with self.lock:
+            if self.is_fresh(generation):
+                return
+            object_list = list(self.model.objects.all())
+            self.by_slug = {obj.slug: obj for obj in object_list}
+            self.object_list = object_list
+            self.generation = generation
+            self.loaded_at = time.monotonic()
+
+
+class SlugIdCache:
+    """게시물처럼 개수가 많은 모델은 조회된 slug -> id 만 LRU 방식으로 보관합니다."""
+
+    def __init__(self, model: type[models.Model], maxsize: int = 10_000):
+        self.model = model
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.generation: Optional[int] = None
+        self.cleared_at = 0.0
+        self.ids: OrderedDict[str, int] = OrderedDict()
+
+    def get_id(self, slug: str) -> Optional[int]:
+        generation = get_generation(self.model)
+        with self.lock:
+            if self.generation != generation or time.monotonic() - self.cleared_at >= LOOKUP_MAX_AGE:
+                self.ids.clear()
+                self.generation = generation
+                self.cleared_at = time.monotonic()
+            pk = self.ids.get(slug)
+            if pk is not None:
+                self.ids.move_to_end(slug)
+                return pk
+
+        # 존재하지 않는 slug는 보관하지 않습니다.
+        pk = self.model.objects.filter(slug=slug).values_list("pk", flat=True).first()
+        if pk is not None:
+            with self.lock:
+                if self.generation == generation:
+                    self.ids[slug] = pk
+                    if len(self.ids) > self.maxsize:
+                        self.ids.popitem(last=False)
+        return pk
+
+
+category_cache = SlugListCache(Category)
+tag_cache = SlugListCache(Tag)
+post_slug_cache = SlugIdCache(Post)
+
+
+def invalidate_blog_lookups() -> None:
+    """시그널 없이 변경한 경우 (raw SQL, 대량 생성 등) 호출합니다."""
+    for model in (Category, Tag, Post):
+        bump_generation(model)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_lookup_cache(sender, **kwargs):
+    bump_generation(sender)
@@ -1,9 +1,14 @@
-from django.core.management.base import BaseCommand
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
 
 from accounts.factories import UserFactory
 from blog.factories import CategoryFactory, TagFactory, PostFactory, CommentFactory
 from blog.models import Category, Post, Tag, Comment
+from blog.counters import reconcile_post_counters
+from blog.generators import CsvWriter, get_default_workers
+from blog.seeding import BulkSeeder, wipe_blog_data
 
 
 User = get_user_model()
@@ -12,7 +17,35 @@ User = get_user_model()
 class Command(BaseCommand):
     help = 'Generates fake data for blog app'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--noinput', '--no-input', action='store_false', dest='interactive',
+            help='Do not prompt before deleting existing blog data',
+        )
+        parser.add_argument(
+            '--scale', type=int, default=None,
+            help='Number of posts to generate through the bulk path (e.g. 1000000)',
+        )
+        parser.add_argument(
+            '--comments-per-post', type=int, default=10,
+            help='Average number of comments per post in bulk mode',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT batch in bulk mode')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for deterministic data')
+        parser.add_argument(
+            '--workers', type=int, default=get_default_workers(),
+            help='Number of processes generating rows in bulk mode',
+        )
+        parser.add_argument('--shard-size', type=int, default=10_000, help='Rows generated per worker task')
+        parser.add_argument(
+            '--output-dir', type=Path, default=None,
+            help='Write CSV files per table (for COPY / .import) instead of inserting into the database',
+        )
+
     def handle(self, *args, **options):
+        if options['output_dir'] is not None and options['scale'] is None:
+            raise CommandError('--output-dir requires --scale')
+
         self.stdout.write('Creating fake data...')
 
         # Create users if not exist
@@ -25,16 +58,32 @@ class Command(BaseCommand):
             )
             UserFactory.create_batch(5)
 
-        confirm = input('This will delete all Category, Tag, Post, Comment data. Do you want to proceed? [Y/n]: ').lower()
-        if (not confirm) or confirm.startswith('y'):
+        # CSV로만 내보낼 때는 데이터베이스의 기존 데이터를 건드리지 않습니다.
+        if options['output_dir'] is None:
+            if options['interactive']:
+                confirm = input(
+                    'This will delete all Category, Tag, Post, Comment data and reset their ids. '
+                    'Do you want to proceed? [y/N]: '
+                ).lower()
+                if not confirm.startswith('y'):
+                    self.stdout.write(self.style.ERROR('Operation cancelled.'))
+                    return
+
             self.stdout.write('Deleting all Category, Tag, Post, Comment data...')
-            Category.objects.all().delete()
-            Tag.objects.all().delete()
-            Post.objects.all().delete()
-            Comment.objects.all().delete()
+            for table, count in wipe_blog_data().items():
+                self.stdout.write(f'  {table}: {count:,} rows deleted')
             self.stdout.write(self.style.WARNING('All existing Category, Tag, Post, Comment data have been deleted.'))
-        else:
-            self.stdout.write(self.style.ERROR('Operation cancelled.'))
+
+        if options['scale'] is not None:
+            self.handle_bulk(
+                scale=options['scale'],
+                comments_per_post=options['comments_per_post'],
+                batch_size=options['batch_size'],
+                seed=options['seed'],
+                workers=options['workers'],
+                shard_size=options['shard_size'],
+                output_dir=options['output_dir'],
+            )
             return
 
         # Generate Categories
@@ -54,3 +103,36 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'Created {Comment.objects.count()} comments'))
 
         self.stdout.write(self.style.SUCCESS('Fake data generation completed!'))
+
+    def handle_bulk(self, scale, comments_per_post, batch_size, seed, workers, shard_size, output_dir):
+        """부하 테스트용 대량 데이터를 여러 프로세스에서 생성하여 배치 INSERT 또는 CSV로 저장합니다."""
+        seeder = BulkSeeder(
+            seed=seed,
+            batch_size=batch_size,
+            workers=workers,
+            shard_size=shard_size,
+            writer=CsvWriter(output_dir) if output_dir else None,
+            stdout=self.stdout,
+        )
+
+        # 규모에 비례하여 사용자/카테고리/태그 수를 결정합니다.
+        user_count = max(5, scale // 100)
+        category_count = max(100, scale // 10_000)
+        tag_count = max(100, scale // 1_000)
+
+        user_ids = seeder.seed_users(max(0, user_count - User.objects.count()))
+        category_ids = seeder.seed_categories(category_count)
+        tag_ids = seeder.seed_tags(tag_count)
+        post_ids = seeder.seed_posts(scale, author_ids=user_ids, category_ids=category_ids, tag_ids=tag_ids)
+        seeder.seed_comments(scale * comments_per_post, author_ids=user_ids, post_ids=post_ids)
+        seeder.close()
+
+        if output_dir:
+            self.stdout.write(f'CSV files have been written to {output_dir}')
+            self.stdout.write('Run reconcile_post_counters after importing them to fill in the comment counters.')
+        else:
+            # 행을 직접 INSERT 했으므로, 게시물의 댓글 카운터를 한 번에 계산합니다.
+            updated = reconcile_post_counters(batch_size=batch_size)
+            self.stdout.write(f'Reconciled comment counters of {updated:,} posts')
+
+        self.stdout.write(self.style.SUCCESS('Bulk fake data generation completed!'))
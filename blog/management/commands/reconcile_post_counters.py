@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.counters import reconcile_post_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute Post.comment_count and Post.last_commented_at from the comment table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Posts updated per transaction")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        def progress(updated, last_id):
+            self.stdout.write(f"  {updated:,} posts updated (up to id {last_id:,})")
+
+        updated = reconcile_post_counters(batch_size=options["batch_size"], progress=progress)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(f"Reconciled comment counters of {updated:,} posts in {elapsed:.2f}s"))
@@ -0,0 +1,74 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0001_initial"),
+    ]
+
+    operations = [
+        # Post.tags의 자동 생성 through 테이블(blog_post_tags)을 명시적인 PostTag 모델로 전환합니다.
+        # 테이블/컬럼/유니크 제약은 그대로이므로 상태(state)만 변경합니다.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="PostTag",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "post",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                to="blog.post",
+                            ),
+                        ),
+                        (
+                            "tag",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                to="blog.tag",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "blog_post_tags",
+                        "unique_together": {("post", "tag")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="post",
+                    name="tags",
+                    field=models.ManyToManyField(
+                        blank=True,
+                        related_name="post_set",
+                        through="blog.PostTag",
+                        to="blog.tag",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["category", "-id"], name="blog_post_category_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="posttag",
+            index=models.Index(
+                fields=["tag", "post"], name="blog_post_tags_tag_post_idx"
+            ),
+        ),
+    ]
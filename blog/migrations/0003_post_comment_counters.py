@@ -0,0 +1,55 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:23
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_counters(apps, schema_editor):
+    Comment = apps.get_model("blog", "Comment")
+    Post = apps.get_model("blog", "Post")
+
+    comments = Comment.objects.filter(post=OuterRef("pk")).order_by().values("post")
+    Post.objects.update(
+        comment_count=Coalesce(
+            Subquery(comments.annotate(count=Count("pk")).values("count")), 0
+        ),
+        last_commented_at=Subquery(
+            comments.annotate(last=Max("created_at")).values("last")
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0002_post_list_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="last_commented_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["-comment_count", "-id"], name="blog_post_popular_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["-last_commented_at", "-id"], name="blog_post_activity_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_comment_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0003_post_comment_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["post", "-id"], name="blog_comment_post_id_idx"),
+        ),
+    ]
@@ -1,5 +1,9 @@
+from collections import defaultdict
+
 from django.conf import settings
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Coalesce, Greatest
 from django.urls import reverse
 
 
@@ -37,7 +41,10 @@ class Post(models.Model):
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=200, unique=True, allow_unicode=True)
     content = models.TextField()
-    tags = models.ManyToManyField(Tag, blank=True, related_name='post_set')
+    tags = models.ManyToManyField(Tag, through='PostTag', blank=True, related_name='post_set')
+    # 댓글 생성/삭제 시에 갱신되는 비정규화 필드 (blog/counters.py 참고)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+    last_commented_at = models.DateTimeField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -49,6 +56,50 @@ class Post(models.Model):
 
     class Meta:
         ordering = ['-id']
+        indexes = [
+            # 카테고리별 목록 (WHERE category_id = ? ORDER BY id DESC)
+            models.Index(fields=['category', '-id'], name='blog_post_category_id_idx'),
+            # 인기순/최근 댓글순 목록
+            models.Index(fields=['-comment_count', '-id'], name='blog_post_popular_idx'),
+            models.Index(fields=['-last_commented_at', '-id'], name='blog_post_activity_idx'),
+        ]
+
+
+class PostTag(models.Model):
+    # Post.tags의 through 테이블. 기존 자동 생성 테이블(blog_post_tags)을 그대로 사용하며,
+    # 태그별 목록 조회를 위해 (tag, post) 인덱스를 추가합니다.
+    post = models.ForeignKey(Post, on_delete=models.CASCADE)
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'blog_post_tags'
+        unique_together = [('post', 'tag')]
+        indexes = [
+            models.Index(fields=['tag', 'post'], name='blog_post_tags_tag_post_idx'),
+        ]
+
+
+class CommentQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create는 post_save 시그널을 보내지 않으므로, 게시물별로 모아 카운터를 갱신합니다.
+        objs = super().bulk_create(objs, *args, **kwargs)
+
+        counts = defaultdict(int)
+        last_created_at = {}
+        for comment in objs:
+            counts[comment.post_id] += 1
+            if comment.post_id not in last_created_at or last_created_at[comment.post_id] < comment.created_at:
+                last_created_at[comment.post_id] = comment.created_at
+
+        for post_id, count in counts.items():
+            Post.objects.filter(pk=post_id).update(
+                comment_count=F('comment_count') + count,
+                last_commented_at=Greatest(
+                    Coalesce('last_commented_at', last_created_at[post_id]),
+                    last_created_at[post_id],
+                ),
+            )
+        return objs
 
 
 class Comment(models.Model):
@@ -58,8 +109,14 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CommentQuerySet.as_manager()
+
     def __str__(self):
         return f"Comment by {self.author} on {self.post}"
 
     class Meta:
         ordering = ['-id']
+        indexes = [
+            # 게시물별 댓글 목록 (WHERE post_id = ? AND id < ? ORDER BY id DESC)
+            models.Index(fields=['post', '-id'], name='blog_comment_post_id_idx'),
+        ]
@@ -0,0 +1,77 @@
+# blog/pagination.py
+
+from typing import List, Optional, Tuple
+
+from django.db.models import Model, Q, QuerySet
+from django.http import HttpRequest
+
+
+class KeysetPaginator:
+    """id 기준 keyset 페이지네이션.
+
+    OFFSET은 앞 페이지의 행을 모두 건너뛰어야 하므로 뒤 페이지일수록 느려지고, COUNT 쿼리도 필요합니다.
+    대신 이전 페이지의 마지막 id를 커서(?before=id)로 받아 WHERE id < ? ORDER BY id DESC LIMIT n 으로 조회합니다.
+    다음 페이지 존재 여부는 n + 1개를 조회하여 판단하므로, 페이지당 쿼리 수가 일정합니다.
+
+    order_field를 지정하면 (order_field DESC, id DESC) 순으로 정렬하며, 커서는 "값,id" 형식입니다.
+    order_field 값이 NULL인 행은 호출하는 쪽에서 제외해야 합니다.
+    """
+
+    cursor_param = "before"
+
+    def __init__(self, request: HttpRequest, page_size: int, order_field: Optional[str] = None):
+        self.request = request
+        self.page_size = page_size
+        self.order_field = order_field
+
+    def get_cursor(self, queryset: QuerySet) -> Optional[Tuple]:
+        value = self.request.GET.get(self.cursor_param, "")
+
+        if self.order_field is None:
+            return (int(value),) if value.isdigit() else None
+
+        order_value, _, pk = value.rpartition(",")
+        if not order_value or not pk.isdigit():
+            return None
+        field = queryset.model._meta.get_field(self.order_field)
+        try:
+            return field.to_python(order_value), int(pk)
+        except Exception:
+            return None
+
+    def paginate(self, queryset: QuerySet) -> Tuple[List[Model], Optional[str]]:
+        """현재 페이지의 객체 목록과 다음 페이지 주소(없으면 None)를 반환합니다."""
+        cursor = self.get_cursor(queryset)
+
+        if self.order_field is None:
+            if cursor is not None:
+                queryset = queryset.filter(pk__lt=cursor[0])
+            queryset = queryset.order_by("-pk")
+        else:
+            if cursor is not None:
+                order_value, pk = cursor
+                queryset = queryset.filter(
+                    Q(**{f"{self.order_field}__lt": order_value})
+                    | Q(**{self.order_field: order_value, "pk__lt": pk})
+                )
+            queryset = queryset.order_by(f"-{self.order_field}", "-pk")
+
+        object_list = list(queryset[: self.page_size + 1])
+        if len(object_list) <= self.page_size:
+            return object_list, None
+
+        object_list = object_list[: self.page_size]
+        return object_list, self.get_page_url(self.make_cursor(object_list[-1]))
+
+    def make_cursor(self, obj: Model) -> str:
+        if self.order_field is None:
+            return str(obj.pk)
+        order_value = getattr(obj, self.order_field)
+        if hasattr(order_value, "isoformat"):
+            order_value = order_value.isoformat()
+        return f"{order_value},{obj.pk}"
+
+    def get_page_url(self, cursor: str) -> str:
+        query = self.request.GET.copy()
+        query[self.cursor_param] = cursor
+        return f"{self.request.path}?{query.urlencode()}"
@@ -0,0 +1,151 @@
+# blog/seeding.py
+
+import time
+from typing import Dict, List, Optional, Sequence, Union
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import OutputWrapper
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from accounts.factories import get_prehashed_password
+from blog.generators import CsvWriter, DatabaseWriter, RowPipeline
+from blog.lookups import invalidate_blog_lookups
+from blog.sitemaps import invalidate_sitemaps
+from blog.models import Category, Comment, Post, PostTag, Tag
+
+
+User = get_user_model()
+
+Writer = Union[DatabaseWriter, CsvWriter]
+
+
+def get_blog_tables() -> List[str]:
+    # 참조하는 테이블부터 삭제하도록 의존성 순서로 나열합니다.
+    return [
+        Comment._meta.db_table,
+        PostTag._meta.db_table,
+        Post._meta.db_table,
+        Tag._meta.db_table,
+        Category._meta.db_table,
+    ]
+
+
+def wipe_blog_data() -> Dict[str, int]:
+    """블로그 테이블의 모든 행을 삭제하고, 테이블별 삭제된 행 수를 반환합니다.
+
+    ORM의 delete()는 모든 행을 읽어 cascade를 따라가므로 대량 데이터에서 매우 느립니다.
+    대신 백엔드별 flush SQL(SQLite : DELETE + sqlite_sequence 초기화,
+    PostgreSQL : TRUNCATE ... RESTART IDENTITY)을 테이블 단위로 실행합니다.
+    """
+    tables = get_blog_tables()
+
+    with connection.cursor() as cursor:
+        counts = {}
+        for table in tables:
+            cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}")
+            counts[table] = cursor.fetchone()[0]
+
+    sql_list = connection.ops.sql_flush(no_style(), tables, reset_sequences=True)
+    with transaction.atomic():
+        connection.ops.execute_sql_flush(sql_list)
+    invalidate_blog_lookups()
+    # id가 처음부터 다시 시작하므로, 이어 붙이던 sitemap/feed도 다시 생성합니다.
+    invalidate_sitemaps()
+    return counts
+
+
+class BulkSeeder:
+    """대량의 블로그 데이터를 생성합니다.
+
+    - 행 생성은 RowPipeline을 통해 샤드 단위로 프로세스 풀에 분산됩니다.
+    - 생성된 행은 배치 INSERT(DatabaseWriter) 또는 CSV 파일(CsvWriter)로 스트리밍됩니다.
+    - 모든 사용자는 미리 해싱된 하나의 비밀번호를 공유합니다.
+    - Post.tags 관계는 through 테이블 행으로 함께 생성됩니다.
+    - 같은 seed로 실행하면 워커 수와 무관하게 같은 데이터가 생성됩니다.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        batch_size: int = 5000,
+        workers: int = 1,
+        shard_size: int = 10_000,
+        writer: Optional[Writer] = None,
+        stdout: Optional[OutputWrapper] = None,
+    ):
+        self.pipeline = RowPipeline(seed=seed, workers=workers, shard_size=shard_size)
+        self.writer = writer or DatabaseWriter(batch_size=batch_size)
+        self.stdout = stdout
+        self.now = timezone.now()
+
+    def seed_users(self, count: int) -> List[int]:
+        # 기존 사용자도 작성자로 사용합니다. (CSV 출력 시에는 새 사용자가 DB에 없으므로 범위를 더합니다.)
+        existing_ids = list(User.objects.order_by("id").values_list("id", flat=True))
+        created_ids = self._generate("user", User, count, {"password": get_prehashed_password()})
+        return existing_ids + list(created_ids)
+
+    def seed_categories(self, count: int) -> Sequence[int]:
+        return self._generate("category", Category, count)
+
+    def seed_tags(self, count: int) -> Sequence[int]:
+        return self._generate("tag", Tag, count)
+
+    def seed_posts(
+        self,
+        count: int,
+        author_ids: Sequence[int],
+        category_ids: Sequence[int],
+        tag_ids: Sequence[int],
+        max_tags_per_post: int = 5,
+    ) -> Sequence[int]:
+        return self._generate("post", Post, count, {
+            "author_ids": author_ids,
+            "category_ids": category_ids,
+            "tag_ids": tag_ids,
+            "max_tags_per_post": max_tags_per_post,
+        })
+
+    def seed_comments(self, count: int, author_ids: Sequence[int], post_ids: Sequence[int]) -> Sequence[int]:
+        return self._generate("comment", Comment, count, {
+            "author_ids": author_ids,
+            "post_ids": post_ids,
+        })
+
+    def close(self) -> None:
+        self.writer.close()
+        # 시그널 없이 INSERT 했으므로, slug 캐시를 직접 무효화합니다.
+        invalidate_blog_lookups()
+
+    def _generate(self, kind: str, model: type[models.Model], count: int, context: Optional[Dict] = None) -> range:
+        """count개의 행을 생성하여 기록하고, 생성된 pk 범위를 반환합니다."""
+        # pk를 미리 지정하므로, 기존 최대 pk 다음부터 연속된 범위를 사용합니다.
+        id_base = model.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+        context = {**(context or {}), "id_base": id_base, "now": self.now}
+
+        started = time.perf_counter()
+        created = 0
+        # 진행 상황은 10% 단위로 출력합니다.
+        report_step = max(count // 10, 1)
+        next_report = report_step
+
+        for shard_rows in self.pipeline.iter_shards(kind, count, context):
+            for label, rows in shard_rows.items():
+                self.writer.write(label, rows)
+            created += len(shard_rows[model._meta.label])
+
+            if next_report <= created < count:
+                next_report += report_step
+                self._write_throughput(f"  {model._meta.verbose_name_plural}: {created:,}/{count:,}", created, started)
+
+        self._write_throughput(f"Created {created:,} {model._meta.verbose_name_plural}", created, started)
+        return range(id_base + 1, id_base + count + 1)
+
+    def _write_throughput(self, message: str, created: int, started: float) -> None:
+        if self.stdout is None:
+            return
+        elapsed = time.perf_counter() - started
+        rows_per_second = created / elapsed if elapsed else 0
+        self.stdout.write(f"{message} in {elapsed:.1f}s ({rows_per_second:,.0f} rows/s)")
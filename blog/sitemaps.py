@@ -0,0 +1,250 @@
+# blog/sitemaps.py
+
+import abc
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from django.core.cache import cache
+from django.db.models import Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.feedgenerator import rfc3339_date
+from django.utils.html import escape
+from django.utils.http import quote_etag
+from django.utils.text import Truncator
+
+from .models import Post
+
+
+# sitemap 한 파일에 담을 게시물 id 범위. (sitemap 규격상 한 파일은 최대 50,000 URL)
+SITEMAP_PAGE_SIZE = 10_000
+FEED_SIZE = 50
+
+KEY_PREFIX = "blog:sitemap"
+
+SITEMAP_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+SITEMAP_FOOTER = "</urlset>\n"
+
+
+@dataclass
+class Document:
+    """캐싱된 sitemap/feed 문서. last_id 이후의 게시물만 조회하여 이어 붙입니다."""
+
+    revision: tuple
+    body: str
+    last_id: int = 0
+    count: int = 0
+    last_modified: Optional[datetime] = None
+    entries: List[str] = field(default_factory=list)  # feed 항목 (최신순)
+
+    def get_etag(self) -> str:
+        timestamp = self.last_modified.timestamp() if self.last_modified else 0
+        return quote_etag(f"{self.last_id}-{self.count}-{timestamp}")
+
+    def touch(self, modified_at: datetime) -> None:
+        if self.last_modified is None or self.last_modified < modified_at:
+            self.last_modified = modified_at
+
+
+def get_origin_key(request: HttpRequest) -> str:
+    # 문서에 절대 주소가 포함되므로 scheme/host 별로 캐싱합니다.
+    origin = f"{request.scheme}://{request.get_host()}"
+    return hashlib.sha256(origin.encode("utf-8")).hexdigest()[:12]
+
+
+def get_revision_key(name: str) -> str:
+    return f"{KEY_PREFIX}:rev:{name}"
+
+
+def bump_revision(name: str) -> None:
+    key = get_revision_key(name)
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 1, timeout=None)
+
+
+def invalidate_sitemaps() -> None:
+    """모든 sitemap 페이지와 feed를 다시 생성하도록 합니다. (wipe_blog_data 처럼 id가 처음부터 다시 시작하는 경우)"""
+    bump_revision("all")
+
+
+class IncrementalDocument(abc.ABC):
+    """게시물이 추가되면 새 게시물만 조회하여 기존 문서에 이어 붙이는 문서.
+
+    - 게시물 추가 : 캐싱된 문서의 last_id 이후 게시물만 (pk 인덱스로) 조회하여 이어 붙입니다.
+    - 게시물 수정/삭제 : 해당 문서의 revision을 올려, 다음 요청에서 처음부터 다시 생성합니다.
+    """
+
+    name: str
+
+    def __init__(self, request: HttpRequest):
+        self.request = request
+        self.key = f"{KEY_PREFIX}:{get_origin_key(request)}:{self.name}"
+
+    def get_document(self) -> Document:
+        revision_keys = [get_revision_key("all"), get_revision_key(self.name)]
+        values = cache.get_many([self.key, *revision_keys])
+        revision = tuple(values.get(key, 0) for key in revision_keys)
+
+        document = values.get(self.key)
+        is_new = document is None or document.revision != revision
+        if is_new:
+            document = self.create_document(revision)
+
+        if self.append_new_posts(document) or is_new:
+            cache.set(self.key, document, timeout=None)
+        return document
+
+    @abc.abstractmethod
+    def create_document(self, revision: tuple) -> Document:
+        """revision에 해당하는 빈 문서를 생성합니다."""
+
+    @abc.abstractmethod
+    def append_new_posts(self, document: Document) -> bool:
+        """새 게시물을 문서에 추가합니다. 추가된 게시물이 있으면 True."""
+
+    def get_post_url(self, slug: str) -> str:
+        return self.request.build_absolute_uri(reverse("blog:post_detail", args=[slug]))
+
+
+class SitemapPage(IncrementalDocument):
+    def __init__(self, request: HttpRequest, page: int):
+        self.name = f"page:{page}"
+        self.start_id = (page - 1) * SITEMAP_PAGE_SIZE
+        self.end_id = page * SITEMAP_PAGE_SIZE
+        super().__init__(request)
+
+    def create_document(self, revision: tuple) -> Document:
+        return Document(revision=revision, body=SITEMAP_HEADER + SITEMAP_FOOTER, last_id=self.start_id)
+
+    def append_new_posts(self, document: Document) -> bool:
+        qs = (
+            Post.objects.filter(pk__gt=document.last_id, pk__lte=self.end_id)
+            .order_by("pk")
+            .values_list("pk", "slug", "updated_at")
+        )
+        urls = []
+        for pk, slug, updated_at in qs.iterator(chunk_size=2000):
+            urls.append(
+                f"<url><loc>{escape(self.get_post_url(slug))}</loc>"
+                f"<lastmod>{rfc3339_date(updated_at)}</lastmod></url>\n"
+            )
+            document.last_id = pk
+            document.touch(updated_at)
+
+        if not urls:
+            return False
+        document.body = document.body[: -len(SITEMAP_FOOTER)] + "".join(urls) + SITEMAP_FOOTER
+        document.count += len(urls)
+        return True
+
+
+class AtomFeed(IncrementalDocument):
+    name = "feed"
+
+    def create_document(self, revision: tuple) -> Document:
+        return Document(revision=revision, body="")
+
+    def append_new_posts(self, document: Document) -> bool:
+        posts = list(
+            Post.objects.filter(pk__gt=document.last_id)
+            .select_related("author")
+            .order_by("-pk")[:FEED_SIZE]
+        )
+        if not posts and document.body:
+            return False
+
+        new_entries = []
+        for post in posts:
+            document.touch(post.updated_at)
+            new_entries.append(self.render_entry(post))
+        if posts:
+            document.last_id = posts[0].pk
+        document.entries = (new_entries + document.entries)[:FEED_SIZE]
+        document.count = len(document.entries)
+        document.body = self.render_feed(document)
+        return True
+
+    def render_entry(self, post: Post) -> str:
+        url = escape(self.get_post_url(post.slug))
+        summary = escape(Truncator(post.content).chars(200))
+        return (
+            "<entry>"
+            f"<title>{escape(post.title)}</title>"
+            f'<link href="{url}" rel="alternate"/>'
+            f"<id>{url}</id>"
+            f"<published>{rfc3339_date(post.created_at)}</published>"
+            f"<updated>{rfc3339_date(post.updated_at)}</updated>"
+            f"<author><name>{escape(post.author.username)}</name></author>"
+            f'<summary type="text">{summary}</summary>'
+            "</entry>\n"
+        )
+
+    def render_feed(self, document: Document) -> str:
+        feed_url = escape(self.request.build_absolute_uri(reverse("blog:feed")))
+        index_url = escape(self.request.build_absolute_uri(reverse("blog:index")))
+        updated = rfc3339_date(document.last_modified or timezone.now())
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="ko">\n'
+            "<title>pyhub-htmx-examples 블로그</title>\n"
+            f'<link href="{index_url}" rel="alternate"/>\n'
+            f'<link href="{feed_url}" rel="self"/>\n'
+            f"<id>{index_url}</id>\n"
+            f"<updated>{updated}</updated>\n"
+            + "".join(document.entries)
+            + "</feed>\n"
+        )
+
+
+def get_page_count() -> int:
+    """sitemap 페이지 수. 게시물이 없어도 1페이지는 있습니다."""
+    max_id = Post.objects.aggregate(max_id=Max("pk"))["max_id"] or 0
+    return max(1, -(-max_id // SITEMAP_PAGE_SIZE))
+
+
+def render_sitemap_index(request: HttpRequest) -> str:
+    page_count = get_page_count()
+
+    # 이미 생성된 페이지는 캐싱된 문서의 수정 시각을 lastmod로 사용합니다.
+    origin_key = get_origin_key(request)
+    page_keys = [f"{KEY_PREFIX}:{origin_key}:page:{page}" for page in range(1, page_count + 1)]
+    documents = cache.get_many(page_keys)
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n',
+    ]
+    for page, key in enumerate(page_keys, start=1):
+        loc = escape(request.build_absolute_uri(reverse("blog:sitemap_page", args=[page])))
+        document = documents.get(key)
+        lastmod = f"<lastmod>{rfc3339_date(document.last_modified)}</lastmod>" if document and document.last_modified else ""
+        lines.append(f"<sitemap><loc>{loc}</loc>{lastmod}</sitemap>\n")
+    lines.append("</sitemapindex>\n")
+    return "".join(lines)
+
+
+def get_page_number(post_id: int) -> int:
+    return (post_id - 1) // SITEMAP_PAGE_SIZE + 1
+
+
+@receiver(post_save, sender=Post)
+def invalidate_post_documents(sender, instance: Post, created: bool = False, raw: bool = False, **kwargs):
+    # 새 게시물은 다음 요청에서 이어 붙여지므로, 수정된 경우에만 해당 문서를 다시 생성합니다.
+    if created or raw:
+        return
+    bump_revision(f"page:{get_page_number(instance.pk)}")
+    bump_revision(AtomFeed.name)
+
+
+@receiver(post_delete, sender=Post)
+def invalidate_deleted_post_documents(sender, instance: Post, **kwargs):
+    bump_revision(f"page:{get_page_number(instance.pk)}")
+    bump_revision(AtomFeed.name)
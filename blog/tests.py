@@ -1,3 +1,557 @@
-from django.test import TestCase
+import csv
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Sum
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import lookups
+from .generators import RowPipeline, get_columns
+from .lookups import category_cache, post_slug_cache, tag_cache
+from .models import Category, Comment, Post, PostTag, Tag
+from .seeding import wipe_blog_data
+from .sitemaps import Document, IncrementalDocument, SitemapPage
+from .views import PostDetailView
+
+
+User = get_user_model()
+
+
+def create_posts(count, category=None, tags=(), comments_per_post=2):
+    author, _ = User.objects.get_or_create(username="writer")
+    start = Post.objects.count()
+    posts = []
+    for i in range(start, start + count):
+        post = Post.objects.create(
+            author=author,
+            category=category,
+            title=f"게시물 {i}",
+            slug=f"post-{i}",
+            content="본문 " * 100,
+        )
+        post.tags.add(*tags)
+        Comment.objects.bulk_create(
+            Comment(post=post, author=author, content=f"댓글 {j}") for j in range(comments_per_post)
+        )
+        posts.append(post)
+    return posts
+
+
+class PostListQueryTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name="파이썬", slug="python")
+        cls.tags = [Tag.objects.create(name=f"태그{i}", slug=f"tag-{i}") for i in range(3)]
+        cls.posts = create_posts(45, category=cls.category, tags=cls.tags)
+
+    def setUp(self):
+        cache.clear()
+        # 사이드바의 카테고리/태그 목록과 slug 조회는 캐시에서 처리됩니다.
+        category_cache.get_list()
+        tag_cache.get_list()
+
+    def get_with_queries(self, url, data=None, headers=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, data or {}, headers=headers or {})
+        self.assertEqual(response.status_code, 200)
+        return response, [query["sql"] for query in ctx.captured_queries]
+
+    def test_query_count_is_constant_per_page(self):
+        url = reverse("blog:index")
+        first_response, first_sql_list = self.get_with_queries(url)
+
+        # 게시물(작성자/카테고리 포함) 1회 + 태그 prefetch 1회. COUNT 쿼리나 N+1 쿼리가 없어야 합니다.
+        self.assertEqual(len(first_sql_list), 2, first_sql_list)
+
+        next_url = first_response.context["next_url"]
+        self.assertEqual(next_url, f"{url}?before={self.posts[-20].pk}")
+
+        # 뒤 페이지도 OFFSET 없이 같은 수의 쿼리로 조회됩니다.
+        last_response, last_sql_list = self.get_with_queries(url, {"before": self.posts[5].pk})
+        self.assertEqual(len(last_sql_list), 2, last_sql_list)
+        self.assertNotIn("OFFSET", last_sql_list[0].upper())
+        self.assertEqual([post.pk for post in last_response.context["post_list"]], [post.pk for post in reversed(self.posts[:5])])
+        self.assertIsNone(last_response.context["next_url"])
+
+    def test_post_list_renders_related_data(self):
+        response, _ = self.get_with_queries(reverse("blog:index"))
+        post = response.context["post_list"][0]
+        self.assertEqual(post.comment_count, 2)
+        self.assertContains(response, "#태그0")
+        self.assertContains(response, 'hx-trigger="revealed"')
+
+    def test_htmx_request_renders_partial(self):
+        response, _ = self.get_with_queries(
+            reverse("blog:index"), {"before": self.posts[25].pk}, headers={"HX-Request": "true"}
+        )
+        self.assertTemplateUsed(response, "blog/_post_list.html")
+        self.assertTemplateNotUsed(response, "blog/post_list.html")
+        self.assertContains(response, "게시물 24")
+
+    def test_category_and_tag_detail(self):
+        other_tag = Tag.objects.create(name="기타", slug="etc")
+        create_posts(1, tags=[other_tag])
+        tag_cache.get_list()
+
+        for url in (self.category.get_absolute_url(), self.tags[0].get_absolute_url()):
+            response, sql_list = self.get_with_queries(url)
+            # 카테고리/태그는 캐시에서 조회하므로, 게시물 1회 + 태그 prefetch 1회
+            self.assertEqual(len(sql_list), 2, sql_list)
+            self.assertEqual(len(response.context["post_list"]), 20)
+            self.assertNotContains(response, "게시물 45")
+
+    def test_post_detail(self):
+        post = self.posts[0]
+        response, sql_list = self.get_with_queries(post.get_absolute_url())
+        # slug -> id 조회 1회 + 게시물 1회 + 태그 prefetch 1회
+        self.assertEqual(len(sql_list), 3, sql_list)
+        self.assertEqual(response.context["post"].comment_count, 2)
+        self.assertContains(response, post.title)
+
+        # 두 번째 요청부터는 캐싱된 id로 조회합니다.
+        _, sql_list = self.get_with_queries(post.get_absolute_url())
+        self.assertEqual(len(sql_list), 2, sql_list)
+        self.assertNotIn('"slug" =', sql_list[0])
+
+    def test_post_detail_get_object_with_queryset(self):
+        post = self.posts[0]
+        view = PostDetailView(kwargs={"slug": post.slug})
+        post_slug_cache.get_id(post.slug)
+        # 전달된 queryset은 평가하지 않고 id 조회에만 사용합니다.
+        with self.assertNumQueries(1):
+            self.assertEqual(view.get_object(Post.objects.all()), post)
+        # 빈 queryset도 기본 queryset으로 대체하지 않습니다.
+        with self.assertRaises(Http404):
+            view.get_object(Post.objects.none())
+
+
+class SlugLookupCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name="파이썬", slug="python")
+        cls.post = create_posts(1, category=cls.category)[0]
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_lists_need_no_queries(self):
+        category_cache.get_list()
+        with self.assertNumQueries(0):
+            self.assertEqual(category_cache.get("python"), self.category)
+            self.assertEqual(category_cache.get_list(), [self.category])
+
+    def test_invalidated_on_save_and_delete(self):
+        self.assertEqual(category_cache.get("python"), self.category)
+        self.assertEqual(post_slug_cache.get_id(self.post.slug), self.post.pk)
+
+        self.category.slug = "django"
+        self.category.save()
+        self.assertIsNone(category_cache.get("python"))
+        self.assertEqual(category_cache.get("django").pk, self.category.pk)
+        self.assertEqual(self.client.get(reverse("blog:category_detail", args=["python"])).status_code, 404)
+
+        old_slug = self.post.slug
+        self.post.slug = "renamed"
+        self.post.save()
+        self.assertIsNone(post_slug_cache.get_id(old_slug))
+        self.assertEqual(self.client.get(reverse("blog:post_detail", args=["renamed"])).status_code, 200)
+
+        Category.objects.create(name="새 카테고리", slug="new")
+        self.assertEqual(len(category_cache.get_list()), 2)
+        self.category.delete()
+        self.assertEqual([category.slug for category in category_cache.get_list()], ["new"])
+
+    def test_invalidated_from_another_process(self):
+        self.assertEqual(category_cache.get_list(), [self.category])
+        self.assertEqual(post_slug_cache.get_id(self.post.slug), self.post.pk)
+
+        # 시그널 없이 변경한 뒤, create_initial_blog_data 처럼 다른 프로세스에서 무효화합니다.
+        Category.objects.bulk_create([Category(name="대량", slug="bulk")])
+        Post.objects.filter(pk=self.post.pk).update(slug="moved")
+        subprocess.run(
+            [sys.executable, "-c", "import django; django.setup(); from blog.lookups import invalidate_blog_lookups; invalidate_blog_lookups()"],
+            cwd=settings.BASE_DIR, env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}, check=True,
+        )
+
+        self.assertEqual({category.slug for category in category_cache.get_list()}, {"python", "bulk"})
+        self.assertIsNone(post_slug_cache.get_id(self.post.slug))
+        self.assertEqual(post_slug_cache.get_id("moved"), self.post.pk)
+
+    def test_entries_expire_without_invalidation(self):
+        self.assertEqual(category_cache.get_list(), [self.category])
+        Category.objects.bulk_create([Category(name="대량", slug="bulk")])
+        self.assertEqual(len(category_cache.get_list()), 1)
+
+        # 무효화가 전달되지 않는 캐시 설정에서도 LOOKUP_MAX_AGE가 지나면 다시 조회합니다.
+        with mock.patch.object(lookups, "LOOKUP_MAX_AGE", 0):
+            self.assertEqual(len(category_cache.get_list()), 2)
+
+
+class PostCommentCounterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.post, cls.other_post = create_posts(2, comments_per_post=0)
+        cls.author = cls.post.author
+
+    def assert_counters(self, post, comment_count):
+        post.refresh_from_db()
+        self.assertEqual(post.comment_count, comment_count)
+        last = post.comment_set.order_by("-created_at").values_list("created_at", flat=True).first()
+        self.assertEqual(post.last_commented_at, last)
+
+    def test_create_and_delete(self):
+        first = Comment.objects.create(post=self.post, author=self.author, content="첫 댓글")
+        second = Comment.objects.create(post=self.post, author=self.author, content="두번째 댓글")
+        self.assert_counters(self.post, 2)
+
+        second.delete()
+        self.assert_counters(self.post, 1)
+        first.delete()
+        self.assert_counters(self.post, 0)
+
+    def test_bulk_create_and_queryset_delete(self):
+        Comment.objects.bulk_create(
+            [Comment(post=self.post, author=self.author, content=f"댓글 {i}") for i in range(3)]
+            + [Comment(post=self.other_post, author=self.author, content="댓글")]
+        )
+        self.assert_counters(self.post, 3)
+        self.assert_counters(self.other_post, 1)
+
+        Comment.objects.filter(post=self.post).delete()
+        self.assert_counters(self.post, 0)
+        self.assert_counters(self.other_post, 1)
+
+    def test_cascade_delete_skips_counter_updates(self):
+        def delete_post_with_comments(count):
+            post = create_posts(1, comments_per_post=count)[0]
+            with CaptureQueriesContext(connection) as ctx:
+                post.delete()
+            self.assertFalse(Comment.objects.filter(post_id=post.pk).exists())
+            return [query["sql"] for query in ctx.captured_queries]
+
+        Comment.objects.create(post=self.other_post, author=self.author, content="댓글")
+        few, many = delete_post_with_comments(2), delete_post_with_comments(50)
+
+        # 함께 삭제되는 게시물의 카운터는 갱신하지 않으므로, 댓글 수와 관계없이 쿼리 수가 같습니다.
+        self.assertEqual(len(few), len(many), many)
+        self.assertFalse([sql for sql in many if sql.startswith('UPDATE "blog_post"')])
+        self.assert_counters(self.other_post, 1)
+
+    def test_user_cascade_updates_other_posts(self):
+        commenter = get_user_model().objects.create_user(username="commenter")
+        Comment.objects.create(post=self.post, author=commenter, content="댓글")
+        Comment.objects.create(post=self.post, author=self.author, content="댓글")
+        self.assert_counters(self.post, 2)
+
+        commenter.delete()
+        self.assert_counters(self.post, 1)
+
+    def test_reconcile_post_counters(self):
+        Comment.objects.create(post=self.post, author=self.author, content="댓글")
+        Post.objects.update(comment_count=100, last_commented_at=None)
+
+        call_command("reconcile_post_counters", batch_size=1, stdout=io.StringIO())
+        self.assert_counters(self.post, 1)
+        self.assert_counters(self.other_post, 0)
+
+
+class PostListSortTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.posts = create_posts(25, comments_per_post=0)
+        author = cls.posts[0].author
+        now = timezone.now()
+        # 게시물 i에 댓글 i % 5개, 마지막 댓글 시각은 i분 전
+        for i, post in enumerate(cls.posts):
+            Comment.objects.bulk_create(
+                Comment(post=post, author=author, content="댓글") for _ in range(i % 5)
+            )
+            if i % 5:
+                Post.objects.filter(pk=post.pk).update(last_commented_at=now - timedelta(minutes=i))
+
+    def collect_pages(self, sort):
+        url, pk_list = reverse("blog:index") + f"?sort={sort}", []
+        while url:
+            response = self.client.get(url)
+            pk_list += [post.pk for post in response.context["post_list"]]
+            url = response.context["next_url"]
+        return pk_list
+
+    def test_popular(self):
+        expected = list(Post.objects.order_by("-comment_count", "-pk").values_list("pk", flat=True))
+        self.assertEqual(self.collect_pages("popular"), expected)
+
+    def test_activity(self):
+        expected = list(
+            Post.objects.filter(last_commented_at__isnull=False)
+            .order_by("-last_commented_at", "-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(len(expected), 20)
+        self.assertEqual(self.collect_pages("activity"), expected)
+
+
+class CommentListTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.post, cls.other_post = create_posts(2, comments_per_post=0)
+        author = cls.post.author
+        Comment.objects.bulk_create(
+            Comment(post=cls.post, author=author, content=f"댓글 {i}") for i in range(45)
+        )
+        Comment.objects.create(post=cls.other_post, author=author, content="다른 게시물 댓글")
+
+    def test_post_detail_lazy_loads_comments(self):
+        response = self.client.get(self.post.get_absolute_url())
+        self.assertContains(response, reverse("blog:comment_list", args=[self.post.pk]))
+        self.assertNotContains(response, "댓글 44")
+
+    def test_comment_pages(self):
+        url = reverse("blog:comment_list", args=[self.post.pk])
+        contents = []
+        while url:
+            # 댓글과 작성자를 한 번의 쿼리로 조회합니다.
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url, headers={"HX-Request": "true"})
+            self.assertEqual(len(ctx.captured_queries), 1, ctx.captured_queries)
+
+            contents += [comment.content for comment in response.context["comment_list"]]
+            url = response.context["next_url"]
+
+        self.assertEqual(contents, [f"댓글 {i}" for i in reversed(range(45))])
+        self.assertContains(response, "writer")
+
+
+class SitemapFeedTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.posts = create_posts(3, comments_per_post=0)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_sitemap_appends_only_new_posts(self):
+        url = reverse("blog:sitemap_page", args=[1])
+        response = self.client.get(url)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        for post in self.posts:
+            self.assertContains(response, f"http://testserver{post.get_absolute_url()}</loc>")
+
+        # 변경이 없으면 304 응답
+        etag = response["ETag"]
+        self.assertEqual(self.client.get(url, headers={"If-None-Match": etag}).status_code, 304)
+
+        # 새 게시물은 last_id 이후 게시물만 조회하여 이어 붙입니다.
+        new_post = create_posts(1, comments_per_post=0)[0]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(f'"blog_post"."id" > {self.posts[-1].pk}', ctx.captured_queries[0]["sql"])
+        self.assertContains(response, new_post.get_absolute_url())
+        self.assertEqual(response.content.decode().count("<url>"), 4)
+
+    def test_sitemap_regenerated_on_update_and_delete(self):
+        url = reverse("blog:sitemap_page", args=[1])
+        self.client.get(url)
+
+        post = self.posts[0]
+        post.slug = "renamed"
+        post.save()
+        self.assertContains(self.client.get(url), "/posts/renamed/")
+
+        post.delete()
+        response = self.client.get(url)
+        self.assertNotContains(response, "/posts/renamed/")
+        self.assertEqual(response.content.decode().count("<url>"), 2)
+
+    def test_sitemap_index(self):
+        response = self.client.get(reverse("blog:sitemap_index"))
+        self.assertContains(response, reverse("blog:sitemap_page", args=[1]))
+        self.assertNotContains(response, reverse("blog:sitemap_page", args=[2]))
+
+    def test_sitemap_page_past_last_page(self):
+        self.assertEqual(self.client.get(reverse("blog:sitemap_page", args=[2])).status_code, 404)
+        self.assertEqual(self.client.get(reverse("blog:sitemap_page", args=[0])).status_code, 404)
+        self.assertIsNone(cache.get(SitemapPage(RequestFactory().get("/"), 2).key))
+
+        with mock.patch("blog.sitemaps.SITEMAP_PAGE_SIZE", 2):
+            self.assertEqual(self.client.get(reverse("blog:sitemap_page", args=[2])).status_code, 200)
+            self.assertEqual(self.client.get(reverse("blog:sitemap_page", args=[3])).status_code, 404)
+
+    def test_incremental_document_is_abstract(self):
+        class IncompleteDocument(IncrementalDocument):
+            name = "incomplete"
+
+            def create_document(self, revision):
+                return Document(revision=revision, body="")
+
+        with self.assertRaises(TypeError):
+            IncompleteDocument(RequestFactory().get("/"))
+
+    def test_feed(self):
+        response = self.client.get(reverse("blog:feed"))
+        self.assertEqual(response["Content-Type"], "application/atom+xml; charset=utf-8")
+        self.assertIn("Last-Modified", response)
+        body = response.content.decode()
+        self.assertEqual(body.count("<entry>"), 3)
+        # 최신 게시물이 먼저 나옵니다.
+        self.assertLess(body.index(self.posts[2].title), body.index(self.posts[1].title))
+
+        new_post = create_posts(1, comments_per_post=0)[0]
+        body = self.client.get(reverse("blog:feed")).content.decode()
+        self.assertEqual(body.count("<entry>"), 4)
+        self.assertLess(body.index(new_post.title), body.index(self.posts[2].title))
+
+
+class BulkSeedCommandTest(TestCase):
+    def seed(self, scale, *args):
+        call_command(
+            "create_initial_blog_data", "--noinput", "--scale", str(scale),
+            "--comments-per-post", "1", "--workers", "1", *args, stdout=io.StringIO(),
+        )
+
+    def test_default_factories(self):
+        # --scale 없이 실행하면 factory로 소량의 데이터를 생성합니다.
+        call_command("create_initial_blog_data", "--noinput", stdout=io.StringIO())
+        # Post/Comment factory의 SubFactory가 카테고리와 게시물을 추가로 만들 수 있습니다.
+        self.assertGreaterEqual(Category.objects.count(), 100)
+        self.assertGreaterEqual(Tag.objects.count(), 100)
+        self.assertGreaterEqual(Post.objects.count(), 100)
+        self.assertEqual(Comment.objects.count(), 100)
+
+    def test_scale(self):
+        call_command(
+            "create_initial_blog_data", "--noinput", "--scale", "300", "--comments-per-post", "3",
+            "--workers", "1", "--shard-size", "100", "--batch-size", "250", stdout=io.StringIO(),
+        )
+        # 사용자 : 기본 사용자 6명(admin + 5명)이 max(5, scale // 100)보다 많으므로 추가로 생성하지 않습니다.
+        self.assertEqual(User.objects.count(), 6)
+        self.assertEqual(Category.objects.count(), 100)
+        self.assertEqual(Tag.objects.count(), 100)
+        self.assertEqual(Post.objects.count(), 300)
+        self.assertEqual(Comment.objects.count(), 900)
+        self.assertTrue(PostTag.objects.exists())
+        self.assertEqual(len(set(Post.objects.values_list("slug", flat=True))), 300)
+        # 직접 INSERT 한 댓글의 카운터는 마지막에 한 번에 계산합니다.
+        self.assertEqual(Post.objects.aggregate(total=Sum("comment_count"))["total"], 900)
+        self.assertFalse(Post.objects.filter(comment_count__gt=0, last_commented_at__isnull=True).exists())
+
+    def test_csv_output(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.seed(200, "--output-dir", output_dir)
+
+            for model, count in ((Category, 100), (Tag, 100), (Post, 200), (Comment, 200)):
+                with open(Path(output_dir) / f"{model._meta.db_table}.csv", newline="", encoding="utf-8") as f:
+                    header, *rows = list(csv.reader(f))
+                with self.subTest(model=model.__name__):
+                    self.assertEqual(header, get_columns(model))
+                    self.assertEqual(len(rows), count)
+                    self.assertEqual([int(row[0]) for row in rows], list(range(1, count + 1)))
+
+            with open(Path(output_dir) / f"{PostTag._meta.db_table}.csv", newline="", encoding="utf-8") as f:
+                header, *rows = list(csv.reader(f))
+            self.assertEqual(header, ["post_id", "tag_id"])
+            self.assertEqual({int(row[0]) for row in rows}, set(range(1, 201)))
+
+    def test_csv_output_keeps_database(self):
+        self.seed(100)
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.seed(200, "--output-dir", output_dir)
+        self.assertEqual(Post.objects.count(), 100)
+
+    def test_output_dir_requires_scale(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with self.assertRaises(CommandError):
+                call_command("create_initial_blog_data", "--noinput", "--output-dir", output_dir, stdout=io.StringIO())
+
+    def test_wipe_requires_confirmation(self):
+        self.seed(100)
+        for answer in ("", "n"):
+            with self.subTest(answer=answer), mock.patch("builtins.input", return_value=answer):
+                call_command("create_initial_blog_data", "--scale", "50", "--workers", "1", stdout=io.StringIO())
+            self.assertEqual(Post.objects.count(), 100)
+
+        with mock.patch("builtins.input", return_value="y"):
+            call_command("create_initial_blog_data", "--scale", "50", "--workers", "1", stdout=io.StringIO())
+        self.assertEqual(Post.objects.count(), 50)
+
+    def test_seed_twice_into_same_database(self):
+        # 블로그 데이터만 지우고 사용자는 유지하므로, 두 번째 실행의 사용자명이 겹치지 않아야 합니다.
+        self.seed(1000)
+        first_usernames = set(User.objects.values_list("username", flat=True))
+        self.seed(2000)
+
+        self.assertEqual(User.objects.count(), 20)
+        self.assertTrue(first_usernames < set(User.objects.values_list("username", flat=True)))
+        self.assertEqual(Post.objects.count(), 2000)
+        self.assertEqual(Comment.objects.count(), 2000)
+
+
+class WipeBlogDataTest(TestCase):
+    def test_wipe_counts_tables_resets_sequences_and_keeps_users(self):
+        category = Category.objects.create(name="카테고리", slug="category")
+        tag = Tag.objects.create(name="태그", slug="tag")
+        create_posts(3, category=category, tags=[tag], comments_per_post=2)
+        user_count = User.objects.count()
+
+        counts = wipe_blog_data()
+
+        self.assertEqual(counts, {
+            Comment._meta.db_table: 6,
+            PostTag._meta.db_table: 3,
+            Post._meta.db_table: 3,
+            Tag._meta.db_table: 1,
+            Category._meta.db_table: 1,
+        })
+        for model in (Comment, PostTag, Post, Tag, Category):
+            self.assertFalse(model.objects.exists(), model)
+        self.assertEqual(User.objects.count(), user_count)
+
+        # id가 1부터 다시 시작합니다.
+        self.assertEqual(Category.objects.create(name="새 카테고리", slug="new-category").pk, 1)
+        self.assertEqual(create_posts(1, comments_per_post=1)[0].pk, 1)
+        self.assertEqual(Comment.objects.get().pk, 1)
+
+
+class RowPipelineTest(SimpleTestCase):
+    context = {
+        "id_base": 0,
+        "now": timezone.now(),
+        "password": "unusable",
+        "author_ids": [1, 2, 3],
+        "category_ids": list(range(1, 11)),
+        "tag_ids": list(range(1, 21)),
+        "max_tags_per_post": 5,
+        "post_ids": list(range(1, 51)),
+    }
+
+    def generate(self, kind, total, **kwargs):
+        return list(RowPipeline(**kwargs).iter_shards(kind, total, self.context))
+
+    def test_shards_are_deterministic_across_worker_counts(self):
+        for kind in ("user", "post", "comment"):
+            with self.subTest(kind=kind):
+                single = self.generate(kind, 50, seed=1, workers=1, shard_size=7)
+                self.assertEqual(len(single), 8)
+                self.assertEqual(single, self.generate(kind, 50, seed=1, workers=2, shard_size=7))
+
+    def test_seed_changes_rows(self):
+        self.assertNotEqual(
+            self.generate("post", 10, seed=1, shard_size=5),
+            self.generate("post", 10, seed=2, shard_size=5),
+        )
@@ -4,5 +4,12 @@ from . import views
 app_name = "blog"
 
 urlpatterns = [
-    path("", views.index, name="index"),
+    path("", views.post_list, name="index"),
+    path("posts/<str:slug>/", views.post_detail, name="post_detail"),
+    path("posts/<int:post_pk>/comments/", views.comment_list, name="comment_list"),
+    path("categories/<str:slug>/", views.category_detail, name="category_detail"),
+    path("tags/<str:slug>/", views.tag_detail, name="tag_detail"),
+    path("sitemap.xml", views.sitemap_index, name="sitemap_index"),
+    path("sitemap-<int:page>.xml", views.sitemap_page, name="sitemap_page"),
+    path("feed.atom", views.feed, name="feed"),
 ]
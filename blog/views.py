@@ -1,5 +1,170 @@
+from django.http import Http404, HttpResponse
 from django.shortcuts import render
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views.generic import DetailView, ListView
 
+from .lookups import category_cache, post_slug_cache, tag_cache
+from .models import Comment, Post
+from .pagination import KeysetPaginator
+from .sitemaps import AtomFeed, SitemapPage, get_page_count, render_sitemap_index
 
-def index(request):
-    return render(request, "blog/index.html")
+
+class PostListView(ListView):
+    model = Post
+    paginate_by = 20
+
+    template_name = "blog/post_list.html"
+    partial_template_name = "blog/_post_list.html"
+
+    # 정렬 옵션 : ?sort= 값 -> 정렬 필드 (None이면 최신순). 각 필드는 (필드 DESC, id DESC) 인덱스가 있습니다.
+    sort_options = {
+        "latest": None,
+        "popular": "comment_count",
+        "activity": "last_commented_at",
+    }
+
+    def get_sort(self) -> str:
+        sort = self.request.GET.get("sort", "")
+        return sort if sort in self.sort_options else "latest"
+
+    def get_queryset(self):
+        # 목록에서는 본문(content)을 사용하지 않으므로 조회하지 않습니다.
+        qs = (
+            Post.objects.select_related("author", "category")
+            .prefetch_related("tags")
+            .defer("content")
+        )
+        if self.get_sort() == "activity":
+            qs = qs.filter(last_commented_at__isnull=False)
+        return qs
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(self.request, page_size, order_field=self.sort_options[self.get_sort()])
+        object_list, self.next_url = paginator.paginate(queryset)
+        # ListView의 (paginator, page, object_list, is_paginated) 형식에 맞춥니다.
+        return None, None, object_list, self.next_url is not None
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["next_url"] = self.next_url
+        context["sort"] = self.get_sort()
+        if not self.is_htmx():
+            # 사이드바 목록은 프로세스 내 캐시에서 가져옵니다.
+            context["category_list"] = category_cache.get_list()
+            context["tag_list"] = tag_cache.get_list()
+        return context
+
+    def is_htmx(self) -> bool:
+        return self.request.headers.get("HX-Request") == "true"
+
+    def get_template_names(self):
+        if self.is_htmx():
+            return [self.partial_template_name]
+        return [self.template_name]
+
+
+post_list = PostListView.as_view()
+
+
+class CategoryPostListView(PostListView):
+    template_name = "blog/category_detail.html"
+    sort_options = {"latest": None}
+
+    def get_queryset(self):
+        self.category = category_cache.get(self.kwargs["slug"])
+        if self.category is None:
+            raise Http404("카테고리가 없습니다.")
+        return super().get_queryset().filter(category_id=self.category.pk)
+
+    def get_context_data(self, **kwargs):
+        return super().get_context_data(category=self.category, **kwargs)
+
+
+category_detail = CategoryPostListView.as_view()
+
+
+class TagPostListView(PostListView):
+    template_name = "blog/tag_detail.html"
+    sort_options = {"latest": None}
+
+    def get_queryset(self):
+        self.tag = tag_cache.get(self.kwargs["slug"])
+        if self.tag is None:
+            raise Http404("태그가 없습니다.")
+        return super().get_queryset().filter(tags=self.tag.pk)
+
+    def get_context_data(self, **kwargs):
+        return super().get_context_data(tag=self.tag, **kwargs)
+
+
+tag_detail = TagPostListView.as_view()
+
+
+class PostDetailView(DetailView):
+    model = Post
+
+    def get_queryset(self):
+        return Post.objects.select_related("author", "category").prefetch_related("tags")
+
+    def get_object(self, queryset=None):
+        # slug 대신 캐싱된 id로 조회합니다.
+        pk = post_slug_cache.get_id(self.kwargs["slug"])
+        if pk is None:
+            raise Http404("게시물이 없습니다.")
+        # queryset을 bool로 평가하면 전체 게시물을 조회하므로 None인지만 확인합니다.
+        if queryset is None:
+            queryset = self.get_queryset()
+        try:
+            return queryset.get(pk=pk)
+        except Post.DoesNotExist:
+            raise Http404("게시물이 없습니다.")
+
+
+post_detail = PostDetailView.as_view()
+
+
+def comment_list(request, post_pk):
+    """게시물의 댓글을 최신순으로 나누어 응답하는 HTMX 조각. 화면에 드러날 때마다 다음 묶음을 요청합니다."""
+    # 게시물 조회 없이 (post_id, -id) 인덱스만으로 한 묶음을 조회합니다.
+    qs = Comment.objects.filter(post_id=post_pk).select_related("author").only(
+        "post_id", "content", "created_at", "author__username"
+    )
+    comment_list, next_url = KeysetPaginator(request, page_size=20).paginate(qs)
+
+    return render(request, "blog/_comment_list.html", {
+        "comment_list": comment_list,
+        "next_url": next_url,
+    })
+
+
+def sitemap_index(request):
+    return HttpResponse(render_sitemap_index(request), content_type="application/xml")
+
+
+def serve_document(request, document, content_type):
+    """캐싱된 문서를 ETag/Last-Modified와 함께 응답합니다."""
+    etag = document.get_etag()
+    last_modified = int(document.last_modified.timestamp()) if document.last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(document.body, content_type=content_type)
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, public=True, max_age=60 * 10)
+    return response
+
+
+def sitemap_page(request, page):
+    # 마지막 페이지 이후의 빈 문서는 생성/캐싱하지 않습니다. (1페이지는 항상 있으므로 조회하지 않습니다.)
+    if page < 1 or (page > 1 and page > get_page_count()):
+        raise Http404
+    document = SitemapPage(request, page).get_document()
+    return serve_document(request, document, "application/xml")
+
+
+def feed(request):
+    document = AtomFeed(request).get_document()
+    return serve_document(request, document, "application/atom+xml; charset=utf-8")
@@ -12,7 +12,7 @@ from uuid import uuid4
 
 from .forms import MessageForm
 from .llm import make_llm_response, LLMResponse
-from .views import ChatMessage
+from .views import ChatMessage, render_text_delta
 
 
 class ChatLLMConsumer(AsyncJsonWebsocketConsumer):
@@ -24,11 +24,16 @@ class ChatLLMConsumer(AsyncJsonWebsocketConsumer):
 
     chat_messages_id = "chat-messages"
     template_name = "chat/_llm_message.html"
+    # "delta" : 이어지는 조각을 텍스트 조각(render_text_delta)으로 전송, "script" : 조각마다 스크립트 전송 (이전 방식)
+    stream_mode = "delta"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.chat_messages = []
 
+    def get_stream_mode(self) -> str:
+        return self.stream_mode
+
     async def connect(self):
         await self.accept()
         await self.reply(html="<p>WELCOME !!!</p>")
@@ -87,13 +92,20 @@ class ChatLLMConsumer(AsyncJsonWebsocketConsumer):
         )
 
         is_first = True
+        is_delta_mode = self.get_stream_mode() == "delta"
         assistant_message_id = f"message-{uuid4().hex}"
-        assistant_message = ""
+        # 긴 응답에서 문자열을 반복해서 이어 붙이지 않도록, 조각을 모아 마지막에 한 번 합칩니다.
+        assistant_chunks: List[str] = []
         llm_chunk_response = LLMResponse()
         async for llm_chunk_response in llm_stream_response:
             if llm_chunk_response.text:
-                chunk_text = escapejs(llm_chunk_response.text)
-                assistant_message += chunk_text
+                assistant_chunks.append(llm_chunk_response.text)
+                if is_delta_mode and not is_first:
+                    # htmx-ext-ws는 메시지의 최상위 요소들을 OOB 스왑하므로, #chat-messages로 감싸지 않고 보냅니다.
+                    await self.send(render_text_delta(assistant_message_id, llm_chunk_response.text))
+                    continue
+
+                chunk_text = llm_chunk_response.text if is_delta_mode else escapejs(llm_chunk_response.text)
                 await self.reply(
                     context={
                         "role": "assistant",
@@ -108,7 +120,7 @@ class ChatLLMConsumer(AsyncJsonWebsocketConsumer):
 
         self.chat_messages.append(ChatMessage(role="user", content=user_text))  # noqa
         self.chat_messages.append(
-            ChatMessage(role="assistant", content=assistant_message)
+            ChatMessage(role="assistant", content="".join(assistant_chunks))
         )
 
         estimated_cost_usd = llm_chunk_response.get_cost_usd() or 0
@@ -3,23 +3,32 @@
 
 import base64
 import dataclasses
+import functools
 import logging
-from typing import List, Optional, Dict, AsyncGenerator, Union
+from typing import TYPE_CHECKING, List, Optional, Dict, AsyncGenerator, Union
 
-import openai
 from django.conf import settings
 from django.core.files.base import File
 
+if TYPE_CHECKING:
+    import openai
+
 logger = logging.getLogger(__name__)
 
 
-openai_async_client = openai.AsyncClient(api_key=settings.OPENAI_API_KEY)
+@functools.cache
+def get_openai_async_client() -> "openai.AsyncClient":
+    # openai SDK는 임포트 비용이 크므로(httpx, pydantic 모델 등), 모듈 로딩 시점이 아닌 첫 LLM 요청에서 생성합니다.
+    import openai
+
+    return openai.AsyncClient(api_key=settings.OPENAI_API_KEY)
 
 # default: "http://localhost:11434"
 # ollama_async_client = ollama.AsyncClient(host=settings.OLLAMA_HOST)
 
 
-@dataclasses.dataclass
+# 스트리밍 응답에서는 토큰 조각마다 생성되므로, __dict__ 없이 슬롯으로 속성을 저장합니다.
+@dataclasses.dataclass(slots=True)
 class LLMResponse:
     vendor: Optional[str] = None
     model: Optional[str] = None
@@ -141,7 +150,7 @@ async def _make_openai_response(
             )
 
     stream_options = {"include_usage": True} if stream else None
-    response = await openai_async_client.chat.completions.create(
+    response = await get_openai_async_client().chat.completions.create(
         model=model,
         messages=messages,
         temperature=temperature,
@@ -0,0 +1,158 @@
+import asyncio
+import dataclasses
+import random
+import time
+import tracemalloc
+from typing import AsyncGenerator, Callable, Dict, List, Optional
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.utils.html import escapejs
+
+from chat.llm import LLMResponse
+from chat.views import render_text_delta
+
+
+@dataclasses.dataclass
+class DictLLMResponse:
+    """비교용 : 슬롯을 사용하지 않던 기존 LLMResponse와 같은 구조"""
+
+    vendor: Optional[str] = None
+    model: Optional[str] = None
+    text: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+
+RESPONSE_TYPES = {"dict": DictLLMResponse, "slots": LLMResponse}
+
+WORDS = ["Django", " 뷰", "에서", " 스트리밍", " 응답", "을", " 보내", "면", ",", " the", " chunk", " is", " rendered", ".", "\n"]
+
+TEMPLATE_NAME = "chat/_llm_message.html"
+
+
+def make_token_texts(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [rng.choice(WORDS) for _ in range(count)]
+
+
+async def stream_chunks(response_class, texts: List[str]) -> AsyncGenerator:
+    # openai 스트리밍 응답처럼 토큰 조각마다 응답 객체를 만들고, 마지막에 사용량을 전달합니다.
+    for text in texts:
+        yield response_class(vendor="openai", model="gpt-4o", text=text)
+    yield response_class(vendor="openai", model="gpt-4o", input_tokens=100, output_tokens=len(texts))
+
+
+def accumulate_concat(texts: List[str]) -> str:
+    message = ""
+    for text in texts:
+        message += escapejs(text)
+    return message
+
+
+def accumulate_join(texts: List[str]) -> str:
+    chunks = []
+    for text in texts:
+        chunks.append(text)
+        escapejs(text)
+    return "".join(chunks)
+
+
+ACCUMULATORS: Dict[str, Callable[[List[str]], str]] = {"str +=": accumulate_concat, "list + join": accumulate_join}
+
+
+async def consume_stream(response_class, texts: List[str], accumulate: str, stream_mode: str) -> int:
+    """ChatLLMView의 토큰 처리 경로를 재현하고, 전송한 바이트 수를 반환합니다."""
+    message = ""
+    chunks = []
+    sent_bytes = 0
+    is_first = True
+    async for chunk in stream_chunks(response_class, texts):
+        if chunk.text:
+            if accumulate == "str +=":
+                message += escapejs(chunk.text)
+            else:
+                chunks.append(chunk.text)
+
+            if stream_mode == "delta" and not is_first:
+                frame = render_text_delta("message-bench", chunk.text)
+            else:
+                frame = render_to_string(TEMPLATE_NAME, {
+                    "role": "assistant", "is_append": not is_first, "assistant_message_id": "message-bench",
+                    "chunk_text": chunk.text if stream_mode == "delta" else escapejs(chunk.text),
+                })
+            sent_bytes += len(frame.encode("utf-8"))
+            is_first = False
+    if accumulate != "str +=":
+        # 뷰처럼 답변 저장을 위해 마지막에 한 번 합칩니다.
+        message = "".join(chunks)
+    return sent_bytes
+
+
+def measure_memory(func: Callable) -> tuple:
+    """(할당 블록 수 증가, 바이트 증가, 최대 사용량 증가)를 반환합니다. 반환값은 측정 동안 유지됩니다."""
+    tracemalloc.start()
+    try:
+        before_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        before_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        after_size, peak = tracemalloc.get_traced_memory()
+        after_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        del result
+    finally:
+        tracemalloc.stop()
+    return after_blocks - before_blocks, after_size - before_size, peak - before_size
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark the LLM token streaming path over a synthetic response: "
+        "chunk object size/allocations, message accumulation and the per-chunk frames (script vs delta stream mode)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tokens", type=int, default=8192)
+        parser.add_argument("--repeat", type=int, default=5, help="Use the fastest of N runs for timings")
+
+    def handle(self, *args, **options):
+        token_count = options["tokens"]
+        repeat = max(1, options["repeat"])
+        texts = make_token_texts(token_count)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Chunk objects ({token_count:,} tokens, objects kept alive)"))
+        for name, response_class in RESPONSE_TYPES.items():
+            blocks, size, _ = measure_memory(lambda: [response_class(vendor="openai", model="gpt-4o", text=text) for text in texts])
+            self.stdout.write(
+                f"  {name:<8} {blocks / token_count:>6.2f} allocations/chunk {size / token_count:>8.1f} bytes/chunk"
+            )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Message accumulation (escapejs included)"))
+        for name, accumulate in ACCUMULATORS.items():
+            elapsed = self.time(lambda: accumulate(texts), repeat)
+            _, _, peak = measure_memory(lambda: accumulate(texts))
+            self.stdout.write(f"  {name:<12} {elapsed / token_count * 1e6:>7.2f} µs/chunk {peak / 1024:>9.1f} KiB peak")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Stream path (chunk object + accumulate + frame per chunk)"))
+        for label, response_class, accumulate, stream_mode in (
+            ("before", DictLLMResponse, "str +=", "script"),
+            ("script", LLMResponse, "list + join", "script"),
+            ("delta", LLMResponse, "list + join", "delta"),
+        ):
+            run = lambda: asyncio.run(consume_stream(response_class, texts, accumulate, stream_mode))  # noqa: E731
+            sent_bytes = run()  # 템플릿 로딩/컴파일은 측정에서 제외
+            elapsed = self.time(run, repeat)
+            _, _, peak = measure_memory(run)
+            self.stdout.write(
+                f"  {label:<7} {elapsed / token_count * 1e6:>7.2f} µs/chunk {sent_bytes / token_count:>7.1f} bytes/chunk"
+                f" {peak / 1024:>9.1f} KiB peak  ({response_class.__name__}, {accumulate}, {stream_mode})"
+            )
+
+    @staticmethod
+    def time(func: Callable, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
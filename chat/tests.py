@@ -1,3 +1,102 @@
-from django.test import TestCase
+import re
+from unittest import mock
 
-# Create your tests here.
+from channels.testing import WebsocketCommunicator
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from accounts.models import User
+
+from .consumers import ChatLLMConsumer
+from .llm import LLMResponse
+from .views import ChatLLMView
+
+
+class LLMResponseTest(SimpleTestCase):
+    def test_chunk_has_no_instance_dict(self):
+        chunk = LLMResponse(vendor="openai", model="gpt-4o", text="안녕")
+        self.assertFalse(hasattr(chunk, "__dict__"))
+        with self.assertRaises(AttributeError):
+            chunk.extra = "value"
+
+    def test_cost(self):
+        response = LLMResponse(vendor="openai", model="gpt-4o-mini", input_tokens=1_000_000, output_tokens=1_000_000)
+        self.assertAlmostEqual(response.get_cost_usd(), 0.75)
+        with self.assertLogs("chat.llm", "ERROR"):
+            self.assertIsNone(LLMResponse(vendor="openai", model="unknown").get_cost_usd())
+
+
+async def fake_llm_response(**kwargs):
+    async def generator():
+        for text in ["안녕", "<하세요>", "!"]:
+            yield LLMResponse(vendor="openai", model="gpt-4o", text=text)
+        yield LLMResponse(vendor="openai", model="gpt-4o", input_tokens=10, output_tokens=3)
+    return generator()
+
+
+@mock.patch("chat.views.make_llm_response", fake_llm_response)
+class ChatLLMStreamModeTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="chat-user")
+
+    async def post(self) -> str:
+        # 스트리밍 응답의 헤더는 메시지 저장 전에 전송되므로, 세션 쿠키가 있는 상태(로그인)로 요청합니다.
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.post(reverse("chat:chat-llm"), {"user_text": "hi"})
+        return b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+    async def test_delta_mode_appends_text_to_message_span(self):
+        html = await self.post()
+
+        self.assertIn("안녕</span>", html)
+        self.assertNotIn("<script>", html)
+        self.assertEqual(html.count('hx-swap-oob="beforeend"'), 2)
+        self.assertIn('hx-swap-oob="beforeend">&lt;하세요&gt;</span>', html)
+
+        session = await self.async_client.asession()
+        history = await session.aget("chat_messages")
+        self.assertEqual(history[-1], {"role": "assistant", "content": "안녕<하세요>!"})
+
+    async def test_script_mode_fallback(self):
+        with mock.patch.object(ChatLLMView, "stream_mode", "script"):
+            html = await self.post()
+
+        self.assertEqual(html.count("<script>"), 2)
+        self.assertNotIn("hx-swap-oob", html)
+
+
+@mock.patch("chat.consumers.make_llm_response", fake_llm_response)
+class ChatLLMConsumerStreamModeTest(SimpleTestCase):
+    async def receive_answer(self) -> list:
+        communicator = WebsocketCommunicator(ChatLLMConsumer.as_asgi(), "/ws/chat/llm/")
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        await communicator.receive_from()  # 환영 메시지
+        await communicator.send_json_to({"user_text": "hi"})
+
+        frames = [await communicator.receive_from() for _ in range(5)]  # 사용자 메시지, 답변 조각 3개, 사용량
+        await communicator.disconnect()
+        return frames[1:4]
+
+    async def test_delta_mode_sends_text_spans_after_first_frame(self):
+        first, *deltas = await self.receive_answer()
+
+        # 첫 조각은 메시지 템플릿을 #chat-messages에 추가합니다.
+        self.assertIn('id="chat-messages" hx-swap-oob="beforeend"', first)
+        self.assertIn("안녕", first)
+        self.assertNotIn("<script>", first)
+        message_id = re.search(r'id="(message-[0-9a-f]+)-text"', first).group(1)
+
+        # 이어지는 조각은 이스케이프한 텍스트 span만 전송합니다.
+        self.assertEqual(deltas, [
+            f'<span id="{message_id}-text" hx-swap-oob="beforeend">&lt;하세요&gt;</span>',
+            f'<span id="{message_id}-text" hx-swap-oob="beforeend">!</span>',
+        ])
+
+    async def test_stream_mode_hook(self):
+        with mock.patch.object(ChatLLMConsumer, "get_stream_mode", return_value="script"):
+            frames = await self.receive_answer()
+
+        self.assertEqual(sum("<script>" in frame for frame in frames), 2)
+        self.assertFalse(any("<span id=" in frame for frame in frames))
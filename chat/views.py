@@ -5,14 +5,13 @@ from contextlib import aclosing
 from typing import List, AsyncGenerator, TypedDict, Optional, Dict
 from uuid import uuid4
 
-from asgiref.sync import sync_to_async
 from channels.layers import get_channel_layer
 from django.contrib.auth.decorators import login_required
 from django.core.files import File
 from django.http import StreamingHttpResponse, HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.template.loader import render_to_string
-from django.utils.html import escapejs
+from django.utils.html import escape, escapejs
 from django.views import View
 
 from .forms import MessageForm
@@ -27,6 +26,15 @@ class ChatMessage(TypedDict):
     content: str
 
 
+def render_text_delta(assistant_message_id: str, text: str) -> str:
+    """스트리밍 답변의 두 번째 조각부터 전송하는 텍스트 조각.
+
+    htmx OOB 스왑(beforeend)으로 첫 조각에서 만든 메시지의 텍스트 span 끝에 추가되므로,
+    조각마다 스크립트를 실행하지 않고 HTML 이스케이프만 한 번 수행합니다.
+    """
+    return f'<span id="{assistant_message_id}-text" hx-swap-oob="beforeend">{escape(text)}</span>'
+
+
 @login_required
 def index(request):
     return render(request, "chat/index.html")
@@ -40,6 +48,9 @@ class ChatLLMView(View):  # 컨셉 코드
     max_tokens = 1024
     list_template_name = "chat/_llm_message_list.html"
     template_name = "chat/_llm_message.html"
+    # "delta" : 이어지는 조각을 텍스트 조각(render_text_delta)으로 전송
+    # "script" : 조각마다 template_name의 스크립트로 텍스트를 추가 (이전 방식)
+    stream_mode = "delta"
 
     # 정적인 설정 변경은 위 클래스 변수 설정을 오버라이딩하고
     # 동적인 설정 변경은 아래 메서드를 오버라이딩합니다.
@@ -50,6 +61,7 @@ class ChatLLMView(View):  # 컨셉 코드
     def get_llm_model(self) -> str: return self.llm_model
     def get_list_template_name(self): return self.list_template_name
     def get_template_name(self): return self.template_name
+    def get_stream_mode(self) -> str: return self.stream_mode
 
     # 메시지 저장소로서 세션을 활용. 메서드를 오버라이딩하여 모델 활용도 가능
     async def get_messages(self) -> List[ChatMessage]:
@@ -105,13 +117,20 @@ class ChatLLMView(View):  # 컨셉 코드
             )
 
             is_first = True
+            is_delta_mode = self.get_stream_mode() == "delta"
             assistant_message_id: str = f"message-{uuid4().hex}"
-            assistant_message = ""
+            # 긴 응답에서 문자열을 반복해서 이어 붙이지 않도록, 조각을 모아 마지막에 한 번 합칩니다.
+            assistant_chunks: List[str] = []
             llm_chunk_response = LLMResponse()
             async for llm_chunk_response in llm_stream_response:
                 if llm_chunk_response.text:
-                    chunk_text = escapejs(llm_chunk_response.text)
-                    assistant_message += chunk_text
+                    assistant_chunks.append(llm_chunk_response.text)
+                    if is_delta_mode and not is_first:
+                        yield render_text_delta(assistant_message_id, llm_chunk_response.text)
+                        continue
+
+                    # delta 모드의 첫 조각은 span 안에 출력되므로 템플릿의 HTML 이스케이프만 적용합니다.
+                    chunk_text = llm_chunk_response.text if is_delta_mode else escapejs(llm_chunk_response.text)
                     yield render_to_string(
                         self.get_template_name(),
                         {
@@ -126,7 +145,7 @@ class ChatLLMView(View):  # 컨셉 코드
                         is_first = False
 
             chat_history.append(ChatMessage(role="user", content=user_text))
-            chat_history.append(ChatMessage(role="assistant", content=assistant_message))
+            chat_history.append(ChatMessage(role="assistant", content="".join(assistant_chunks)))
             await self.set_messages(chat_history)
 
             estimated_cost_usd = llm_chunk_response.get_cost_usd() or 0
@@ -214,9 +233,8 @@ class MultiUserChatView(View):  # 기본 컨셉만 구현
         폼을 검증하고, 메시지를 채널 레이어를 통해 전파한 후, HTTP 응답을 반환합니다.
         """
 
-        username: str = await sync_to_async(
-            lambda: request.user.username or "anonymous"
-        )()
+        user = await request.auser()
+        username: str = user.username or "anonymous"
         room_name = self.get_room_name()
         form = MessageForm(data=request.POST, files=request.FILES)
 
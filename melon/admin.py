@@ -1,5 +1,6 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import Song, Genre
+from .search import get_search_index
 
 
 @admin.register(Song)
@@ -29,6 +30,35 @@ class SongAdmin(admin.ModelAdmin):
         ("추가 정보", {"fields": ("genres", "lyrics", "likes")}),
     )
 
+    # icontains 테이블 스캔 대신, 검색 색인(가사 포함)을 통해 검색합니다.
+    search_result_limit = 1000
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        # 한 개 더 조회하여, 결과가 잘렸는지 확인합니다.
+        pks = get_search_index().search(search_term, limit=self.search_result_limit + 1)
+        if len(pks) > self.search_result_limit:
+            pks = pks[:self.search_result_limit]
+            self.message_user(
+                request,
+                f"검색 결과가 많아 관련도 상위 {self.search_result_limit}곡만 표시합니다. 검색어를 더 구체적으로 입력해주세요.",
+                messages.WARNING,
+            )
+        return queryset.filter(pk__in=pks), False
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        get_search_index().index_songs([obj])
+
+    def delete_model(self, request, obj):
+        get_search_index().remove_songs([obj.pk])
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        get_search_index().remove_songs(queryset.values_list("pk", flat=True))
+        super().delete_queryset(request, queryset)
+
 
 @admin.register(Genre)
 class GenreAdmin(admin.ModelAdmin):
@@ -0,0 +1,93 @@
+# melon/cache.py
+
+from typing import Dict, Optional
+
+from django.core.cache import cache
+from django.utils.http import quote_etag
+
+
+# 차트 데이터 버전. import_melon_chart 명령의 트랜잭션 커밋 시점에 1씩 증가합니다.
+DATA_VERSION_KEY = "melon:data_version"
+
+FRAGMENT_KEY_PREFIX = "melon:fragment"
+FRAGMENT_HITS_KEY = "melon:fragment:hits"
+FRAGMENT_MISSES_KEY = "melon:fragment:misses"
+FRAGMENT_NOT_MODIFIED_KEY = "melon:fragment:not_modified"
+
+
+def get_data_version() -> int:
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        cache.add(DATA_VERSION_KEY, 1, timeout=None)
+        version = cache.get(DATA_VERSION_KEY, 1)
+    return version
+
+
+def bump_data_version() -> int:
+    """차트 데이터 버전을 올려, 이전 버전으로 캐싱된 모든 조각을 무효화합니다."""
+    try:
+        return cache.incr(DATA_VERSION_KEY)
+    except ValueError:
+        # 캐시에 버전 키가 없는 경우 (캐시 재시작 등)
+        cache.add(DATA_VERSION_KEY, 1, timeout=None)
+        return cache.incr(DATA_VERSION_KEY)
+
+
+class FragmentCache:
+    """HTMX 부분 응답(HTML 조각)을 (뷰 이름, 페이지/커서, 데이터 버전) 키로 캐싱합니다.
+
+    조각 내용은 키에 의해 결정되므로 ETag 또한 키로부터 계산하며,
+    If-None-Match 요청에는 렌더링이나 캐시 조회 없이 304 응답이 가능합니다.
+    """
+
+    def __init__(self, view_name: str, timeout: Optional[int] = 60 * 60 * 24):
+        self.view_name = view_name
+        self.timeout = timeout
+
+    def get_key(self, cursor: str, version: int) -> str:
+        return f"{FRAGMENT_KEY_PREFIX}:{self.view_name}:{cursor}:v{version}"
+
+    def get_etag(self, cursor: str, version: int) -> str:
+        return quote_etag(f"{self.view_name}-{cursor}-v{version}")
+
+    def get(self, cursor: str, version: int) -> Optional[str]:
+        content = cache.get(self.get_key(cursor, version))
+        _incr_counter(FRAGMENT_HITS_KEY if content is not None else FRAGMENT_MISSES_KEY)
+        return content
+
+    def set(self, cursor: str, version: int, content: str) -> None:
+        cache.set(self.get_key(cursor, version), content, self.timeout)
+
+    def record_not_modified(self) -> None:
+        _incr_counter(FRAGMENT_NOT_MODIFIED_KEY)
+
+
+def _incr_counter(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def get_fragment_cache_stats() -> Dict[str, float]:
+    counters = cache.get_many(
+        [FRAGMENT_HITS_KEY, FRAGMENT_MISSES_KEY, FRAGMENT_NOT_MODIFIED_KEY]
+    )
+    hits = counters.get(FRAGMENT_HITS_KEY, 0)
+    misses = counters.get(FRAGMENT_MISSES_KEY, 0)
+    not_modified = counters.get(FRAGMENT_NOT_MODIFIED_KEY, 0)
+    total = hits + misses + not_modified
+    return {
+        "hits": hits,
+        "misses": misses,
+        "not_modified": not_modified,
+        # 304 응답도 렌더링 없이 처리된 요청이므로 적중으로 봅니다.
+        "hit_ratio": ((hits + not_modified) / total) if total else 0.0,
+    }
+
+
+def reset_fragment_cache_stats() -> None:
+    cache.delete_many(
+        [FRAGMENT_HITS_KEY, FRAGMENT_MISSES_KEY, FRAGMENT_NOT_MODIFIED_KEY]
+    )
@@ -0,0 +1,171 @@
+# melon/facets.py
+
+import threading
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from django.core.cache import cache
+
+from .cache import get_data_version
+from .models import Song
+
+
+FACET_INDEX_KEY_PREFIX = "melon:facets"
+
+# iter_song_ids에서 offset 이전의 곡들을 건너뛰는 블록 크기(비트)
+SKIP_BLOCK_BITS = 4096
+SKIP_BLOCK_MASK = (1 << SKIP_BLOCK_BITS) - 1
+
+
+def make_bitset(positions: Iterable[int], size: int) -> int:
+    """위치 목록으로 비트셋을 만듭니다.
+
+    큰 정수에 `bits |= 1 << position`을 반복하면 매번 정수 전체를 복사하므로 O(n²)이 됩니다.
+    bytearray에 비트를 켠 뒤 한 번에 정수로 변환합니다.
+    """
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class FacetIndex:
+    """장르/발매연도별 곡 집합을 비트셋으로 보관하는 패싯 색인.
+
+    곡들을 순위 순으로 나열한 위치(position)를 비트 번호로 사용하며,
+    각 패싯 값은 해당 곡들의 비트가 켜진 파이썬 정수(비트셋)입니다.
+    필터 교집합은 비트 AND 연산, 개수는 bit_count()로 계산되므로
+    조인 쿼리 없이 마이크로초 단위로 처리됩니다.
+    """
+
+    def __init__(self, version: int, song_ids: array, genres: Dict[str, int], years: Dict[int, int]):
+        self.version = version
+        self.song_ids = song_ids  # position -> melon song_id (순위 순)
+        self.genres = genres  # 장르명 -> 비트셋
+        self.years = years  # 발매연도 -> 비트셋
+        self.all_bits = (1 << len(song_ids)) - 1
+
+    @classmethod
+    def build(cls, version: int) -> "FacetIndex":
+        song_ids = array("q")
+        position_by_pk: Dict[int, int] = {}
+        year_positions: Dict[int, List[int]] = defaultdict(list)
+
+        qs = Song.objects.order_by("rank", "pk").values_list("pk", "song_id", "release_date")
+        for position, (pk, song_id, release_date) in enumerate(qs.iterator(chunk_size=5000)):
+            song_ids.append(song_id)
+            position_by_pk[pk] = position
+            year_positions[release_date.year].append(position)
+
+        genre_positions: Dict[str, List[int]] = defaultdict(list)
+        through_qs = Song.genres.through.objects.values_list("song_id", "genre__name")
+        for pk, genre_name in through_qs.iterator(chunk_size=5000):
+            position = position_by_pk.get(pk)
+            if position is not None:
+                genre_positions[genre_name].append(position)
+
+        size = len(song_ids)
+        genres = {name: make_bitset(positions, size) for name, positions in genre_positions.items()}
+        years = {year: make_bitset(positions, size) for year, positions in year_positions.items()}
+        return cls(version, song_ids, genres, years)
+
+    def filter(self, genres: Iterable[str] = (), years: Iterable[int] = ()) -> int:
+        """같은 패싯 내에서는 OR, 서로 다른 패싯 간에는 AND로 결합한 비트셋을 반환합니다."""
+        return self._select(self.genres, genres) & self._select(self.years, years)
+
+    def _select(self, facet: Dict, values: Iterable) -> int:
+        values = list(values)
+        if not values:
+            return self.all_bits
+        bits = 0
+        for value in values:
+            bits |= facet.get(value, 0)
+        return bits
+
+    def genre_counts(self, genres: Iterable[str] = (), years: Iterable[int] = ()) -> Dict[str, int]:
+        # 장르별 개수는 (장르 외의) 다른 패싯 선택만 반영합니다.
+        base = self._select(self.years, years)
+        return {name: (bits & base).bit_count() for name, bits in self.genres.items()}
+
+    def year_counts(self, genres: Iterable[str] = (), years: Iterable[int] = ()) -> Dict[int, int]:
+        base = self._select(self.genres, genres)
+        return {year: (bits & base).bit_count() for year, bits in self.years.items()}
+
+    def iter_song_ids(self, bits: int, offset: int = 0, limit: Optional[int] = None) -> Iterator[int]:
+        """비트셋에 포함된 곡의 song_id를 순위 순으로 반환합니다.
+
+        offset 이전의 곡들은 블록 단위 bit_count()로 건너뛰고, 비트 단위 순회는 작은 블록 정수에서만 하므로
+        뒤쪽 페이지도 앞쪽 페이지와 비슷한 비용으로 조회합니다.
+        """
+        remaining = limit
+        skip = offset
+        base = 0
+        while bits and (remaining is None or remaining > 0):
+            block = bits & SKIP_BLOCK_MASK
+            bits >>= SKIP_BLOCK_BITS
+            count = block.bit_count()
+            if count <= skip:
+                skip -= count
+            else:
+                while block and (remaining is None or remaining > 0):
+                    lowest = block & -block
+                    if skip:
+                        skip -= 1
+                    else:
+                        yield self.song_ids[base + lowest.bit_length() - 1]
+                        if remaining is not None:
+                            remaining -= 1
+                    block ^= lowest
+            base += SKIP_BLOCK_BITS
+
+
+_lock = threading.Lock()
+_facet_index: Optional[FacetIndex] = None
+
+
+def get_cache_key(version: int) -> str:
+    return f"{FACET_INDEX_KEY_PREFIX}:v{version}"
+
+
+def materialize_facet_index(version: Optional[int] = None) -> FacetIndex:
+    """패싯 색인을 생성하여 캐시에 저장합니다. import_melon_chart 커밋 후에 호출됩니다."""
+    if version is None:
+        version = get_data_version()
+    facet_index = FacetIndex.build(version)
+    cache.set(
+        get_cache_key(version),
+        (facet_index.song_ids.tobytes(), facet_index.genres, facet_index.years),
+        timeout=None,
+    )
+    return facet_index
+
+
+def get_facet_index() -> FacetIndex:
+    """현재 데이터 버전의 패싯 색인을 반환합니다. 프로세스 내에 보관하여 요청마다 재사용합니다."""
+    global _facet_index
+
+    version = get_data_version()
+    facet_index = _facet_index
+    if facet_index is not None and facet_index.version == version:
+        return facet_index
+
+    with _lock:
+        if _facet_index is not None and _facet_index.version == version:
+            return _facet_index
+
+        cached = cache.get(get_cache_key(version))
+        if cached is not None:
+            song_ids_bytes, genres, years = cached
+            song_ids = array("q")
+            song_ids.frombytes(song_ids_bytes)
+            facet_index = FacetIndex(version, song_ids, genres, years)
+        else:
+            facet_index = materialize_facet_index(version)
+
+        _facet_index = facet_index
+        return facet_index
+
+
+def parse_years(values: List[str]) -> List[int]:
+    return [int(value) for value in values if value.isdigit()]
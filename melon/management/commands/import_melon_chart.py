@@ -1,8 +1,12 @@
 import json
 from datetime import datetime
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from melon.cache import bump_data_version
+from melon.facets import materialize_facet_index
 from melon.models import Song, Genre
+from melon.search import get_search_index
 
 
 class Command(BaseCommand):
@@ -10,6 +14,11 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("json_file", type=str, help="Path to the JSON file")
+        parser.add_argument(
+            "--warm-covers",
+            action="store_true",
+            help="Pre-generate album cover thumbnails after import",
+        )
 
     def handle(self, *args, **options):
         json_file = options["json_file"]
@@ -17,6 +26,8 @@ class Command(BaseCommand):
         with open(json_file, "r", encoding="utf-8") as file:
             data = json.load(file)
 
+        imported_songs = []
+
         with transaction.atomic():
             for song_data in data:
                 song, created = Song.objects.update_or_create(
@@ -43,9 +54,22 @@ class Command(BaseCommand):
                     genre, _ = Genre.objects.get_or_create(name=genre_name)
                     song.genres.add(genre)
 
+                imported_songs.append(song)
+
                 if created:
                     self.stdout.write(self.style.SUCCESS(f"Created song: {song}"))
                 else:
                     self.stdout.write(self.style.SUCCESS(f"Updated song: {song}"))
 
+            # 가져온 곡들만 검색 색인에 반영합니다.
+            get_search_index().index_songs(imported_songs)
+
+            # 커밋이 완료된 후에 데이터 버전을 올려, 캐싱된 목록 조각을 무효화합니다.
+            transaction.on_commit(bump_data_version)
+            # 새 데이터 버전의 패싯 색인을 미리 생성해둡니다.
+            transaction.on_commit(materialize_facet_index)
+
         self.stdout.write(self.style.SUCCESS("Successfully imported Melon chart data"))
+
+        if options["warm_covers"]:
+            call_command("warm_melon_covers", stdout=self.stdout)
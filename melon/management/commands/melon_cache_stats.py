@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from melon.cache import get_data_version, get_fragment_cache_stats, reset_fragment_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Report hit ratio of the melon HTMX fragment cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset hit/miss counters")
+
+    def handle(self, *args, **options):
+        stats = get_fragment_cache_stats()
+
+        self.stdout.write(f"data version : {get_data_version()}")
+        self.stdout.write(f"hits         : {stats['hits']}")
+        self.stdout.write(f"misses       : {stats['misses']}")
+        self.stdout.write(f"not modified : {stats['not_modified']}")
+        self.stdout.write(self.style.SUCCESS(f"hit ratio    : {stats['hit_ratio']:.2%}"))
+
+        if options["reset"]:
+            reset_fragment_cache_stats()
+            self.stdout.write(self.style.WARNING("Fragment cache counters have been reset."))
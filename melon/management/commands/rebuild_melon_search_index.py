@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from melon.search import get_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index of melon songs"
+
+    def handle(self, *args, **options):
+        search_index = get_search_index()
+
+        started = time.perf_counter()
+        count = search_index.rebuild()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {count} songs with {search_index.__class__.__name__} in {elapsed:.2f}s"
+            )
+        )
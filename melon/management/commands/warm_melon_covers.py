@@ -0,0 +1,40 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+
+from melon.models import Song
+from melon.thumbnails import get_thumbnail_cache, get_url_key
+
+
+class Command(BaseCommand):
+    help = "Pre-generate album cover thumbnails of melon songs"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8, help="Number of concurrent fetches")
+
+    def handle(self, *args, **options):
+        thumbnail_cache = get_thumbnail_cache()
+
+        # 같은 앨범의 곡들은 커버 이미지를 공유하므로, URL 단위로 한 번만 처리합니다.
+        urls = set(Song.objects.values_list("album_cover_url", flat=True))
+        pending = [url for url in urls if thumbnail_cache.lookup(get_url_key(url)) is None]
+
+        self.stdout.write(f"{len(urls)} covers, {len(urls) - len(pending)} already cached")
+
+        started = time.perf_counter()
+        created, failed = 0, 0
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            futures = {executor.submit(thumbnail_cache.get_or_create, url): url for url in pending}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    created += 1
+                except Exception as e:
+                    failed += 1
+                    self.stdout.write(self.style.ERROR(f"Failed: {futures[future]} ({e})"))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {created} thumbnails in {elapsed:.2f}s ({failed} failed)")
+        )
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("melon", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="song",
+            index=models.Index(
+                fields=[
+                    "rank",
+                    "title",
+                    "artist_name",
+                    "album_name",
+                    "album_cover_url",
+                ],
+                name="melon_song_list_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:08
+
+from django.db import OperationalError, migrations
+
+
+FTS_TABLE_NAME = "melon_song_fts"
+SEARCH_FIELDS = ("title", "artist_name", "album_name", "lyrics")
+
+
+def create_fts_table(apps, schema_editor):
+    # SQLite FTS5를 지원하는 경우에만 가상 테이블을 생성합니다.
+    # 지원하지 않으면 melon.search 모듈이 프로세스 내 n-gram 색인으로 대체합니다.
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    columns = ", ".join(SEARCH_FIELDS)
+    try:
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE_NAME} "
+            f"USING fts5({columns}, tokenize='unicode61', prefix='2 3')"
+        )
+    except OperationalError:
+        return
+
+    schema_editor.execute(
+        f"INSERT INTO {FTS_TABLE_NAME} (rowid, {columns}) SELECT id, {columns} FROM melon_song"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("melon", "0002_song_list_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -1,4 +1,7 @@
 from django.db import models
+from django.urls import reverse
+
+from .thumbnails import get_url_key
 
 
 class Genre(models.Model):
@@ -24,8 +27,23 @@ class Song(models.Model):
 
     class Meta:
         ordering = ["rank"]
+        indexes = [
+            # 목록 페이지에서 렌더링하는 컬럼만으로 구성된 커버링 인덱스.
+            # rank 정렬 + OFFSET 페이징을 테이블 조회 없이 인덱스만으로 처리합니다.
+            models.Index(
+                fields=["rank", "title", "artist_name", "album_name", "album_cover_url"],
+                name="melon_song_list_idx",
+            ),
+        ]
         verbose_name = "노래"
         verbose_name_plural = "노래들"
 
     def __str__(self):
         return f"{self.rank}. {self.title} - {self.artist_name}"
+
+    @property
+    def cover_thumbnail_url(self) -> str:
+        return reverse(
+            "melon:song_cover_thumbnail",
+            args=[self.pk, get_url_key(self.album_cover_url)],
+        )
@@ -0,0 +1,324 @@
+# melon/search.py
+
+import abc
+import functools
+import heapq
+import logging
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import connection
+
+from .cache import get_data_version
+from .models import Song
+
+logger = logging.getLogger(__name__)
+
+
+# 검색 대상 필드와 랭킹 가중치
+SEARCH_FIELDS = ("title", "artist_name", "album_name", "lyrics")
+FIELD_WEIGHTS = {
+    "title": 10.0,
+    "artist_name": 5.0,
+    "album_name": 3.0,
+    "lyrics": 1.0,
+}
+
+# 한글/영문/숫자 단어 단위로 토큰을 분리합니다.
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """NFKC 정규화 및 소문자 변환 후 단어 단위로 분리합니다."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return TOKEN_RE.findall(text)
+
+
+def ngrams(token: str, n: int = 2) -> Set[str]:
+    """토큰을 n-gram 집합으로 분리합니다. 한글 2음절 검색어도 매칭되도록 bigram을 사용합니다."""
+    if len(token) <= n:
+        return {token}
+    return {token[i:i + n] for i in range(len(token) - n + 1)}
+
+
+class SongSearchIndex(abc.ABC):
+    """melon.Song 역색인의 공통 인터페이스"""
+
+    @abc.abstractmethod
+    def index_songs(self, songs: Iterable[Song]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def remove_songs(self, pks: Iterable[int]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def rebuild(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def search(self, query: str, limit: int = 20) -> List[int]:
+        """랭킹 순으로 정렬된 Song pk 목록을 반환합니다."""
+
+
+class Fts5SongSearchIndex(SongSearchIndex):
+    """SQLite FTS5 가상 테이블(melon_song_fts) 기반의 역색인.
+
+    rowid를 Song pk로 사용하며, 가상 테이블은 melon 마이그레이션에서 생성됩니다.
+    """
+
+    table_name = "melon_song_fts"
+    batch_size = 500
+
+    def index_songs(self, songs: Iterable[Song]) -> None:
+        rows = [
+            (song.pk, *(getattr(song, field) for field in SEARCH_FIELDS))
+            for song in songs
+        ]
+        if not rows:
+            return
+
+        columns = ", ".join(SEARCH_FIELDS)
+        placeholders = ", ".join(["%s"] * (len(SEARCH_FIELDS) + 1))
+        with connection.cursor() as cursor:
+            self._delete(cursor, [row[0] for row in rows])
+            cursor.executemany(
+                f"INSERT INTO {self.table_name} (rowid, {columns}) VALUES ({placeholders})",
+                rows,
+            )
+
+    def remove_songs(self, pks: Iterable[int]) -> None:
+        with connection.cursor() as cursor:
+            self._delete(cursor, list(pks))
+
+    def _delete(self, cursor, pks: List[int]) -> None:
+        for i in range(0, len(pks), self.batch_size):
+            batch = pks[i:i + self.batch_size]
+            placeholders = ", ".join(["%s"] * len(batch))
+            cursor.execute(
+                f"DELETE FROM {self.table_name} WHERE rowid IN ({placeholders})", batch
+            )
+
+    def rebuild(self) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table_name}")
+
+        count = 0
+        qs = Song.objects.only(*SEARCH_FIELDS).order_by("pk")
+        batch = []
+        for song in qs.iterator(chunk_size=self.batch_size):
+            batch.append(song)
+            if len(batch) >= self.batch_size:
+                self.index_songs(batch)
+                count += len(batch)
+                batch = []
+        self.index_songs(batch)
+        return count + len(batch)
+
+    @staticmethod
+    def make_match_query(query: str) -> Optional[str]:
+        # 각 토큰을 접두어 검색으로 변환 : "사랑을" 처럼 조사가 붙은 단어도 "사랑"으로 찾을 수 있습니다.
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+        return " ".join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+
+    def search(self, query: str, limit: int = 20) -> List[int]:
+        match_query = self.make_match_query(query)
+        if match_query is None:
+            return []
+
+        weights = ", ".join(str(FIELD_WEIGHTS[field]) for field in SEARCH_FIELDS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {self.table_name} WHERE {self.table_name} MATCH %s "
+                f"ORDER BY bm25({self.table_name}, {weights}) LIMIT %s",
+                [match_query, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class NgramSongSearchIndex(SongSearchIndex):
+    """FTS5를 사용할 수 없을 때의 프로세스 내 bigram 역색인.
+
+    프로세스마다 메모리에 색인을 유지하므로, 차트 데이터 버전이 바뀌면 백그라운드 스레드에서 새 색인을 구축하고
+    구축이 끝날 때까지는 기존 색인으로 검색합니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # 재구축을 직렬화합니다. (백그라운드 스레드와 rebuild_melon_search_index 명령)
+        self.rebuild_lock = threading.Lock()
+        self.rebuild_thread: Optional[threading.Thread] = None
+        # 재구축 중에 반영된 변경 (메서드 이름, 인자). 구축한 색인에 다시 적용합니다.
+        self.pending_changes: Optional[List[Tuple[str, list]]] = None
+        self.version: Optional[int] = None
+        # field -> gram -> pk 집합
+        self.postings: Dict[str, Dict[str, Set[int]]] = {
+            field: defaultdict(set) for field in SEARCH_FIELDS
+        }
+        # 삭제/갱신 시 색인에서 제거하기 위한 pk -> field -> gram 집합
+        self.doc_grams: Dict[int, Dict[str, Set[str]]] = {}
+
+    @staticmethod
+    def index_grams(token: str) -> Set[str]:
+        # 1글자 검색어는 FTS5의 접두어 검색처럼, 해당 글자로 시작하는 토큰과 매칭되도록 첫 글자도 색인합니다.
+        return ngrams(token) | {token[0]}
+
+    def index_songs(self, songs: Iterable[Song]) -> None:
+        songs = list(songs)
+        with self.lock:
+            if self.pending_changes is not None:
+                self.pending_changes.append(("index_songs", songs))
+            for song in songs:
+                self._remove(song.pk)
+                doc = {}
+                for field in SEARCH_FIELDS:
+                    grams = set()
+                    for token in tokenize(getattr(song, field)):
+                        grams |= self.index_grams(token)
+                    for gram in grams:
+                        self.postings[field][gram].add(song.pk)
+                    doc[field] = grams
+                self.doc_grams[song.pk] = doc
+
+    def remove_songs(self, pks: Iterable[int]) -> None:
+        pks = list(pks)
+        with self.lock:
+            if self.pending_changes is not None:
+                self.pending_changes.append(("remove_songs", pks))
+            for pk in pks:
+                self._remove(pk)
+
+    def _remove(self, pk: int) -> None:
+        doc = self.doc_grams.pop(pk, None)
+        if doc is None:
+            return
+        for field, grams in doc.items():
+            field_postings = self.postings[field]
+            for gram in grams:
+                pks = field_postings.get(gram)
+                if pks is not None:
+                    pks.discard(pk)
+                    if not pks:
+                        del field_postings[gram]
+
+    def rebuild(self) -> int:
+        with self.rebuild_lock:
+            return self._rebuild()
+
+    def _rebuild(self) -> int:
+        # 구축을 시작하기 전의 버전을 기록하여, 구축 중에 바뀐 데이터는 다음 검색에서 다시 반영합니다.
+        version = get_data_version()
+        with self.lock:
+            self.pending_changes = []
+        try:
+            # 락을 잡지 않고 새 색인을 구축하므로, 그동안의 검색은 기존 색인으로 처리됩니다.
+            new_index = NgramSongSearchIndex()
+            new_index.index_songs(Song.objects.only(*SEARCH_FIELDS).iterator(chunk_size=2000))
+            with self.lock:
+                for method_name, arg in self.pending_changes:
+                    getattr(new_index, method_name)(arg)
+                self.postings = new_index.postings
+                self.doc_grams = new_index.doc_grams
+                self.version = version
+                return len(self.doc_grams)
+        finally:
+            with self.lock:
+                self.pending_changes = None
+
+    def start_rebuild(self) -> None:
+        """백그라운드 스레드에서 색인을 재구축합니다. 이미 재구축 중이면 아무것도 하지 않습니다."""
+        with self.lock:
+            if self.rebuild_thread is not None and self.rebuild_thread.is_alive():
+                return
+            self.rebuild_thread = threading.Thread(target=self.run_rebuild, name="melon-search-rebuild", daemon=True)
+            self.rebuild_thread.start()
+
+    def run_rebuild(self) -> None:
+        try:
+            count = self.rebuild()
+            logger.info(f"n-gram 검색 색인을 재구축했습니다. ({count}곡)")
+        except Exception:
+            logger.exception("n-gram 검색 색인 재구축에 실패했습니다.")
+        finally:
+            # 이 스레드의 DB 연결을 정리합니다.
+            connection.close()
+
+    def ensure_fresh(self) -> None:
+        if self.version is None:
+            # 아직 검색할 색인이 없으므로, 첫 검색에서 구축이 끝날 때까지 기다립니다.
+            with self.rebuild_lock:
+                if self.version is None:
+                    self._rebuild()
+        elif self.version != get_data_version():
+            self.start_rebuild()
+
+    def search(self, query: str, limit: int = 20) -> List[int]:
+        # FTS5 검색처럼, 모든 토큰이 (필드에 관계없이) 매칭되는 곡만 결과에 포함합니다.
+        token_grams = [ngrams(token) for token in dict.fromkeys(tokenize(query))]
+        if not token_grams:
+            return []
+
+        self.ensure_fresh()
+        with self.lock:
+            scores: Optional[Dict[int, float]] = None
+            for grams in token_grams:
+                token_scores: Dict[int, float] = defaultdict(float)
+                for field in SEARCH_FIELDS:
+                    for pk in self._match(self.postings[field], grams):
+                        token_scores[pk] += FIELD_WEIGHTS[field]
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {pk: score + token_scores[pk] for pk, score in scores.items() if pk in token_scores}
+                if not scores:
+                    return []
+
+        return heapq.nlargest(limit, scores, key=lambda pk: (scores[pk], -pk))
+
+    @staticmethod
+    def _match(field_postings: Dict[str, Set[int]], grams: Set[str]) -> Set[int]:
+        posting_list = [field_postings.get(gram) for gram in grams]
+        if not all(posting_list):
+            return set()
+        # 가장 작은 posting부터 교집합을 구해, 비교 횟수를 줄입니다.
+        posting_list.sort(key=len)
+        matched = set(posting_list[0])
+        for pks in posting_list[1:]:
+            matched &= pks
+            if not matched:
+                break
+        return matched
+
+
+def is_fts5_available() -> bool:
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [Fts5SongSearchIndex.table_name],
+        )
+        return cursor.fetchone() is not None
+
+
+@functools.cache
+def get_search_index() -> SongSearchIndex:
+    if is_fts5_available():
+        return Fts5SongSearchIndex()
+    logger.warning("FTS5를 사용할 수 없어, 프로세스 내 n-gram 색인을 사용합니다.")
+    return NgramSongSearchIndex()
+
+
+def search_songs(query: str, limit: int = 20, fields: Iterable[str] = ()) -> List[Song]:
+    """검색 랭킹 순서를 유지하여 Song 목록을 반환합니다."""
+    pks = get_search_index().search(query, limit=limit)
+    qs = Song.objects.filter(pk__in=pks)
+    if fields:
+        qs = qs.only(*fields)
+    song_dict = qs.in_bulk()
+    return [song_dict[pk] for pk in pks if pk in song_dict]
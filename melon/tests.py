@@ -1,3 +1,482 @@
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from array import array
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+
+from app.management.commands.bench_async_views import count_thread_hops
+
+from . import facets
+from .admin import SongAdmin
+from .cache import FragmentCache, bump_data_version, get_data_version, get_fragment_cache_stats
+from .facets import SKIP_BLOCK_BITS, FacetIndex, get_facet_index, make_bitset, parse_years
+from .models import Genre, Song
+from .search import Fts5SongSearchIndex, NgramSongSearchIndex, get_search_index, is_fts5_available
+
+
+def create_songs(count, start_rank=1):
+    genre, _ = Genre.objects.get_or_create(name="발라드")
+    songs = []
+    for rank in range(start_rank, start_rank + count):
+        song = Song.objects.create(
+            song_id=1000 + rank,
+            rank=rank,
+            album_id=2000 + rank,
+            album_name=f"앨범 {rank}",
+            title=f"노래 {rank}",
+            artist_id=3000 + rank,
+            artist_name=f"가수 {rank}",
+            album_cover_url=f"https://example.com/covers/{rank}.jpg",
+            lyrics="가사 " * 1000,
+            release_date=date(2024, 9, 1),
+            likes=rank,
+        )
+        song.genres.add(genre)
+        songs.append(song)
+    return songs
+
+
+class SongListQueryTest(TestCase):
+    # 목록 템플릿에서 사용하지 않는 컬럼
+    unused_columns = ("lyrics", "release_date", "likes", "album_id", "artist_id")
+
+    @classmethod
+    def setUpTestData(cls):
+        create_songs(25)
+
+    def setUp(self):
+        cache.clear()
+
+    def assert_song_list_queries(self, headers=None):
+        url = reverse("melon:song_list")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, {"page": 2}, headers=headers or {})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "노래 11")
+
+        # 페이지 수 COUNT 1회 + 목록 SELECT 1회. 장르 조회 등 N+1 쿼리가 없어야 합니다.
+        sql_list = [query["sql"] for query in ctx.captured_queries]
+        self.assertEqual(len(sql_list), 2, sql_list)
+
+        for sql in sql_list:
+            self.assertNotIn("melon_song_genres", sql)
+            for column in self.unused_columns:
+                self.assertNotIn(f'"{column}"', sql)
+
+        return response
+
+    def test_full_page(self):
+        self.assert_song_list_queries()
+
+    def test_htmx_partial(self):
+        response = self.assert_song_list_queries(headers={"HX-Request": "true"})
+        self.assertTemplateUsed(response, "melon/_song_list.html")
+        self.assertTemplateNotUsed(response, "melon/song_list.html")
+
+
+class SongListFragmentCacheTest(TestCase):
+    htmx_headers = {"HX-Request": "true"}
+
+    @classmethod
+    def setUpTestData(cls):
+        create_songs(15)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("melon:song_list")
+
+    def test_repeat_load_is_served_from_cache(self):
+        first = self.client.get(self.url, {"page": 2}, headers=self.htmx_headers)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {"page": 2}, headers=self.htmx_headers)
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+        self.assertEqual(get_fragment_cache_stats()["hits"], 1)
+
+    def test_if_none_match_returns_304(self):
+        response = self.client.get(self.url, headers=self.htmx_headers)
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                self.url,
+                headers={**self.htmx_headers, "If-None-Match": response["ETag"]},
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_data_version_bump_invalidates_fragments(self):
+        response = self.client.get(self.url, headers=self.htmx_headers)
+        bump_data_version()
+        with self.assertNumQueries(2):
+            new_response = self.client.get(
+                self.url,
+                headers={**self.htmx_headers, "If-None-Match": response["ETag"]},
+            )
+        self.assertEqual(new_response.status_code, 200)
+        self.assertNotEqual(response["ETag"], new_response["ETag"])
+
+    def test_data_version_bump_from_another_process(self):
+        # import_melon_chart 처럼 다른 프로세스에서 올린 버전도 서버의 캐시 조회에 반영됩니다.
+        response = self.client.get(self.url, headers=self.htmx_headers)
+        version = get_data_version()
+        subprocess.run(
+            [sys.executable, "-c", "import django; django.setup(); from melon.cache import bump_data_version; bump_data_version()"],
+            cwd=settings.BASE_DIR, env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}, check=True,
+        )
+        self.assertEqual(get_data_version(), version + 1)
+
+        new_response = self.client.get(self.url, headers={**self.htmx_headers, "If-None-Match": response["ETag"]})
+        self.assertEqual(new_response.status_code, 200)
+
+    async def test_cached_hit_takes_one_thread_hop(self):
+        await self.async_client.get(self.url, {"page": 2}, headers=self.htmx_headers)
+        hops = Counter()
+        with count_thread_hops(hops):
+            response = await self.async_client.get(self.url, {"page": 2}, headers=self.htmx_headers)
+        self.assertEqual(response.status_code, 200)
+        # 캐시 조회와 카운터 증가는 동기 뷰의 스레드 안에서 처리되며, 따로 스레드로 전환하지 않습니다.
+        self.assertEqual(hops["View.as_view.<locals>.view"], 1)
+        self.assertEqual([name for name in hops if "Cache" in name or "QuerySet" in name], [])
+        self.assertEqual(get_fragment_cache_stats()["hits"], 1)
+
+
+def fake_cover_fetcher(url):
+    # 외부 네트워크 대신 사용하는 로컬 커버 이미지 fetcher
+    fake_cover_fetcher.calls.append(url)
+    buffer = io.BytesIO()
+    Image.new("RGB", (500, 500), color="red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+fake_cover_fetcher.calls = []
+
+
+class SongCoverThumbnailTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.song = create_songs(1)[0]
+
+    def setUp(self):
+        fake_cover_fetcher.calls.clear()
+        thumbnail_root = tempfile.TemporaryDirectory()
+        self.addCleanup(thumbnail_root.cleanup)
+        settings_override = self.settings(
+            MELON_COVER_FETCHER="melon.tests.fake_cover_fetcher",
+            MELON_THUMBNAIL_ROOT=Path(thumbnail_root.name),
+            MELON_THUMBNAIL_SIZE=100,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_thumbnail_is_fetched_once_and_cached(self):
+        url = self.song.cover_thumbnail_url
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/webp")
+        self.assertIn("immutable", response["Cache-Control"])
+        with Image.open(io.BytesIO(b"".join(response.streaming_content))) as image:
+            self.assertEqual(image.format, "WEBP")
+            self.assertEqual(image.size, (100, 100))
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(url)
+        self.assertEqual(cached_response["ETag"], response["ETag"])
+        self.assertEqual(fake_cover_fetcher.calls, [self.song.album_cover_url])
+
+        not_modified = self.client.get(url, headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_stale_url_key_returns_404(self):
+        url = reverse("melon:song_cover_thumbnail", args=[self.song.pk, "0" * 16])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(fake_cover_fetcher.calls, [])
+
+
+class SearchIndexTestMixin:
+    """FTS5 색인과 n-gram 색인에 공통으로 적용하는 검색 테스트"""
+
+    def make_index(self):
+        raise NotImplementedError
+
+    @classmethod
+    def setUpTestData(cls):
+        genre, _ = Genre.objects.get_or_create(name="발라드")
+        rows = [
+            # (title, artist_name, album_name, lyrics)
+            ("사랑을 했다", "아이콘", "NEW KIDS", "우리가 만나"),
+            ("밤편지", "아이유", "팔레트", "사랑한다는 말이에요"),
+            ("Love wins all", "아이유", "The Winning", "dearest darling"),
+            ("봄날", "방탄소년단", "You Never Walk Alone", "보고 싶다"),
+        ]
+        cls.songs = []
+        for rank, (title, artist_name, album_name, lyrics) in enumerate(rows, start=1):
+            song = Song.objects.create(
+                song_id=1000 + rank, rank=rank, album_id=2000 + rank, album_name=album_name,
+                title=title, artist_id=3000 + rank, artist_name=artist_name,
+                album_cover_url=f"https://example.com/covers/{rank}.jpg", lyrics=lyrics,
+                release_date=date(2024, 9, 1), likes=rank,
+            )
+            song.genres.add(genre)
+            cls.songs.append(song)
+
+    def setUp(self):
+        cache.clear()
+        self.index = self.make_index()
+        self.index.index_songs(self.songs)
+
+    def test_korean_two_syllable_query(self):
+        # 조사가 붙은 "사랑을", "사랑한다는"도 2음절 검색어로 찾을 수 있어야 합니다.
+        pks = self.index.search("사랑")
+        self.assertCountEqual(pks, [self.songs[0].pk, self.songs[1].pk])
+
+    def test_title_match_ranks_above_lyrics_match(self):
+        pks = self.index.search("사랑")
+        self.assertEqual(pks[0], self.songs[0].pk)
+
+    def test_multiple_tokens_are_intersected(self):
+        self.assertEqual(self.index.search("아이유 love"), [self.songs[2].pk])
+        self.assertEqual(self.index.search("없는검색어"), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.search("아이유", limit=1)), 1)
+
+    def test_removed_song_is_not_found(self):
+        self.index.remove_songs([self.songs[0].pk])
+        self.assertEqual(self.index.search("사랑"), [self.songs[1].pk])
+
+    def test_reindexed_song_uses_new_text(self):
+        song = self.songs[3]
+        song.title = "벚꽃 엔딩"
+        self.index.index_songs([song])
+        self.assertEqual(self.index.search("봄날"), [])
+        self.assertEqual(self.index.search("벚꽃"), [song.pk])
+
+
+class Fts5SongSearchIndexTest(SearchIndexTestMixin, TestCase):
+    def make_index(self):
+        if not is_fts5_available():
+            self.skipTest("SQLite FTS5를 사용할 수 없습니다.")
+        index = Fts5SongSearchIndex()
+        index.remove_songs(song.pk for song in self.songs)
+        return index
+
+
+class NgramSongSearchIndexTest(SearchIndexTestMixin, TestCase):
+    def make_index(self):
+        index = NgramSongSearchIndex()
+        # 테스트에서 직접 색인한 내용을 사용하도록, 현재 데이터 버전의 색인으로 표시합니다.
+        index.version = get_data_version()
+        return index
+
+    def test_single_character_query(self):
+        # 1글자 검색어는 해당 글자로 시작하는 토큰과 매칭됩니다.
+        self.assertEqual(self.index.search("봄"), [self.songs[3].pk])
+        self.assertEqual(self.index.search("밤"), [self.songs[1].pk])
+
+    def test_first_search_builds_index(self):
+        index = NgramSongSearchIndex()
+        self.assertCountEqual(index.search("아이유"), [self.songs[1].pk, self.songs[2].pk])
+        self.assertEqual(index.version, get_data_version())
+
+    def test_stale_index_is_served_while_rebuilding_in_background(self):
+        self.index.remove_songs([self.songs[0].pk])
+        bump_data_version()
+        with mock.patch.object(self.index, "start_rebuild") as start_rebuild, self.assertNumQueries(0):
+            pks = self.index.search("사랑")
+        start_rebuild.assert_called_once_with()
+        self.assertEqual(pks, [self.songs[1].pk])
+
+        self.assertEqual(self.index.rebuild(), len(self.songs))
+        self.assertEqual(self.index.version, get_data_version())
+        self.assertCountEqual(self.index.search("사랑"), [self.songs[0].pk, self.songs[1].pk])
+
+
+class FacetIndexTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # 순위 1~6 : 2023년 3곡, 2024년 3곡. 발라드(1, 2, 4), 댄스(3, 4, 5, 6)
+        cls.songs = create_songs(6)
+        dance = Genre.objects.create(name="댄스")
+        ballad = Genre.objects.get(name="발라드")
+        for song in cls.songs[:3]:
+            song.release_date = date(2023, 5, 1)
+            song.save(update_fields=["release_date"])
+        for song in (cls.songs[2], cls.songs[4], cls.songs[5]):
+            song.genres.set([dance])
+        cls.songs[3].genres.set([ballad, dance])
+
+    def setUp(self):
+        cache.clear()
+        self.facet_index = FacetIndex.build(version=1)
+
+    def song_ids(self, bits):
+        return list(self.facet_index.iter_song_ids(bits))
+
+    def test_filter(self):
+        song_ids = [song.song_id for song in self.songs]
+        self.assertEqual(self.song_ids(self.facet_index.filter()), song_ids)
+        # 같은 패싯 내에서는 OR
+        self.assertEqual(self.song_ids(self.facet_index.filter(years=[2023, 2024])), song_ids)
+        self.assertEqual(self.song_ids(self.facet_index.filter(genres=["발라드"])), [song_ids[i] for i in (0, 1, 3)])
+        # 서로 다른 패싯 간에는 AND
+        self.assertEqual(self.song_ids(self.facet_index.filter(genres=["댄스"], years=[2023])), [song_ids[2]])
+        self.assertEqual(self.facet_index.filter(genres=["없는 장르"]), 0)
+
+    def test_counts_reflect_other_facets_only(self):
+        self.assertEqual(self.facet_index.genre_counts(), {"발라드": 3, "댄스": 4})
+        self.assertEqual(self.facet_index.genre_counts(genres=["발라드"], years=[2024]), {"발라드": 1, "댄스": 3})
+        self.assertEqual(self.facet_index.year_counts(genres=["댄스"], years=[2023]), {2023: 1, 2024: 3})
+
+    def test_iter_song_ids_offset_and_limit_across_blocks(self):
+        count = SKIP_BLOCK_BITS * 3 + 100
+        facet_index = FacetIndex(1, array("q", range(count)), {}, {})
+        bits = random.Random(0).getrandbits(count)
+        expected = [position for position in range(count) if bits >> position & 1]
+
+        self.assertEqual(list(facet_index.iter_song_ids(bits)), expected)
+        for offset in (0, 5, len(expected) // 3, len(expected) // 2 + 7, len(expected) - 3, len(expected) + 10):
+            with self.subTest(offset=offset):
+                self.assertEqual(list(facet_index.iter_song_ids(bits, offset=offset, limit=10)), expected[offset:offset + 10])
+        self.assertEqual(list(facet_index.iter_song_ids(bits, offset=3, limit=0)), [])
+
+    def test_make_bitset(self):
+        positions = random.Random(0).sample(range(1000), 300)
+        expected = 0
+        for position in positions:
+            expected |= 1 << position
+        self.assertEqual(make_bitset(positions, 1000), expected)
+        self.assertEqual(make_bitset([], 0), 0)
+
+    def test_parse_years(self):
+        self.assertEqual(parse_years(["2024", "", "abc", "-1", "2023"]), [2024, 2023])
+
+
+class SongFacetsViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.songs = create_songs(15)
+        dance = Genre.objects.create(name="댄스")
+        for song in cls.songs[10:]:
+            song.genres.add(dance)
+
+    def setUp(self):
+        cache.clear()
+        # 다른 테스트에서 만든 같은 데이터 버전의 프로세스 내 색인을 사용하지 않도록 합니다.
+        patcher = mock.patch.object(facets, "_facet_index", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.url = reverse("melon:song_facets")
+
+    def test_full_page(self):
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, "melon/facet_browser.html")
+        self.assertEqual(response.context["total"], 15)
+        self.assertEqual([song.rank for song in response.context["song_list"]], list(range(1, 11)))
+        self.assertEqual(response.context["genre_counts"], [("발라드", 15), ("댄스", 5)])
+        self.assertEqual(response.context["year_counts"], [(2024, 15)])
+        self.assertIn("page=2", response.context["next_url"])
+
+    def test_filter_htmx(self):
+        response = self.client.get(self.url, {"genre": "댄스", "year": ["2024", "x"]}, headers={"HX-Request": "true"})
+        self.assertTemplateUsed(response, "melon/_facet_browser.html")
+        self.assertTemplateNotUsed(response, "melon/facet_browser.html")
+        self.assertEqual(response.context["total"], 5)
+        self.assertEqual(response.context["selected_years"], [2024])
+        self.assertIsNone(response.context["next_url"])
+
+    def test_next_page_renders_rows_only(self):
+        get_facet_index()
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"page": 2}, headers={"HX-Request": "true"})
+        self.assertTemplateUsed(response, "melon/_facet_song_list.html")
+        self.assertTemplateNotUsed(response, "melon/_facet_browser.html")
+        self.assertEqual([song.rank for song in response.context["song_list"]], list(range(11, 16)))
+        self.assertIsNone(response.context["next_url"])
+
+
+class SongSearchViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.songs = create_songs(3)
+
+    def setUp(self):
+        cache.clear()
+        get_search_index().index_songs(self.songs)
+        self.url = reverse("melon:song_search")
+
+    def test_full_page(self):
+        response = self.client.get(self.url, {"q": "노래 2"})
+        self.assertTemplateUsed(response, "melon/song_search.html")
+        self.assertEqual(response.context["song_list"], [self.songs[1]])
+
+    def test_htmx_partial(self):
+        response = self.client.get(self.url, {"q": "노래"}, headers={"HX-Request": "true"})
+        self.assertTemplateUsed(response, "melon/_song_search_results.html")
+        self.assertTemplateNotUsed(response, "melon/song_search.html")
+        self.assertCountEqual(response.context["song_list"], self.songs)
+
+    def test_no_result(self):
+        response = self.client.get(self.url, {"q": "없는검색어"}, headers={"HX-Request": "true"})
+        self.assertContains(response, "검색 결과가 없습니다.")
+
+
+class SongAdminSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.songs = create_songs(3)
+        cls.admin_user = get_user_model().objects.create_superuser(username="admin", password=None)
+
+    def setUp(self):
+        cache.clear()
+        get_search_index().index_songs(self.songs)
+        self.client.force_login(self.admin_user)
+        self.url = reverse("admin:melon_song_changelist")
+
+    def test_truncated_results_show_warning(self):
+        with mock.patch.object(SongAdmin, "search_result_limit", 2):
+            response = self.client.get(self.url, {"q": "노래"})
+        self.assertEqual(response.context["cl"].result_count, 2)
+        self.assertContains(response, "상위 2곡만 표시합니다")
+
+    def test_results_within_limit_have_no_warning(self):
+        response = self.client.get(self.url, {"q": "노래"})
+        self.assertEqual(response.context["cl"].result_count, 3)
+        self.assertNotContains(response, "곡만 표시합니다")
+
+
+class ImportMelonChartTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        chart_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(chart_dir.cleanup)
+        self.json_path = Path(chart_dir.name) / "chart.json"
+        self.json_path.write_text(json.dumps([{
+            "곡일련번호": 37946921, "순위": "1", "album_uid": 11580616, "album_name": "Band Aid",
+            "곡명": "녹아내려요", "artist_uid": 894864, "artist_name": "DAY6 (데이식스)",
+            "커버이미지_주소": "https://example.com/covers/1.jpg", "가사": "스르륵 녹아내려요",
+            "발매일": "2024-09-02", "장르": ["록/메탈"], "좋아요": 100,
+        }]), encoding="utf-8")
 
-# Create your tests here.
+    def test_imported_songs_are_indexed(self):
+        call_command("import_melon_chart", str(self.json_path), stdout=io.StringIO())
+        song = Song.objects.get(song_id=37946921)
+        self.assertEqual(get_search_index().search("녹아"), [song.pk])
+        self.assertEqual(get_search_index().search("데이식스"), [song.pk])
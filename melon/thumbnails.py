@@ -0,0 +1,105 @@
+# melon/thumbnails.py
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+CoverFetcher = Callable[[str], bytes]
+
+
+def urllib_fetcher(url: str) -> bytes:
+    """기본 커버 이미지 fetcher. settings.MELON_COVER_FETCHER로 교체할 수 있습니다."""
+    request = Request(url, headers={"User-Agent": "pyhub-htmx-examples"})
+    with urlopen(request, timeout=settings.MELON_COVER_FETCH_TIMEOUT) as response:
+        return response.read()
+
+
+def get_fetcher() -> CoverFetcher:
+    return import_string(settings.MELON_COVER_FETCHER)
+
+
+def get_url_key(url: str) -> str:
+    """원본 URL이 바뀌면 썸네일 주소도 바뀌도록, URL 해시를 썸네일 주소에 포함합니다."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+
+
+def make_thumbnail(data: bytes, size: int) -> bytes:
+    # melon.models에서 이 모듈을 임포트하므로, Pillow는 썸네일을 생성할 때에 불러옵니다.
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format="WEBP", quality=80, method=6)
+        return buffer.getvalue()
+
+
+class ThumbnailCache:
+    """썸네일을 내용 해시(sha256)로 저장하는 디스크 캐시.
+
+    - objects/ab/abcdef....webp : 썸네일 파일 (내용 해시가 곧 파일명이자 ETag)
+    - refs/<url_key>-<size> : 원본 URL에 대한 썸네일 내용 해시
+    """
+
+    def __init__(self, root: Path, size: int):
+        self.root = Path(root)
+        self.size = size
+
+    def get_ref_path(self, url_key: str) -> Path:
+        return self.root / "refs" / f"{url_key}-{self.size}"
+
+    def get_object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.webp"
+
+    def lookup(self, url_key: str) -> Optional[str]:
+        """캐싱된 썸네일의 내용 해시를 반환합니다. 없으면 None."""
+        try:
+            digest = self.get_ref_path(url_key).read_text().strip()
+        except FileNotFoundError:
+            return None
+        if not self.get_object_path(digest).exists():
+            return None
+        return digest
+
+    def get_or_create(self, url: str, fetcher: Optional[CoverFetcher] = None) -> str:
+        url_key = get_url_key(url)
+        digest = self.lookup(url_key)
+        if digest is not None:
+            return digest
+
+        fetcher = fetcher or get_fetcher()
+        thumbnail = make_thumbnail(fetcher(url), self.size)
+        digest = hashlib.sha256(thumbnail).hexdigest()
+
+        self._write(self.get_object_path(digest), thumbnail)
+        self._write(self.get_ref_path(url_key), digest.encode("ascii"))
+        return digest
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        # 동시 요청에도 반쯤 쓰인 파일이 읽히지 않도록, 임시 파일에 쓰고 교체합니다.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    return ThumbnailCache(settings.MELON_THUMBNAIL_ROOT, settings.MELON_THUMBNAIL_SIZE)
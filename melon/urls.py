@@ -5,4 +5,7 @@ app_name = 'melon'
 
 urlpatterns = [
     path('', views.song_list, name='song_list'),
+    path('search/', views.song_search, name='song_search'),
+    path('facets/', views.song_facets, name='song_facets'),
+    path('songs/<int:pk>/cover/<str:url_key>.webp', views.song_cover_thumbnail, name='song_cover_thumbnail'),
 ]
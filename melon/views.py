@@ -1,18 +1,173 @@
+import logging
+from urllib.parse import urlencode
+
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
 from django.views.generic import ListView
+
+from .cache import FragmentCache, get_data_version
+from .facets import get_facet_index, parse_years
 from .models import Song
+from .search import search_songs
+from .thumbnails import get_thumbnail_cache, get_url_key
+
+
+logger = logging.getLogger(__name__)
 
 
 class SongListView(ListView):
+    """차트 목록. 동기 뷰로서, ASGI 서버에서는 요청마다 스레드 전환 한 번으로 처리됩니다.
+
+    캐시 백엔드(파일/redis 등)가 비동기 API를 직접 지원하지 않으므로, 비동기 뷰에서는 캐시 호출마다 스레드 전환이 일어납니다.
+    조각 캐시 조회와 렌더링(ORM 조회)을 한 스레드에서 처리하는 편이 전환 횟수가 적습니다.
+    """
+
     model = Song
-    queryset = Song.objects.all()
+    # 목록 템플릿(melon/_song_list.html)에서 렌더링하는 컬럼만 조회합니다.
+    # lyrics 처럼 큰 컬럼이나 genres 관계는 목록에서 사용하지 않습니다.
+    list_fields = ("album_cover_url", "rank", "album_name", "title", "artist_name")
     paginate_by = 10
 
     template_name = 'melon/song_list.html'
+    partial_template_name = 'melon/_song_list.html'
+
+    # 차트는 import_melon_chart 명령으로만 변경되므로, HTMX 부분 응답을 데이터 버전별로 캐싱합니다.
+    fragment_cache = FragmentCache("melon:song_list")
+
+    def get_queryset(self):
+        return Song.objects.only(*self.list_fields)
+
+    def is_htmx(self) -> bool:
+        return self.request.headers.get('HX-Request') == 'true'
 
     def get_template_names(self):
-        if self.request.headers.get('HX-Request') == 'true':
-            return ['melon/_song_list.html']
+        if self.is_htmx():
+            return [self.partial_template_name]
         return [self.template_name]
 
+    def get(self, request, *args, **kwargs):
+        cursor = request.GET.get(self.page_kwarg) or "1"
+        # 캐시 키 폭증을 막기 위해, 유효한 페이지 번호 형식에 대해서만 캐싱합니다.
+        if not self.is_htmx() or not (cursor.isdigit() or cursor == "last"):
+            return super().get(request, *args, **kwargs)
+
+        version = get_data_version()
+        etag = self.fragment_cache.get_etag(cursor, version)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            self.fragment_cache.record_not_modified()
+        else:
+            content = self.fragment_cache.get(cursor, version)
+            if content is None:
+                response = super().get(request, *args, **kwargs)
+                response.render()
+                if response.status_code != 200:
+                    return response
+                content = response.content.decode(response.charset)
+                self.fragment_cache.set(cursor, version, content)
+            response = HttpResponse(content)
+
+        response["ETag"] = etag
+        # 브라우저가 캐싱하되, 매번 ETag로 재검증하도록 합니다.
+        patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ["HX-Request"])
+        return response
+
 
 song_list = SongListView.as_view()
+
+
+def song_search(request):
+    # 입력할 때마다 요청되므로(hx-trigger delay), 목록에 필요한 컬럼만 조회합니다.
+    query = request.GET.get("q", "").strip()[:100]
+    song_list = search_songs(query, limit=20, fields=SongListView.list_fields) if query else []
+
+    if request.headers.get("HX-Request") == "true":
+        template_name = "melon/_song_search_results.html"
+    else:
+        template_name = "melon/song_search.html"
+
+    return render(request, template_name, {"query": query, "song_list": song_list})
+
+
+def song_facets(request):
+    """장르/발매연도 패싯으로 차트를 탐색합니다. 필터링은 메모리 내 패싯 색인으로 처리합니다."""
+    paginate_by = 10
+
+    selected_genres = request.GET.getlist("genre")
+    selected_years = parse_years(request.GET.getlist("year"))
+    page = request.GET.get("page", "")
+    page = int(page) if page.isdigit() and int(page) > 0 else 1
+
+    facet_index = get_facet_index()
+    bits = facet_index.filter(selected_genres, selected_years)
+    total = bits.bit_count()
+
+    offset = (page - 1) * paginate_by
+    song_ids = list(facet_index.iter_song_ids(bits, offset=offset, limit=paginate_by))
+    song_list = Song.objects.filter(song_id__in=song_ids).only(*SongListView.list_fields)
+
+    next_url = None
+    if offset + paginate_by < total:
+        query = urlencode(
+            [("genre", genre) for genre in selected_genres]
+            + [("year", year) for year in selected_years]
+            + [("page", page + 1)]
+        )
+        next_url = f"{reverse('melon:song_facets')}?{query}"
+
+    context = {
+        "song_list": song_list,
+        "total": total,
+        "next_url": next_url,
+        "selected_genres": selected_genres,
+        "selected_years": selected_years,
+    }
+
+    if request.headers.get("HX-Request") == "true":
+        if page > 1:
+            return render(request, "melon/_facet_song_list.html", context)
+        template_name = "melon/_facet_browser.html"
+    else:
+        template_name = "melon/facet_browser.html"
+
+    genre_counts = facet_index.genre_counts(selected_genres, selected_years)
+    year_counts = facet_index.year_counts(selected_genres, selected_years)
+    context.update({
+        "genre_counts": sorted(genre_counts.items(), key=lambda item: (-item[1], item[0])),
+        "year_counts": sorted(year_counts.items(), reverse=True),
+    })
+    return render(request, template_name, context)
+
+
+def song_cover_thumbnail(request, pk, url_key):
+    """앨범 커버 썸네일. 주소에 원본 URL 해시가 포함되므로 immutable로 캐싱할 수 있습니다."""
+    thumbnail_cache = get_thumbnail_cache()
+
+    # 캐싱된 썸네일은 DB 조회 없이 응답합니다.
+    digest = thumbnail_cache.lookup(url_key)
+    if digest is None:
+        song = get_object_or_404(Song.objects.only("album_cover_url"), pk=pk)
+        if get_url_key(song.album_cover_url) != url_key:
+            raise Http404("커버 이미지 주소가 변경되었습니다.")
+        try:
+            digest = thumbnail_cache.get_or_create(song.album_cover_url)
+        except Exception as e:
+            # 썸네일 생성에 실패하면 원본 이미지로 대체합니다.
+            logger.warning(f"썸네일 생성 실패 : {song.album_cover_url} ({e})")
+            return HttpResponseRedirect(song.album_cover_url)
+
+    etag = quote_etag(digest)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = FileResponse(
+            open(thumbnail_cache.get_object_path(digest), "rb"),
+            content_type="image/webp",
+        )
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, max_age=60 * 60 * 24 * 365, immutable=True)
+    return response
@@ -1,7 +1,9 @@
+import logging
 import os
 
 from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "mysite.settings")
@@ -9,10 +11,29 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "mysite.settings")
 django_app = get_asgi_application()
 
 from chat.routing import websocket_urlpatterns  # noqa
+from mysite.handlers import MiddlewarePipelineHandler, StreamingPathRouter  # noqa
+from mysite.staticfiles import ImmutableStaticFilesApp  # noqa
+from mysite.template_loaders import warm_template_cache  # noqa
+
+if settings.TEMPLATE_WARMUP:
+    # 첫 요청들이 템플릿(cotton) 컴파일 비용을 부담하지 않도록, 모든 템플릿을 미리 컴파일합니다.
+    compiled_count, _ = warm_template_cache()
+    logging.getLogger(__name__).info(f"템플릿 {compiled_count}개를 미리 컴파일했습니다.")
+
+if settings.MIDDLEWARE_TIMING:
+    django_app = MiddlewarePipelineHandler(timing=True)
+
+# 스트리밍 URL은 최소 미들웨어 구성으로 처리하여, 응답이 버퍼링되지 않고 요청마다의 스레드 전환도 줄입니다.
+streaming_app = MiddlewarePipelineHandler(settings.STREAMING_MIDDLEWARE, timing=settings.MIDDLEWARE_TIMING)
+http_app = StreamingPathRouter(django_app, streaming_app)
+
+if not settings.DEBUG:
+    # collectstatic으로 생성한 해시 파일명의 정적 파일을 Django를 거치지 않고 응답합니다.
+    http_app = ImmutableStaticFilesApp(http_app)
 
 application = ProtocolTypeRouter(
     {
-        "http": django_app,
+        "http": http_app,
         "websocket": AuthMiddlewareStack(URLRouter(websocket_urlpatterns)),
     }
 )
@@ -0,0 +1,42 @@
+# mysite/async_views.py
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest
+from django.shortcuts import render
+from django.utils.cache import add_never_cache_headers
+
+
+async def aload_user(request: HttpRequest):
+    """request.user를 비동기로 조회하여 교체합니다.
+
+    request.user는 처음 접근할 때 세션/사용자를 동기 방식으로 조회하는 지연 객체이므로,
+    템플릿(base.html의 user.is_authenticated 등)에서 처음 평가되면 비동기 뷰에서 SynchronousOnlyOperation이 발생합니다.
+    """
+    user = await request.auser()
+    request.user = user
+    return user
+
+
+def async_form_view(view_class, **initkwargs):
+    """폼 표시(GET)는 이벤트 루프에서 바로 렌더링하고, 폼 제출은 기존 동기 뷰에서 처리하는 뷰를 생성합니다.
+
+    폼 제출은 비밀번호 해싱처럼 CPU를 오래 사용하는 작업을 포함하므로, 이벤트 루프를 막지 않도록 스레드에서 처리합니다.
+    TemplateResponse는 응답 후 렌더링을 위해 다시 스레드로 전환되므로, 폼 표시는 render()로 바로 렌더링합니다.
+    """
+    sync_view = sync_to_async(view_class.as_view(**initkwargs))
+
+    async def view(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return await sync_view(request, *args, **kwargs)
+
+        await aload_user(request)
+        self = view_class(**initkwargs)
+        self.setup(request, *args, **kwargs)
+        self.object = None  # CreateView
+        response = render(request, self.get_template_names(), self.get_context_data())
+        add_never_cache_headers(response)
+        return response
+
+    view.view_class = view_class
+    view.view_initkwargs = initkwargs
+    return view
@@ -0,0 +1,12 @@
+# mysite/benchmarks.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+def warn_if_debug(command: BaseCommand, reason: str = "results include debug instrumentation") -> None:
+    """DEBUG=True 상태에서 벤치마크를 실행하면, 운영 환경과 결과가 다르다는 경고를 출력합니다."""
+    if settings.DEBUG:
+        command.stdout.write(command.style.WARNING(
+            f"DEBUG is on : {reason}. Run with DEBUG=False to compare against production."
+        ))
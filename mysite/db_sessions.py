@@ -0,0 +1,43 @@
+# mysite/db_sessions.py
+
+import functools
+
+from django.contrib.sessions.backends.base import CreateError, UpdateError
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.db import DatabaseError, IntegrityError, router
+
+from mysite.db_writer import arun_write
+
+
+class SessionStore(DBStore):
+    """django.contrib.sessions.backends.db 세션 엔진과 같지만, 비동기 코드의 세션 저장/삭제를 arun_write로 처리합니다.
+
+    SQLITE_WRITE_QUEUE 설정 시에는 채팅 뷰처럼 비동기 뷰에서 저장하는 세션도 DB 쓰기 스레드에서 순서대로 저장됩니다.
+    세션 읽기와 동기 코드(SessionMiddleware 등)의 저장은 기본 엔진과 같습니다.
+    """
+
+    async def asave(self, must_create=False):
+        if self.session_key is None:
+            return await self.acreate()
+        data = await self._aget_session(no_load=must_create)
+        obj = await self.acreate_model_instance(data)
+        using = router.db_for_write(self.model, instance=obj)
+        save = functools.partial(obj.save, force_insert=must_create, force_update=not must_create, using=using)
+        try:
+            await arun_write(save, using=using)
+        except IntegrityError:
+            if must_create:
+                raise CreateError
+            raise
+        except DatabaseError:
+            if not must_create:
+                raise UpdateError
+            raise
+
+    async def adelete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        using = router.db_for_write(self.model)
+        await arun_write(self.model.objects.using(using).filter(session_key=session_key).delete, using=using)
@@ -0,0 +1,65 @@
+# mysite/db_writer.py
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+T = TypeVar("T")
+
+THREAD_NAME_PREFIX = "db-writer"
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(using: str = DEFAULT_DB_ALIAS) -> ThreadPoolExecutor:
+    # 데이터베이스별로 하나의 쓰기 스레드를 사용합니다. 스레드의 DB 연결은 계속 재사용됩니다.
+    with _executors_lock:
+        if using not in _executors:
+            _executors[using] = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{THREAD_NAME_PREFIX}-{using}")
+        return _executors[using]
+
+
+def is_writer_thread() -> bool:
+    return threading.current_thread().name.startswith(THREAD_NAME_PREFIX)
+
+
+def _run_in_transaction(func: Callable[..., T], using: str, args, kwargs) -> T:
+    try:
+        with transaction.atomic(using=using):
+            return func(*args, **kwargs)
+    except Exception:
+        # 연결에 문제가 생긴 경우를 대비하여, 다음 쓰기에서 새 연결을 사용합니다.
+        connections[using].close_if_unusable_or_obsolete()
+        raise
+
+
+def submit_write(func: Callable[..., T], *args, using: str = DEFAULT_DB_ALIAS, **kwargs) -> "Future[T]":
+    """쓰기 함수를 쓰기 스레드에 등록합니다. 함수는 하나의 트랜잭션 안에서 실행됩니다."""
+    return get_executor(using).submit(_run_in_transaction, func, using, args, kwargs)
+
+
+def run_write(func: Callable[..., T], *args, using: str = DEFAULT_DB_ALIAS, **kwargs) -> T:
+    """동기 코드에서 쓰기 함수를 실행하고 결과를 반환합니다.
+
+    SQLITE_WRITE_QUEUE 설정이 꺼져 있으면, 현재 스레드에서 바로 실행합니다.
+    """
+    if not settings.SQLITE_WRITE_QUEUE or is_writer_thread():
+        return _run_in_transaction(func, using, args, kwargs)
+    return submit_write(func, *args, using=using, **kwargs).result()
+
+
+async def arun_write(func: Callable[..., T], *args, using: str = DEFAULT_DB_ALIAS, **kwargs) -> T:
+    """비동기 코드에서 쓰기 함수를 실행합니다.
+
+    SQLite는 한 번에 하나의 쓰기만 가능하므로, 요청마다 다른 스레드에서 쓰기를 시도하여 잠금을 경합하는 대신
+    하나의 쓰기 스레드에서 순서대로 처리합니다.
+    """
+    if not settings.SQLITE_WRITE_QUEUE:
+        return await sync_to_async(_run_in_transaction)(func, using, args, kwargs)
+    return await asyncio.wrap_future(submit_write(func, *args, using=using, **kwargs))
@@ -0,0 +1,225 @@
+# mysite/handlers.py
+
+import logging
+import time
+from typing import Dict, List, Optional, Sequence
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.exception import convert_exception_to_response
+from django.http import HttpRequest, HttpResponse
+from django.urls import NoReverseMatch, reverse
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+VIEW_LAYER_NAME = "view"
+
+TIMING_MIDDLEWARE = "mysite.handlers.MiddlewareTimingMiddleware"
+
+
+class MiddlewareTimer:
+    """미들웨어 체인의 각 단계에서 걸린 시간을 요청에 기록합니다.
+
+    각 미들웨어 앞에 MiddlewareTimingMiddleware를 끼워 넣어, 그 안쪽 단계 전체의 소요 시간을 측정합니다.
+    각 단계의 시간에는 안쪽 단계가 포함되므로, 바로 안쪽 단계의 시간을 빼서 미들웨어 자체의 비용을 계산합니다.
+    스트리밍 응답은 응답 객체가 반환될 때까지만 측정하며, 본문은 건드리지 않습니다.
+    """
+
+    def __init__(self, names: List[str]):
+        # 바깥쪽 미들웨어부터 순서대로, 마지막은 URL 해석과 뷰 실행
+        self.names = names
+
+    @staticmethod
+    def enter(request: HttpRequest) -> int:
+        """체인은 바깥쪽부터 한 단계씩 호출되므로, 호출된 순서가 단계의 순서입니다."""
+        if not hasattr(request, "middleware_timings"):
+            request.middleware_timings = {}
+            request.middleware_depth = 0
+        index = request.middleware_depth
+        request.middleware_depth += 1
+        return index
+
+    @staticmethod
+    def record(request: HttpRequest, index: int, elapsed: float) -> None:
+        request.middleware_timings[index] = elapsed
+
+    def get_durations(self, request: HttpRequest) -> Dict[str, float]:
+        """단계 이름 -> 자체 소요 시간(초). 중간에 응답한 경우 실행되지 않은 안쪽 단계는 0입니다."""
+        timings = getattr(request, "middleware_timings", {})
+        return {
+            name: max(timings.get(index, 0) - timings.get(index + 1, 0), 0)
+            for index, name in enumerate(self.names)
+        }
+
+    def finish(self, request: HttpRequest, index: int, response: HttpResponse) -> HttpResponse:
+        if index == 0:
+            durations = self.get_durations(request)
+            response["Server-Timing"] = ", ".join(
+                f"{name};dur={elapsed * 1000:.3f}" for name, elapsed in durations.items()
+            )
+        return response
+
+
+class MiddlewareTimingMiddleware:
+    """안쪽 단계의 소요 시간을 request.middleware_timer에 기록하는 미들웨어.
+
+    안쪽 단계와 같은 방식(동기/비동기)으로 동작하므로, 끼워 넣어도 스레드 전환이 늘지 않습니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.is_async:
+            return self.__acall__(request)
+        timer: Optional[MiddlewareTimer] = getattr(request, "middleware_timer", None)
+        if timer is None:
+            return self.get_response(request)
+        index = timer.enter(request)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            timer.record(request, index, time.perf_counter() - started)
+        return timer.finish(request, index, response)
+
+    async def __acall__(self, request: HttpRequest):
+        timer: Optional[MiddlewareTimer] = getattr(request, "middleware_timer", None)
+        if timer is None:
+            return await self.get_response(request)
+        index = timer.enter(request)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            timer.record(request, index, time.perf_counter() - started)
+        return timer.finish(request, index, response)
+
+
+class MiddlewarePipelineHandler(ASGIHandler):
+    """지정한 미들웨어 목록으로 요청을 처리하는 ASGI 핸들러.
+
+    - middleware를 지정하지 않으면 settings.MIDDLEWARE를 사용합니다.
+    - timing=True이면 미들웨어별 소요 시간을 Server-Timing 응답 헤더로 알려줍니다.
+      (브라우저 개발자 도구의 Network > Timing 탭에서 확인할 수 있습니다.)
+    """
+
+    def __init__(self, middleware: Optional[Sequence[str]] = None, timing: bool = False):
+        self.middleware = list(settings.MIDDLEWARE if middleware is None else middleware)
+        self.timer: Optional[MiddlewareTimer] = None
+        if timing:
+            names = [path.rsplit(".", 1)[-1] for path in self.middleware]
+            self.timer = MiddlewareTimer(names + [VIEW_LAYER_NAME])
+        super().__init__()
+
+    def get_middleware_setting(self) -> List[str]:
+        if not self.timer:
+            return self.middleware
+        # 각 미들웨어와 뷰 앞에 타이밍 미들웨어를 둡니다.
+        middleware = []
+        for path in self.middleware:
+            middleware += [TIMING_MIDDLEWARE, path]
+        return middleware + [TIMING_MIDDLEWARE]
+
+    def load_middleware(self, is_async=False):
+        """get_middleware_setting()의 목록으로 미들웨어 체인을 구성합니다.
+
+        Django 5.1 BaseHandler.load_middleware와 같은 방식이며, settings.MIDDLEWARE 대신 주어진 목록을 읽습니다.
+        전역 설정을 바꾸지 않으므로, 다른 핸들러와 동시에 초기화되어도 안전합니다.
+        """
+        self._view_middleware = []
+        self._template_response_middleware = []
+        self._exception_middleware = []
+
+        get_response = self._get_response_async if is_async else self._get_response
+        handler = convert_exception_to_response(get_response)
+        handler_is_async = is_async
+        for middleware_path in reversed(self.get_middleware_setting()):
+            middleware = import_string(middleware_path)
+            middleware_can_sync = getattr(middleware, "sync_capable", True)
+            middleware_can_async = getattr(middleware, "async_capable", False)
+            if not middleware_can_sync and not middleware_can_async:
+                raise RuntimeError(
+                    f"Middleware {middleware_path} must have at least one of sync_capable/async_capable set to True."
+                )
+            elif not handler_is_async and middleware_can_sync:
+                middleware_is_async = False
+            else:
+                middleware_is_async = middleware_can_async
+            try:
+                adapted_handler = self.adapt_method_mode(
+                    middleware_is_async,
+                    handler,
+                    handler_is_async,
+                    debug=settings.DEBUG,
+                    name=f"middleware {middleware_path}",
+                )
+                mw_instance = middleware(adapted_handler)
+            except MiddlewareNotUsed:
+                continue
+            else:
+                handler = adapted_handler
+
+            if mw_instance is None:
+                raise ImproperlyConfigured(f"Middleware factory {middleware_path} returned None.")
+
+            if hasattr(mw_instance, "process_view"):
+                self._view_middleware.insert(0, self.adapt_method_mode(is_async, mw_instance.process_view))
+            if hasattr(mw_instance, "process_template_response"):
+                self._template_response_middleware.append(
+                    self.adapt_method_mode(is_async, mw_instance.process_template_response)
+                )
+            if hasattr(mw_instance, "process_exception"):
+                # 예외 처리 단계는 Django와 마찬가지로 항상 동기 방식입니다.
+                self._exception_middleware.append(self.adapt_method_mode(False, mw_instance.process_exception))
+
+            handler = convert_exception_to_response(mw_instance)
+            handler_is_async = middleware_is_async
+
+        handler = self.adapt_method_mode(is_async, handler, handler_is_async)
+        self._middleware_chain = handler
+
+    async def get_response_async(self, request: HttpRequest) -> HttpResponse:
+        if self.timer:
+            request.middleware_timer = self.timer
+        return await super().get_response_async(request)
+
+
+def get_streaming_paths() -> List[str]:
+    paths = []
+    for url_name in settings.STREAMING_URL_NAMES:
+        try:
+            paths.append(reverse(url_name))
+        except NoReverseMatch:
+            logger.warning(f"스트리밍 URL {url_name} 을 찾을 수 없습니다.")
+    return paths
+
+
+class StreamingPathRouter:
+    """스트리밍 응답을 하는 URL의 요청은 streaming_app(최소 미들웨어 구성)으로, 그 외는 application으로 전달합니다."""
+
+    def __init__(self, application, streaming_app, paths: Optional[Sequence[str]] = None):
+        self.application = application
+        self.streaming_app = streaming_app
+        self.paths = frozenset(get_streaming_paths() if paths is None else paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            root_path = scope.get("root_path", "")
+            if root_path and path.startswith(root_path):
+                path = path[len(root_path):]
+            if path in self.paths:
+                await self.streaming_app(scope, receive, send)
+                return
+        await self.application(scope, receive, send)
@@ -0,0 +1,236 @@
+# mysite/sessions.py
+
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import CreateError
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.core.cache import caches
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from mysite.db_writer import arun_write, run_write
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "mysite.sessions"
+
+
+class WriteBehindQueue:
+    """세션의 DB 저장을 모아서 백그라운드 스레드에서 처리합니다.
+
+    - 같은 세션을 여러 번 저장하면 마지막 내용만 남으므로, 저장 주기(SESSION_WRITE_BEHIND_DELAY) 안의
+      저장들은 한 번의 DB 쓰기로 합쳐집니다.
+    - 주기마다 대기 중인 모든 세션을 하나의 트랜잭션에서 upsert 합니다.
+    - 프로세스 종료 시에 남은 세션을 저장합니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # flush 중인 세션이 삭제(로그아웃)된 세션을 다시 저장하지 않도록, flush와 삭제를 직렬화합니다.
+        self.flush_lock = threading.Lock()
+        self.pending: Dict[str, Tuple[str, datetime]] = {}
+        self.thread: Optional[threading.Thread] = None
+
+    def put(self, session_key: str, session_data: str, expire_date: datetime) -> None:
+        with self.lock:
+            self.pending[session_key] = (session_data, expire_date)
+            if self.thread is None or not self.thread.is_alive():
+                self.start()
+
+    def get(self, session_key: str) -> Optional[str]:
+        with self.lock:
+            item = self.pending.get(session_key)
+        if item is None or item[1] <= timezone.now():
+            return None
+        return item[0]
+
+    def __contains__(self, session_key: str) -> bool:
+        return self.get(session_key) is not None
+
+    def delete(self, session_key: str) -> None:
+        """대기 중인 저장을 취소하고 DB에서 삭제합니다."""
+        with self.flush_lock:
+            with self.lock:
+                self.pending.pop(session_key, None)
+            DBStore.get_model_class().objects.filter(session_key=session_key).delete()
+
+    def start(self) -> None:
+        if self.thread is None:
+            atexit.register(self.flush_at_exit)
+        self.thread = threading.Thread(target=self.run, name="session-write-behind", daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        while True:
+            time.sleep(settings.SESSION_WRITE_BEHIND_DELAY)
+            try:
+                # SQLITE_WRITE_QUEUE 설정 시에는 DB 쓰기 스레드에서 저장합니다.
+                run_write(self.flush)
+            except Exception:
+                logger.exception("세션 저장에 실패했습니다. 다음 주기에 다시 시도합니다.")
+            finally:
+                # 이 스레드의 DB 연결을 정리합니다.
+                connection.close()
+
+    def flush(self) -> int:
+        """대기 중인 세션을 DB에 저장하고, 저장한 세션 수를 반환합니다."""
+        with self.flush_lock:
+            with self.lock:
+                pending, self.pending = self.pending, {}
+            if not pending:
+                return 0
+
+            Session = DBStore.get_model_class()
+            sessions = [
+                Session(session_key=session_key, session_data=session_data, expire_date=expire_date)
+                for session_key, (session_data, expire_date) in pending.items()
+            ]
+            try:
+                with transaction.atomic():
+                    Session.objects.bulk_create(
+                        sessions,
+                        update_conflicts=True,
+                        unique_fields=["session_key"],
+                        update_fields=["session_data", "expire_date"],
+                    )
+            except DatabaseError:
+                # 그 사이에 다시 저장된 세션은 최신 내용을 유지합니다.
+                with self.lock:
+                    for session_key, item in pending.items():
+                        self.pending.setdefault(session_key, item)
+                raise
+            return len(sessions)
+
+    def flush_at_exit(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("프로세스 종료 시의 세션 저장에 실패했습니다.")
+
+
+write_behind = WriteBehindQueue()
+
+
+class SessionStore(DBStore):
+    """캐시를 기본 저장소로 사용하고, DB에는 모아서 나중에 저장하는 세션 엔진.
+
+    - 저장 : 서명/압축된 세션 문자열(encode 결과)을 캐시에 바로 저장하고, DB 저장은 write_behind에 맡깁니다.
+    - 조회 : 캐시 → 아직 DB에 저장되지 않은 세션 → DB 순으로 조회합니다.
+    - 삭제 : 캐시, 대기 중인 저장, DB에서 모두 바로 삭제합니다.
+
+    캐시가 프로세스 간에 공유되지 않으면(locmem), 다른 프로세스에서는 DB에 저장된 이후에 조회됩니다.
+    멀티 프로세스로 운영할 때에는 CACHE_URL로 공유 캐시를 지정합니다.
+    """
+
+    cache_key_prefix = KEY_PREFIX
+
+    def __init__(self, session_key=None):
+        self._cache = caches[settings.SESSION_CACHE_ALIAS]
+        super().__init__(session_key)
+
+    def get_cache_key(self, session_key: str) -> str:
+        return self.cache_key_prefix + session_key
+
+    def load(self):
+        if not self.session_key:
+            return {}
+        try:
+            session_data = self._cache.get(self.get_cache_key(self.session_key))
+        except Exception:
+            # memcached 등은 잘못된 키에서 예외를 발생시킵니다. 이 경우 세션을 초기화합니다.
+            session_data = None
+        if session_data is None:
+            session_data = write_behind.get(self.session_key)
+
+        if session_data is None:
+            s = self._get_session_from_db()
+            if s is None:
+                return {}
+            session_data = s.session_data
+            self._cache.set(
+                self.get_cache_key(self.session_key), session_data, self.get_expiry_age(expiry=s.expire_date)
+            )
+        return self.decode(session_data)
+
+    async def aload(self):
+        if not self.session_key:
+            return {}
+        try:
+            session_data = await self._cache.aget(self.get_cache_key(self.session_key))
+        except Exception:
+            session_data = None
+        if session_data is None:
+            session_data = write_behind.get(self.session_key)
+
+        if session_data is None:
+            s = await self._aget_session_from_db()
+            if s is None:
+                return {}
+            session_data = s.session_data
+            await self._cache.aset(
+                self.get_cache_key(self.session_key),
+                session_data,
+                await self.aget_expiry_age(expiry=s.expire_date),
+            )
+        return self.decode(session_data)
+
+    def exists(self, session_key):
+        return bool(session_key) and (
+            self.get_cache_key(session_key) in self._cache
+            or session_key in write_behind
+            or super().exists(session_key)
+        )
+
+    async def aexists(self, session_key):
+        return bool(session_key) and (
+            await self._cache.ahas_key(self.get_cache_key(session_key))
+            or session_key in write_behind
+            or await super().aexists(session_key)
+        )
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        session_data = self.encode(self._get_session(no_load=must_create))
+        cache_key = self.get_cache_key(self.session_key)
+        if must_create:
+            # 새 세션키는 exists()로 확인한 키이지만, 동시에 같은 키가 생성되는 경우를 막습니다.
+            if not self._cache.add(cache_key, session_data, self.get_expiry_age()):
+                raise CreateError
+        else:
+            self._cache.set(cache_key, session_data, self.get_expiry_age())
+        write_behind.put(self.session_key, session_data, self.get_expiry_date())
+
+    async def asave(self, must_create=False):
+        if self.session_key is None:
+            return await self.acreate()
+        session_data = self.encode(await self._aget_session(no_load=must_create))
+        cache_key = self.get_cache_key(self.session_key)
+        if must_create:
+            if not await self._cache.aadd(cache_key, session_data, await self.aget_expiry_age()):
+                raise CreateError
+        else:
+            await self._cache.aset(cache_key, session_data, await self.aget_expiry_age())
+        write_behind.put(self.session_key, session_data, await self.aget_expiry_date())
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        self._cache.delete(self.get_cache_key(session_key))
+        write_behind.delete(session_key)
+
+    async def adelete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        await self._cache.adelete(self.get_cache_key(session_key))
+        await arun_write(write_behind.delete, session_key)
@@ -52,7 +52,8 @@ INSTALLED_APPS = [
     "crispy_forms",
     # "crispy_bootstrap5",
     "crispy_tailwind",
-    "django_cotton",
+    # 템플릿 로더를 TEMPLATES에서 직접 구성하므로, cotton의 자동 로더 설정은 사용하지 않습니다.
+    "django_cotton.apps.SimpleAppConfig",
     "accounts",
     "app",
     "blog",
@@ -81,6 +82,25 @@ if "debug_toolbar" in INSTALLED_APPS:
         "debug_toolbar.middleware.DebugToolbarMiddleware",
     ]
 
+# 스트리밍(SSE) 응답을 하는 URL은 아래 최소 미들웨어로만 처리합니다. (mysite.handlers.StreamingPathRouter)
+# 세션/인증/CSRF만 필요하며, MIDDLEWARE에서 다음 미들웨어는 제외합니다.
+#  - CorsMiddleware : 같은 origin의 htmx 요청만 받으므로 CORS 헤더가 필요 없습니다. (다른 origin에서는 응답을 읽을 수 없게 되어 더 엄격합니다.)
+#  - CommonMiddleware : 라우터가 슬래시까지 정확히 일치하는 경로만 전달하므로 APPEND_SLASH 리다이렉트가 일어나지 않습니다.
+#  - MessageMiddleware : 스트리밍 뷰는 django.contrib.messages를 사용하지 않습니다.
+#  - XFrameOptionsMiddleware : 응답은 htmx가 페이지에 넣는 조각이며, 조각을 담는 페이지는 기본 구성으로 X-Frame-Options가 적용됩니다.
+#  - DebugToolbarMiddleware : 응답 본문을 버퍼링하여 스트리밍을 막습니다.
+STREAMING_URL_NAMES = ["chat:chat-llm", "chat:chat-english-tutor", "chat:chat-multi"]
+
+STREAMING_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+]
+
+# 활성화하면 응답의 Server-Timing 헤더로 미들웨어별 소요 시간을 알려줍니다.
+MIDDLEWARE_TIMING = env.bool("MIDDLEWARE_TIMING", default=False)
+
 ROOT_URLCONF = "mysite.urls"
 
 TEMPLATES = [
@@ -89,8 +109,19 @@ TEMPLATES = [
         "DIRS": [
             BASE_DIR / "templates",
         ],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # 모든 환경에서 컴파일된 템플릿을 캐싱합니다. (DEBUG에서는 runserver가 템플릿 변경 시에 캐시를 비웁니다.)
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "mysite.template_loaders.CottonLoader",
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+            "builtins": ["django_cotton.templatetags.cotton"],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -99,11 +130,16 @@ TEMPLATES = [
             ],
             "libraries": {
                 "uncached_static": "templatetags.uncached_static",
+                "frontend": "templatetags.frontend",
+                "component_assets": "templatetags.component_assets",
             },
         },
     },
 ]
 
+# 서버 시작 시에 모든 템플릿을 미리 컴파일할 지 여부 (mysite/asgi.py)
+TEMPLATE_WARMUP = env.bool("TEMPLATE_WARMUP", default=not DEBUG)
+
 WSGI_APPLICATION = "mysite.wsgi.application"
 ASGI_APPLICATION = "mysite.asgi.application"
 
@@ -115,6 +151,54 @@ DATABASES = {
     "default": env.db("DATABASE_URL", default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
 }
 
+# 운영 환경용 SQLite 설정. 동시 요청에서 "database is locked" 오류를 줄입니다.
+SQLITE_TUNED_OPTIONS = {
+    # 쓰기 트랜잭션은 시작할 때 쓰기 잠금을 획득합니다. (읽기 후 쓰기로 전환할 때 잠금 대기 없이 실패하는 것을 방지)
+    "transaction_mode": "IMMEDIATE",
+    # 잠금 대기 시간(초). busy_timeout으로 설정됩니다.
+    "timeout": 20,
+    # 새 연결마다 실행됩니다.
+    "init_command": ";".join(
+        [
+            "PRAGMA journal_mode=WAL",  # 쓰기 중에도 읽기가 가능
+            "PRAGMA synchronous=NORMAL",  # WAL에서는 커밋마다 fsync 하지 않아도 DB가 손상되지 않습니다.
+            "PRAGMA mmap_size=134217728",  # 128MB
+            "PRAGMA cache_size=-20000",  # 20MB
+            "PRAGMA temp_store=MEMORY",
+        ]
+    ),
+}
+
+SQLITE_TUNING = env.bool("SQLITE_TUNING", default=False)
+if SQLITE_TUNING and DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    DATABASES["default"].setdefault("OPTIONS", {}).update(SQLITE_TUNED_OPTIONS)
+
+# 비동기 코드의 DB 쓰기를 하나의 전용 스레드에서 순서대로 처리합니다. (mysite/db_writer.py)
+# 대상 : 비동기 코드의 세션 저장/삭제 (mysite.db_sessions, mysite.sessions 세션 엔진)
+SQLITE_WRITE_QUEUE = env.bool("SQLITE_WRITE_QUEUE", default=SQLITE_TUNING)
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# 차트 데이터 버전, 블로그 조회 캐시의 무효화 등은 관리 명령(다른 프로세스)에서도 일어나므로,
+# 기본값은 프로세스 간에 공유되는 파일 캐시입니다. 운영 환경에서는 redis/memcached 등을 CACHE_URL로 지정합니다.
+# (locmemcache:// 는 프로세스마다 따로 저장하므로, 관리 명령의 무효화가 서버에 전달되지 않습니다.)
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default=f"filecache://{BASE_DIR / 'var' / 'cache'}?max_entries=10000"),
+}
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.1/topics/http/sessions/
+# "mysite.sessions" : 캐시를 기본 저장소로 사용하고, DB에는 모아서 나중에 저장하는 세션 엔진
+# (채팅처럼 요청마다 세션을 저장하는 경우, 매번 SQLite에 쓰지 않습니다.)
+# "mysite.db_sessions" : 기본 DB 세션 엔진과 같고, 비동기 코드의 세션 저장만 SQLITE_WRITE_QUEUE 쓰기 스레드에서 처리
+
+SESSION_ENGINE = env.str("SESSION_ENGINE", default="django.contrib.sessions.backends.db")
+# mysite.sessions 엔진에서 세션을 DB에 저장하는 주기(초). 이 시간 안의 저장은 한 번으로 합쳐집니다.
+SESSION_WRITE_BEHIND_DELAY = env.float("SESSION_WRITE_BEHIND_DELAY", default=2.0)
+
 
 # Channel Layer
 # https://channels.readthedocs.io/en/latest/topics/channel_layers.html
@@ -178,6 +262,28 @@ STATIC_URL = env.str("STATIC_URL", default="static/")
 STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
+STATIC_ROOT = Path(env.str("STATIC_ROOT", default=str(BASE_DIR / "var" / "static")))
+
+# 운영 환경에서는 collectstatic 시에 내용 해시 파일명과 .gz/.br 파일을 생성하고,
+# mysite.asgi에서 immutable 캐시 헤더로 응답합니다.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.StaticFilesStorage"
+            if DEBUG
+            else "mysite.staticfiles.CompressedManifestStaticFilesStorage"
+        ),
+    },
+}
+
+# vendor_frontend 명령이 내려받은 파일(고정 버전의 JS, Tailwind CLI)을 보관하는 디렉토리.
+# 한 번 받은 뒤에는 --offline 옵션으로 네트워크 없이 번들을 다시 생성할 수 있습니다.
+FRONTEND_VENDOR_CACHE_DIR = Path(env.str("FRONTEND_VENDOR_CACHE_DIR", default=str(BASE_DIR / "var" / "frontend")))
+# Tailwind standalone CLI 경로. 지정하지 않으면 PATH에서 찾고, 없으면 고정 버전을 내려받습니다.
+TAILWIND_CLI = env.str("TAILWIND_CLI", default="")
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
@@ -191,6 +297,18 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 NCP_MAP_CLIENT_ID = env.str("NCP_MAP_CLIENT_ID", default="")
 
 
+# melon
+
+# 앨범 커버 썸네일 : 원본 이미지를 한 번만 받아와서, 고정 크기 WebP로 디스크에 캐싱합니다.
+MELON_COVER_FETCHER = env.str("MELON_COVER_FETCHER", default="melon.thumbnails.urllib_fetcher")
+MELON_COVER_FETCH_TIMEOUT = env.int("MELON_COVER_FETCH_TIMEOUT", default=10)
+MELON_THUMBNAIL_ROOT = Path(
+    env.str("MELON_THUMBNAIL_ROOT", default=str(BASE_DIR / "var" / "melon" / "thumbnails"))
+)
+# 목록에서 100px로 표시하므로, 고해상도 화면을 고려하여 2배 크기로 생성
+MELON_THUMBNAIL_SIZE = env.int("MELON_THUMBNAIL_SIZE", default=200)
+
+
 # LLM
 
 OPENAI_API_KEY = env.str("OPENAI_API_KEY", default="")
@@ -212,6 +330,13 @@ from urllib.parse import urlparse
 FRONT_HOST_WITH_SCHEME = env.str("FRONT_HOST", default="http://localhost:3000")
 FRONT_HOST = urlparse(FRONT_HOST_WITH_SCHEME).netloc
 
+# 인증 상태 조회(accounts:auth_status)에서 DB 조회 없이 사용하는 서명된 인증 힌트 쿠키
+AUTH_HINT_COOKIE_NAME = env.str("AUTH_HINT_COOKIE_NAME", default="auth_hint")
+# 힌트의 유효 시간(초). 사용자 삭제/비활성화 등은 최대 이 시간만큼 늦게 반영됩니다.
+AUTH_HINT_MAX_AGE = env.int("AUTH_HINT_MAX_AGE", default=60 * 5)
+# 인증 상태 응답의 브라우저 캐시 시간(초). 이후에는 ETag로 재검증합니다.
+AUTH_STATUS_MAX_AGE = env.int("AUTH_STATUS_MAX_AGE", default=10)
+
 
 # fetch 요청을 허용할 출처(origin) 목록
 CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[FRONT_HOST_WITH_SCHEME])
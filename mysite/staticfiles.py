@@ -0,0 +1,169 @@
+# mysite/staticfiles.py
+
+import gzip
+import json
+import logging
+import mimetypes
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import brotli
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.utils.http import parse_etags, quote_etag
+
+logger = logging.getLogger(__name__)
+
+
+# 압축 효과가 있는 텍스트 계열 파일만 미리 압축합니다.
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".html", ".xml"}
+
+# 압축 방식 : (Content-Encoding, 파일 확장자). 선호 순서대로 나열합니다.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE_CONTROL = b"public, max-age=31536000, immutable"
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """collectstatic 시에 내용 해시가 붙은 파일명(app.3f2a1b.js)과 함께 .gz, .br 파일을 생성합니다.
+
+    manifest(staticfiles.json)는 프로세스 시작 후 한 번만 읽으므로, {% static %} 태그는 dict 조회로 처리됩니다.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+
+        for name in self.hashed_files.values():
+            if Path(name).suffix in COMPRESSIBLE_EXTENSIONS:
+                self.compress(name)
+
+    def compress(self, name: str) -> None:
+        with self.open(name) as f:
+            content = f.read()
+
+        compressed_files = {
+            ".gz": gzip.compress(content, compresslevel=9, mtime=0),
+            ".br": brotli.compress(content, quality=11),
+        }
+        for suffix, compressed in compressed_files.items():
+            # 압축해도 작아지지 않으면 원본을 그대로 응답합니다.
+            if len(compressed) >= len(content):
+                continue
+            compressed_name = name + suffix
+            if self.exists(compressed_name):
+                self.delete(compressed_name)
+            self._save(compressed_name, ContentFile(compressed))
+
+
+@dataclass
+class StaticFileVariant:
+    # 압축 방식마다 응답 본문이 다르므로, ETag에 압축 방식을 붙여 구분합니다. ("app.3f2a1b.js-br")
+    etag: bytes
+    body: bytes
+
+
+@dataclass
+class StaticFile:
+    content_type: bytes
+    # Content-Encoding ("identity", "br", "gzip") -> 파일 내용
+    variants: Dict[str, StaticFileVariant] = field(default_factory=dict)
+
+
+class ImmutableStaticFilesApp:
+    """collectstatic 결과 중 해시가 붙은 파일을 응답하는 ASGI 앱.
+
+    - 시작 시에 manifest를 읽어 모든 파일(과 .br/.gz)을 메모리에 올리므로, 요청마다 파일 시스템을 조회하지 않습니다.
+    - 파일명에 내용 해시가 포함되므로 1년간 immutable로 캐싱하도록 응답합니다.
+    - 그 외 경로는 감싼 앱(Django)으로 전달합니다.
+    """
+
+    def __init__(self, application, static_root: Optional[Path] = None, static_url: Optional[str] = None):
+        self.application = application
+        self.static_root = Path(static_root or settings.STATIC_ROOT)
+        self.static_url = "/" + (static_url or settings.STATIC_URL).strip("/") + "/"
+        self.files: Dict[str, StaticFile] = self.load_files()
+
+    def load_files(self) -> Dict[str, StaticFile]:
+        manifest_path = self.static_root / ManifestStaticFilesStorage.manifest_name
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except FileNotFoundError:
+            logger.warning(f"{manifest_path} 파일이 없습니다. collectstatic 명령을 먼저 실행해주세요.")
+            return {}
+
+        files = {}
+        for hashed_name in manifest.get("paths", {}).values():
+            path = self.static_root / hashed_name
+            content_type, _ = mimetypes.guess_type(hashed_name)
+            static_file = StaticFile(content_type=(content_type or "application/octet-stream").encode("ascii"))
+            static_file.variants["identity"] = StaticFileVariant(
+                etag=quote_etag(hashed_name).encode("utf-8"), body=path.read_bytes()
+            )
+            for encoding, suffix in ENCODINGS:
+                compressed_path = path.with_name(path.name + suffix)
+                if compressed_path.exists():
+                    static_file.variants[encoding] = StaticFileVariant(
+                        etag=quote_etag(f"{hashed_name}-{encoding}").encode("utf-8"), body=compressed_path.read_bytes()
+                    )
+            files[self.static_url + hashed_name] = static_file
+        return files
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            static_file = self.files.get(scope["path"])
+            if static_file is not None:
+                await self.serve(scope, send, static_file)
+                return
+        await self.application(scope, receive, send)
+
+    async def serve(self, scope, send, static_file: StaticFile) -> None:
+        request_headers = dict(scope["headers"])
+        encoding, variant = self.select_variant(static_file, request_headers.get(b"accept-encoding", b""))
+        headers = [
+            (b"content-type", static_file.content_type),
+            (b"cache-control", IMMUTABLE_CACHE_CONTROL),
+            (b"etag", variant.etag),
+            (b"vary", b"Accept-Encoding"),
+        ]
+
+        if self.is_not_modified(variant, request_headers.get(b"if-none-match")):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode("ascii")))
+        headers.append((b"content-length", str(len(variant.body)).encode("ascii")))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else variant.body})
+
+    @staticmethod
+    def is_not_modified(variant: StaticFileVariant, if_none_match: Optional[bytes]) -> bool:
+        if if_none_match is None:
+            return False
+        if if_none_match.strip() == b"*":
+            return True
+        # If-None-Match는 약한 비교를 사용합니다.
+        etag = variant.etag.decode("utf-8")
+        return any(
+            value.removeprefix("W/") == etag for value in parse_etags(if_none_match.decode("latin-1"))
+        )
+
+    @staticmethod
+    def select_variant(static_file: StaticFile, accept_encoding: bytes) -> Tuple[str, StaticFileVariant]:
+        accepted = set()
+        for token in accept_encoding.lower().decode("latin-1").split(","):
+            coding, _, params = token.partition(";")
+            # "br;q=0" 처럼 q=0으로 지정한 압축 방식은 제외합니다.
+            if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                continue
+            accepted.add(coding.strip())
+        for encoding, _ in ENCODINGS:
+            if encoding in accepted and encoding in static_file.variants:
+                return encoding, static_file.variants[encoding]
+        return "identity", static_file.variants["identity"]
@@ -0,0 +1,62 @@
+# mysite/template_loaders.py
+
+import logging
+from pathlib import Path
+from typing import List, Tuple
+
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.utils import get_app_template_dirs
+from django_cotton.cotton_loader import Loader as BaseCottonLoader
+
+logger = logging.getLogger(__name__)
+
+
+class CottonLoader(BaseCottonLoader):
+    """django-cotton 로더의 get_dirs를 보완합니다.
+
+    원본은 호출될 때마다 engine.dirs 리스트에 앱 템플릿 디렉토리를 추가(append)하므로,
+    템플릿을 찾을 때마다 engine.dirs가 계속 늘어나고 filesystem 로더의 탐색도 함께 느려집니다.
+    원본을 수정하지 않고, 같은 순서(DIRS, 앱 templates 디렉토리)의 목록을 처음 한 번만 만들어 재사용합니다.
+    """
+
+    _template_dirs = None
+
+    def get_dirs(self):
+        if self._template_dirs is None:
+            dirs = [str(d) for d in (self.dirs if self.dirs is not None else self.engine.dirs)]
+            dirs.extend(str(d) for d in get_app_template_dirs("templates") if str(d) not in dirs)
+            self._template_dirs = tuple(dirs)
+        return self._template_dirs
+
+    def reset(self):
+        super().reset()
+        self._template_dirs = None
+
+
+def iter_template_names(engine) -> List[str]:
+    names = []
+    for template_dir in engine.template_loaders[0].get_dirs():
+        for path in sorted(Path(template_dir).rglob("*.html")):
+            name = path.relative_to(template_dir).as_posix()
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def warm_template_cache(using: str = "django") -> Tuple[int, List[str]]:
+    """템플릿 디렉토리의 모든 템플릿을 미리 컴파일하여 cached 로더에 올립니다.
+
+    cotton 컴파일(BeautifulSoup 파싱)이 첫 요청에서 일어나지 않도록, 서버 시작 시에 호출합니다.
+    (컴파일된 템플릿 수, 실패한 템플릿 이름 목록)을 반환합니다.
+    """
+    engine = engines[using].engine
+    failed = []
+    names = iter_template_names(engine)
+    for name in names:
+        try:
+            engine.get_template(name)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as e:
+            # 다른 템플릿에서 include 되는 조각 등, 단독으로 컴파일되지 않는 템플릿은 건너뜁니다.
+            logger.warning(f"템플릿 미리 컴파일 실패 : {name} : {e}")
+            failed.append(name)
+    return len(names) - len(failed), failed
@@ -0,0 +1,74 @@
+// static/cotton/maps/naver.js
+//
+// 페이지의 모든 네이버 지도 컴포넌트가 하나의 API 스크립트 로딩을 공유합니다.
+
+let naverMapAPIPromise = null;
+
+function loadNaverMapAPI(clientId) {
+  if (typeof window.naver !== "undefined" && typeof window.naver.maps !== "undefined") {
+    return Promise.resolve();
+  }
+
+  // 여러 지도가 동시에 초기화되더라도 스크립트는 한 번만 추가합니다.
+  if (naverMapAPIPromise === null) {
+    naverMapAPIPromise = new Promise((resolve, reject) => {
+      const script = document.createElement("script");
+      script.type = "text/javascript";
+      script.src = `https://oapi.map.naver.com/openapi/v3/maps.js?ncpClientId=${encodeURIComponent(clientId)}&submodules=panorama,geocoder,drawing,visualization`;
+      script.onload = function () {
+        console.log("네이버 지도 API가 로드되었습니다.");
+        resolve();
+      };
+      script.onerror = function () {
+        naverMapAPIPromise = null;
+        reject(new Error("네이버 지도 API 로딩에 실패했습니다."));
+      };
+      document.head.appendChild(script);
+    });
+  }
+  return naverMapAPIPromise;
+}
+
+async function initNaverMap(mapContainer) {
+  const latitude = parseFloat(mapContainer.dataset.latitude);
+  const longitude = parseFloat(mapContainer.dataset.longitude);
+  const zoom = parseInt(mapContainer.dataset.zoom, 10);
+
+  await loadNaverMapAPI(mapContainer.dataset.ncpMapClientId);
+
+  let position = null;
+  if (latitude && longitude) {
+    position = new naver.maps.LatLng(latitude, longitude);
+  }
+
+  const map = new naver.maps.Map(mapContainer, {
+    center: position,
+    zoom: zoom,
+  });
+
+  if (position) {
+    new naver.maps.Marker({
+      position: position,
+      map: map,
+    });
+  }
+}
+
+// data-naver-map 요소들을 초기화합니다. (htmx로 추가된 요소 포함)
+function initNaverMaps(rootEl) {
+  const selector = "[data-naver-map]:not([data-initialized])";
+  const mapContainers = Array.from(rootEl.querySelectorAll(selector));
+  if (rootEl.matches && rootEl.matches(selector)) mapContainers.push(rootEl);
+
+  mapContainers.forEach(function (mapContainer) {
+    mapContainer.dataset.initialized = "true";
+    initNaverMap(mapContainer).catch(console.error);
+  });
+}
+
+document.addEventListener("DOMContentLoaded", function () {
+  initNaverMaps(document);
+});
+document.addEventListener("htmx:load", function (e) {
+  initNaverMaps(e.detail.elt);
+});
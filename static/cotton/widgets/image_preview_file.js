@@ -95,4 +95,24 @@ function initImagePreviewFile(componentEl, previewDisplayEl, withBase64Field) {
       await Promise.all(promises);
     }
   }
-}
\ No newline at end of file
+}
+// data-image-preview-file 요소들을 초기화합니다. (htmx로 추가된 요소 포함)
+function initImagePreviewFiles(rootEl) {
+  const selector = "[data-image-preview-file]:not([data-initialized])";
+  const componentEls = Array.from(rootEl.querySelectorAll(selector));
+  if (rootEl.matches && rootEl.matches(selector)) componentEls.push(rootEl);
+
+  componentEls.forEach(function (componentEl) {
+    componentEl.dataset.initialized = "true";
+    const previewDisplaySelector = componentEl.dataset.previewDisplaySelector;
+    const previewDisplayEl = previewDisplaySelector ? document.querySelector(previewDisplaySelector) : null;
+    initImagePreviewFile(componentEl, previewDisplayEl, "withBase64Field" in componentEl.dataset);
+  });
+}
+
+document.addEventListener("DOMContentLoaded", function () {
+  initImagePreviewFiles(document);
+});
+document.addEventListener("htmx:load", function (e) {
+  initImagePreviewFiles(e.detail.elt);
+});
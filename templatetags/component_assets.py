@@ -0,0 +1,58 @@
+from typing import Dict
+
+from django import template
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from templatetags.uncached_static import uncached_static
+
+register = template.Library()
+
+
+REGISTRY_KEY = "component_assets"
+
+
+class ComponentAssets:
+    """한 번의 렌더링에서 컴포넌트들이 선언한 JS/CSS를 중복 없이 모읍니다. (선언 순서 유지)"""
+
+    def __init__(self):
+        self.css: Dict[str, None] = {}
+        self.js: Dict[str, None] = {}
+
+    def render(self) -> str:
+        tags = [format_html('<link rel="stylesheet" href="{}" />', uncached_static(path)) for path in self.css]
+        tags += [format_html('<script src="{}" defer></script>', uncached_static(path)) for path in self.js]
+        self.css.clear()
+        self.js.clear()
+        return mark_safe("\n".join(tags))
+
+
+def get_registry(context) -> ComponentAssets:
+    # 컴포넌트 템플릿은 각자의 render_context 상태에서 렌더링되므로,
+    # 전체 렌더링에서 공유되는 최상위 상태(dicts[0])에 보관합니다.
+    root_state = context.render_context.dicts[0]
+    if REGISTRY_KEY not in root_state:
+        root_state[REGISTRY_KEY] = ComponentAssets()
+    return root_state[REGISTRY_KEY]
+
+
+@register.simple_tag(takes_context=True)
+def component_js(context, path):
+    """컴포넌트에서 사용하는 JS 파일을 선언합니다. 컴포넌트를 여러 번 사용해도 한 번만 포함됩니다."""
+    get_registry(context).js.setdefault(path)
+    return ""
+
+
+@register.simple_tag(takes_context=True)
+def component_css(context, path):
+    get_registry(context).css.setdefault(path)
+    return ""
+
+
+@register.simple_tag(takes_context=True)
+def render_component_assets(context):
+    """지금까지 선언된 컴포넌트 JS/CSS 태그를 출력합니다. 레이아웃의 </body> 직전에 위치합니다.
+
+    HTMX 부분 응답처럼 레이아웃 없이 컴포넌트를 렌더링하는 템플릿은, 템플릿 끝에 직접 추가합니다.
+    """
+    return get_registry(context).render()
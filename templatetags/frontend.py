@@ -0,0 +1,42 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from app.frontend import LAYOUTS, TAILWIND_CDN_URL, VENDOR_ASSETS, load_manifest, load_pins
+
+register = template.Library()
+
+
+def cdn_script_tag(asset_name: str, defer: bool) -> str:
+    url = VENDOR_ASSETS[asset_name]
+    integrity = load_pins().get(url)
+    attrs = format_html(' integrity="{}" crossorigin="anonymous"', integrity) if integrity else ""
+    return format_html('<script src="{}"{}{}></script>', url, attrs, mark_safe(" defer" if defer else ""))
+
+
+@register.simple_tag
+def frontend_assets(layout_name):
+    """레이아웃의 CSS/JS 번들 태그를 출력합니다.
+
+    vendor_frontend 명령으로 생성한 번들이 없으면, 기존처럼 CDN에서 불러옵니다. (SRI 해시가 기록된 경우 integrity 지정)
+    htmx는 본문의 인라인 스크립트와 hx-on 속성에서 사용하므로 바로 실행하고, alpine.js는 defer로 불러옵니다.
+    """
+    layout = LAYOUTS[layout_name]
+    bundle = load_manifest().get(layout_name, {})
+    tags = []
+
+    if "css" in bundle:
+        tags.append(format_html('<link rel="stylesheet" href="{}" />', static(bundle["css"])))
+    else:
+        tags.append(format_html('<script src="{}"></script>', TAILWIND_CDN_URL))
+
+    for key, asset_names, defer in (("js", layout.scripts, False), ("deferred_js", layout.deferred_scripts, True)):
+        if key in bundle:
+            tags.append(format_html(
+                '<script src="{}"{}></script>', static(bundle[key]), mark_safe(" defer" if defer else "")
+            ))
+        else:
+            tags.extend(cdn_script_tag(asset_name, defer) for asset_name in asset_names)
+
+    return mark_safe("\n".join(tags))
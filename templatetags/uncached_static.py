@@ -1,8 +1,9 @@
-import time
+import os
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
 from django import template
 from django.conf import settings
+from django.contrib.staticfiles import finders
 from django.templatetags.static import static as django_static
 
 register = template.Library()
@@ -12,10 +13,15 @@ register = template.Library()
 def uncached_static(path):
     static_url = django_static(path)
     if settings.DEBUG:
+        # 파일이 수정될 때만 주소가 바뀌도록, 현재 시각 대신 파일 수정 시각을 붙입니다.
+        # 운영 환경에서는 static 태그가 manifest의 내용 해시 파일명으로 변환합니다.
+        found_path = finders.find(path)
+        if found_path is None:
+            return static_url
+
         parsed_url = urlparse(static_url)
         query_params = parse_qsl(parsed_url.query)
-        timestamp = int(time.time())
-        query_params.append(("_", str(timestamp)))
+        query_params.append(("_", str(os.stat(found_path).st_mtime_ns)))
         new_query = urlencode(query_params)
         new_url = urlunparse(
             (